@@ -153,6 +153,11 @@ else
     timeout 300 $VENV_PYTHON -m pip install --upgrade -r requirements.txt --quiet 2>&1 | tee -a "$LOG_FILE"
 fi
 
+# Byte-compile the new sources now so the restarted service does not spend
+# its first seconds compiling every module it imports (slow on a Pi).
+timeout 120 $VENV_PYTHON -m compileall -q "$PROJECT_ROOT/src" >/dev/null 2>&1 \
+    || log "WARNING: compileall failed (non-fatal)"
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Step 5: Re-install service files if they changed (self-update capability)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -263,6 +263,8 @@ class DemoCarousel:
     * per-feature ``duration`` (capped at 300s) with ``clear_stop()`` before each
       feature and ``run_feature`` (which itself uses ``_run_feature_with_watchdog``);
     * a 0.5s pause between features;
+    * while a feature runs, the next one is imported in a background thread
+      (``src.main.preload_feature``) so heavy modules start without a stall;
     * config reload + ``_check_schedule()`` night-mode/brightness/feature
       filtering between cycles;
     * a background update check at the end of each cycle (non-blocking).
@@ -293,6 +295,7 @@ class DemoCarousel:
         # menu/game session. Standalone carousel defaults to always-OK.
         self._can_restart = can_restart or (lambda: True)
         self._update_thread: Optional[threading.Thread] = None
+        self._preload_thread: Optional[threading.Thread] = None
         self._refresh_enabled()
 
     def _refresh_enabled(self) -> None:
@@ -329,7 +332,8 @@ class DemoCarousel:
                 "Internet unavailable this cycle -- internet features will be skipped"
             )
 
-        for feature in self.enabled_features:
+        features = self.enabled_features
+        for index, feature in enumerate(features):
             if self._should_break():
                 return
 
@@ -339,6 +343,11 @@ class DemoCarousel:
                 logger.info("Skipping %s (no internet)", name)
                 continue
 
+            # Import the next feature while this one is on the panel.
+            next_name = self._next_runnable(features, index, internet_available)
+            if next_name and next_name != name:
+                self._preload(next_name)
+
             feat_duration = min(feature.get("duration", self.duration), 300)
             clear_stop()
             run_feature(name, self.matrix, feat_duration)
@@ -400,6 +409,38 @@ class DemoCarousel:
             # immediately. Only one update check runs at a time.
             self._trigger_update_check()
 
+    @staticmethod
+    def _next_runnable(features: list, index: int,
+                       internet_available: bool) -> Optional[str]:
+        """Name of the feature that will run after ``features[index]``.
+
+        Wraps around to the start of the sequence (the next cycle) and skips
+        internet features when offline, mirroring :meth:`run_cycle`.
+        """
+        count = len(features)
+        for step in range(1, count + 1):
+            name = features[(index + step) % count].get("name")
+            if name in INTERNET_FEATURES and not internet_available:
+                continue
+            return name
+        return None
+
+    def _preload(self, name: str) -> None:
+        """Import feature ``name`` in a background thread (one at a time).
+
+        Python's per-module import lock makes this safe to race with
+        ``run_feature``: if the feature starts before its preload finishes,
+        the import waits on that lock instead of importing twice.
+        """
+        if self._preload_thread is not None and self._preload_thread.is_alive():
+            return
+        from src.main import preload_feature
+
+        self._preload_thread = threading.Thread(
+            target=preload_feature, args=(name,), daemon=True,
+            name="feature-preload")
+        self._preload_thread.start()
+
     def _trigger_update_check(self) -> None:
         """Kick off a background update check if one isn't already running.
 
@@ -89,6 +89,19 @@ def validate_config(config_path=None):
         if config["log_level"] not in valid_levels:
             errors.append(ConfigValidationError("log_level", f"Must be one of: {', '.join(sorted(valid_levels))}"))
 
+    # Validate simulator (dev/CI only; ignored on real hardware)
+    if "simulator" in config:
+        sim = config["simulator"]
+        if not isinstance(sim, dict):
+            errors.append(ConfigValidationError("simulator", "Must be an object"))
+        else:
+            if sim.get("backend", "window") not in ("window", "headless"):
+                errors.append(ConfigValidationError("simulator.backend", "Must be 'window' or 'headless'"))
+            if "frame_log" in sim and not isinstance(sim["frame_log"], str):
+                errors.append(ConfigValidationError("simulator.frame_log", "Must be a file path string"))
+            if sim.get("clock", "real") not in ("real", "virtual"):
+                errors.append(ConfigValidationError("simulator.clock", "Must be 'real' or 'virtual'"))
+
     # Validate sequence
     if "sequence" not in config:
         errors.append(ConfigValidationError("sequence", "Missing required field 'sequence'"))
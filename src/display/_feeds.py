@@ -0,0 +1,271 @@
+"""Process-wide background data feeds for the network info displays.
+
+Network features (weather, stock_ticker, sp500_heatmap, flight_radar,
+rain_radar) used to cold-start their data every time they came round in
+the carousel: a blocking fetch inside the render loop, a fetch thread
+spun up per run, or a feed object built per run and thrown away with its
+cache. Instead each one registers a :class:`Feed` here once, and a single
+long-lived :class:`FeedScheduler` owned by the main process refreshes
+every feed on its own cadence on a small worker pool. A feature's
+``run()`` only ever reads the feed's last-known snapshot, so it has real
+data on its first frame.
+
+All HTTP goes through :func:`http_get`, which shares one pooled
+``requests.Session`` (keep-alive connections, one TLS handshake per host)
+across every feed.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+WORKERS = 4             # feeds fetched concurrently
+TICK_SECONDS = 1.0      # how often the scheduler looks for due feeds
+POOL_SIZE = 16          # keep-alive connections kept per host
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def http_session():
+    """The shared, connection-pooling ``requests.Session``."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def http_get(url, **kwargs):
+    """``requests.get`` over the shared session."""
+    return http_session().get(url, **kwargs)
+
+
+class Feed:
+    """One periodically refreshed data source and its last-known value.
+
+    ``fetch()`` returns the new data, or None on failure (exceptions count
+    as failures too). A failed feed keeps its last good data, reports
+    ``online`` False and is retried after ``retry`` seconds instead of the
+    full ``interval``. Subclasses may define a ``fetch`` method instead of
+    passing one in; a feed with neither is a TypeError.
+
+    A feed is normally driven by the :class:`FeedScheduler`; :meth:`start`
+    runs it on a thread of its own instead (standalone use and tests).
+    """
+
+    def __init__(self, name, fetch=None, interval=300.0, retry=None):
+        self.name = name
+        self.key = name         # feeds with equal keys are interchangeable
+        if fetch is not None:
+            self.fetch = fetch
+        elif not callable(getattr(self, "fetch", None)):
+            raise TypeError("feed %r has no fetch function" % name)
+        self.interval = interval
+        self.retry = retry if retry is not None else interval
+        self._lock = threading.Lock()
+        self.data = None
+        self.online = None      # None = still acquiring, then True/False
+        self.last_update = 0.0  # time of the last good data
+        self.last_attempt = 0.0
+        self.forced = False     # poll at the next tick regardless of cadence
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -- data --------------------------------------------------------------
+    def snapshot(self):
+        """``(data, last_update, online)`` -- never blocks on the network."""
+        with self._lock:
+            return self.data, self.last_update, self.online
+
+    def seed(self, data, updated):
+        """Preload data from a cache; ``updated`` is when it was fetched."""
+        with self._lock:
+            if self.last_update < updated:
+                self.data = data
+                self.last_update = updated
+
+    def publish(self, data):
+        """Show partial results while a fetch is still running.
+
+        The poll's final result replaces them, and only that counts as an
+        update for the cadence and ``online``.
+        """
+        with self._lock:
+            self.data = data
+
+    def poll(self):
+        """Fetch once and record the result. Returns True on success."""
+        self.forced = False
+        try:
+            data = self.fetch()
+        except Exception:
+            # Broad on purpose: a feed must survive anything the network or
+            # a hostile payload can throw at it.
+            logger.warning("feed %s: fetch crashed", self.name, exc_info=True)
+            data = None
+        now = time.time()
+        with self._lock:
+            self.last_attempt = now
+            if data is None:
+                self.online = False
+            else:
+                self.data = data
+                self.online = True
+                self.last_update = now
+        return data is not None
+
+    def wait_seconds(self):
+        """Seconds between polls in the feed's current state."""
+        return self.retry if self.online is False else self.interval
+
+    def due(self, now):
+        """Whether the feed should be polled at ``now``."""
+        if self.forced:
+            return True
+        return now - max(self.last_attempt, self.last_update) >= self.wait_seconds()
+
+    # -- standalone thread ---------------------------------------------------
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.poll()
+            # Interruptible wait so stopping never hangs for a poll interval.
+            self._stop.wait(self.wait_seconds())
+
+
+class FeedScheduler:
+    """Refreshes registered feeds on their own cadence on a worker pool.
+
+    One scheduler thread wakes every :data:`TICK_SECONDS` and hands each due
+    feed to the pool; a feed is never fetched twice at once, so a slow feed
+    only delays itself.
+    """
+
+    def __init__(self, workers=WORKERS, tick=TICK_SECONDS):
+        self.workers = workers
+        self.tick = tick
+        self._feeds = {}
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pool = None
+
+    def register(self, feed):
+        """Add ``feed``, or return the registered one if it has the same key.
+
+        A feed registered under an existing name with a different key (a
+        new location, say) replaces the old one.
+        """
+        with self._lock:
+            current = self._feeds.get(feed.name)
+            if current is not None and current.key == feed.key:
+                return current
+            self._feeds[feed.name] = feed
+        self._wake.set()
+        return feed
+
+    def get(self, name):
+        with self._lock:
+            return self._feeds.get(name)
+
+    def refresh(self, name):
+        """Poll ``name`` at the next tick regardless of its cadence."""
+        feed = self.get(name)
+        if feed is not None:
+            feed.forced = True
+            self._wake.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the scheduler thread (no-op while it is running)."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="feed")
+            self._thread = threading.Thread(target=self._loop, name="feeds",
+                                            daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            now = time.time()
+            with self._lock:
+                due = [f for f in self._feeds.values()
+                       if f.name not in self._in_flight and f.due(now)]
+                self._in_flight.update(f.name for f in due)
+            for feed in due:
+                try:
+                    self._pool.submit(self._poll, feed)
+                except RuntimeError:    # pool shut down under us
+                    return
+            self._wake.wait(self.tick)
+            self._wake.clear()
+
+    def _poll(self, feed):
+        try:
+            feed.poll()
+        finally:
+            with self._lock:
+                self._in_flight.discard(feed.name)
+
+
+_scheduler = FeedScheduler()
+
+
+def register(feed):
+    """Register a :class:`Feed` with the process-wide scheduler."""
+    return _scheduler.register(feed)
+
+
+def register_feed(name, fetch, interval, retry=None):
+    """Register ``fetch`` as feed ``name``; returns the (shared) :class:`Feed`."""
+    return _scheduler.register(Feed(name, fetch, interval, retry))
+
+
+def get_feed(name):
+    return _scheduler.get(name)
+
+
+def refresh_feed(name):
+    _scheduler.refresh(name)
+
+
+def start_feeds():
+    """Start the process-wide scheduler if it is not running yet."""
+    _scheduler.start()
+
+
+def stop_feeds():
+    _scheduler.stop()
@@ -0,0 +1,159 @@
+"""Batched grid raycasting shared by the first-person features (maze_3d, dungeon).
+
+:func:`cast_rays` runs the DDA walk for every screen column at once. Rather
+than stepping each ray cell by cell in Python, it lays out each ray's
+x- and y-boundary crossings as rows of an array, merges them in crossing
+order with one sort, and finds the first solid cell on every row with one
+lookup. The result is a :class:`RayHits` of per-column arrays: distance,
+hit cell, side and the texture coordinate along the wall face.
+
+:func:`draw_wall_columns` then writes the textured (or flat) wall slices
+for all columns into an ``(H, W, 3)`` frame array in a single gather, so a
+feature builds its frame with array operations and converts to a PIL image
+once.
+"""
+
+import numpy as np
+
+# Stand-in for "never" when a ray has no component along an axis.
+_FAR = 1e30
+
+
+class RayHits:
+    """Per-ray results of :func:`cast_rays` (all arrays, one entry per ray).
+
+    ``dist``    distance along the ray to the hit face (``max_depth`` on a miss)
+    ``cell_x``  hit cell column / ``cell_y`` row (may be outside the grid:
+                leaving the grid counts as a hit on its edge)
+    ``side``    0 when the ray crossed an x boundary (a vertical face),
+                1 for a y boundary
+    ``wall_x``  fractional position along the face, in [0, 1)
+    ``hit``     False where the ray ran out of steps or depth
+    """
+
+    __slots__ = ("dist", "cell_x", "cell_y", "side", "wall_x", "hit")
+
+    def __init__(self, dist, cell_x, cell_y, side, wall_x, hit):
+        self.dist = dist
+        self.cell_x = cell_x
+        self.cell_y = cell_y
+        self.side = side
+        self.wall_x = wall_x
+        self.hit = hit
+
+    def inside(self, grid_w, grid_h):
+        """Mask of hits whose cell lies inside a ``grid_w`` x ``grid_h`` grid."""
+        return ((self.cell_x >= 0) & (self.cell_x < grid_w)
+                & (self.cell_y >= 0) & (self.cell_y < grid_h))
+
+
+def _first(mask):
+    """Index of the first True in each row of ``mask`` and whether there is one."""
+    return mask.argmax(axis=1), mask.any(axis=1)
+
+
+def cast_rays(solid, px, py, angles, max_steps, max_depth=None, see_through=None):
+    """Cast one ray per angle from ``(px, py)`` through a boolean grid.
+
+    ``solid`` is an ``(rows, cols)`` array (``solid[y, x]``); cells outside
+    it are solid. A ray takes at most ``max_steps`` cell steps, and with
+    ``max_depth`` set it misses once the next crossing is farther than that.
+
+    ``see_through`` (same shape as ``solid``) marks solid cells a ray may
+    look past once, e.g. a door that is partly open. Returns ``(hits, front)``
+    where ``hits`` is the first solid cell, or the one past a see-through
+    cell, and ``front`` holds the see-through cell itself (``front.hit``
+    False for rays that met none). Without ``see_through`` ``front`` is None.
+    """
+    solid = np.asarray(solid, dtype=bool)
+    rows, cols = solid.shape
+    angles = np.asarray(angles, dtype=np.float64)
+    rdx = np.cos(angles)
+    rdy = np.sin(angles)
+    mx0, my0 = int(px), int(py)
+    with np.errstate(divide="ignore"):
+        ddx = np.minimum(_FAR, np.abs(1.0 / rdx))
+        ddy = np.minimum(_FAR, np.abs(1.0 / rdy))
+    west, north = rdx < 0, rdy < 0
+    step_x = 1 - 2 * west
+    step_y = 1 - 2 * north
+    sdx = np.where(west, px - mx0, mx0 + 1.0 - px) * ddx
+    sdy = np.where(north, py - my0, my0 + 1.0 - py) * ddy
+
+    # Every boundary crossing of every ray, y crossings first so that a tie
+    # steps in y -- the scalar loop's ``if sdx < sdy`` rule. No ray needs
+    # more crossings per axis than it takes to leave the grid.
+    kx = min(max_steps, cols + 1 + abs(mx0))
+    ky = min(max_steps, rows + 1 + abs(my0))
+    steps = min(max_steps, kx + ky)
+    t = np.concatenate([sdy[:, None] + ddy[:, None] * np.arange(ky),
+                        sdx[:, None] + ddx[:, None] * np.arange(kx)], axis=1)
+    order = np.argsort(t, axis=1, kind="stable")[:, :steps]
+    is_x = order >= ky
+    nx = np.cumsum(is_x, axis=1)
+    cx = mx0 + step_x[:, None] * nx
+    cy = my0 + step_y[:, None] * (np.arange(1, steps + 1) - nx)
+    # Look cells up in the grid padded by one solid cell: every cell past
+    # the edge clamps onto the border.
+    padded = np.ones((rows + 2, cols + 2), dtype=bool)
+    padded[1:-1, 1:-1] = solid
+    blocked = padded[np.clip(cy, -1, rows) + 1, np.clip(cx, -1, cols) + 1]
+    lane = np.arange(angles.size)
+
+    def hits_at(idx, found):
+        pick = order[lane, idx]
+        dist = t[lane, pick]
+        hit = found.copy()
+        if max_depth is not None:
+            hit &= dist <= max_depth
+        side = np.where(hit, pick < ky, False).astype(np.int8)
+        dist = np.where(hit, dist, max_depth if max_depth is not None else _FAR)
+        along = np.where(side == 0, py + dist * rdy, px + dist * rdx)
+        return RayHits(dist, cx[lane, idx], cy[lane, idx], side,
+                       along - np.floor(along), hit)
+
+    idx, found = _first(blocked)
+    if see_through is None:
+        return hits_at(idx, found), None
+    fx, fy = cx[lane, idx], cy[lane, idx]
+    inside = (fx >= 0) & (fx < cols) & (fy >= 0) & (fy < rows)
+    see_through = np.asarray(see_through, dtype=bool)
+    glass = see_through[np.clip(fy, 0, rows - 1), np.clip(fx, 0, cols - 1)]
+    front_found = found & inside & glass
+    front = hits_at(idx, front_found)
+    beyond = blocked & (np.arange(steps)[None, :] > idx[:, None])
+    idx2, found2 = _first(beyond)
+    idx = np.where(front_found, idx2, idx)
+    found = np.where(front_found, found2, found)
+    return hits_at(idx, found), front
+
+
+def texture_rows(offset, height, tex_size):
+    """Nearest-neighbour texture row for ``offset`` pixels into a slice ``height`` tall."""
+    return ((2 * offset + 1) * tex_size) // (2 * height)
+
+
+def draw_wall_columns(frame, cols, top, count, height, atlas, tex_index, tex_x, skip=None):
+    """Draw wall slices for many columns into ``frame`` in one pass.
+
+    Slice ``i`` covers screen rows ``top[i] .. top[i] + count[i] - 1`` of
+    column ``cols[i]``. It samples texture ``atlas[tex_index[i]]`` (atlas
+    shape ``(N, T, T, 3)``) at column ``tex_x[i]``, scaled so the whole
+    texture spans ``height[i]`` rows; ``skip[i]`` rows of that projected
+    height are cut off the top first (a door lifting into the lintel).
+    Rows outside the frame are clipped.
+    """
+    cols = np.asarray(cols)
+    if cols.size == 0:
+        return
+    frame_h = frame.shape[0]
+    tex_size = atlas.shape[1]
+    r = np.arange(frame_h)[:, None] - np.asarray(top)[None, :]
+    ys, ks = np.nonzero((r >= 0) & (r < np.asarray(count)[None, :]))
+    if ys.size == 0:
+        return
+    offset = r[ys, ks]
+    if skip is not None:
+        offset = offset + np.asarray(skip)[ks]
+    ty = np.clip(texture_rows(offset, np.asarray(height)[ks], tex_size), 0, tex_size - 1)
+    frame[ys, cols[ks]] = atlas[np.asarray(tex_index)[ks], ty, np.asarray(tex_x)[ks]]
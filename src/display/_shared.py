@@ -132,3 +132,125 @@ def show_banner(matrix, lines, color=(180, 220, 255), size=64,
     except Exception:  # noqa: BLE001
         pass
     return interruptible_sleep(hold)
+
+
+# ---------------------------------------------------------------------------
+# Array frame buffer (whole-frame numpy rendering)
+# ---------------------------------------------------------------------------
+# Writing 4096 tuples through ``Image.load()`` every frame is where most
+# effects spend their CPU on a Pi 3. A FrameBuffer is one persistent array
+# that a module renders into with whole-array operations and pushes to the
+# panel without building a new Image per frame. numpy/PIL are imported lazily
+# so importing ``_shared`` stays as cheap as it was.
+
+
+class FrameBuffer:
+    """Persistent ``height x width x 3`` uint8 frame with a zero-copy Image.
+
+    The pixels live in an ``RGBX`` store (4 bytes per pixel, the same layout
+    Pillow uses internally for RGB), so :attr:`image` is a PIL view mapped
+    straight onto the array: writes to :attr:`pixels` are visible to
+    ``matrix.SetImage`` with no per-frame conversion or allocation. The
+    hardware binding's ``SetPixelsPillow`` reads that memory directly; the
+    safe path and the simulator convert it to RGB themselves.
+
+    Typical use::
+
+        fb = FrameBuffer()
+        while ...:
+            fb.pixels[:] = PALETTE_ARRAY[heat]
+            fb.show(matrix)
+    """
+
+    def __init__(self, width=64, height=64):
+        import numpy as np
+        from PIL import Image
+
+        self.width = width
+        self.height = height
+        self._store = np.zeros((height, width, 4), dtype=np.uint8)
+        self._store[..., 3] = 255
+        # ``pixels`` is a strided view of the RGB channels; numpy assignments
+        # and in-place ufuncs on it write through to the mapped image.
+        self.pixels = self._store[..., :3]
+        self.image = Image.frombuffer("RGBX", (width, height), self._store,
+                                      "raw", "RGBX", 0, 1)
+
+    def clear(self, color=(0, 0, 0)):
+        """Fill the whole frame with ``color`` (an RGB tuple)."""
+        self.pixels[...] = color
+
+    def show(self, matrix):
+        """Push the current frame to ``matrix`` via ``SetImage``."""
+        matrix.SetImage(self.image)
+
+    def swap(self, matrix, canvas):
+        """Draw the frame onto ``canvas`` and flip it with ``SwapOnVSync``.
+
+        :returns: the canvas handed back by the matrix for the next frame.
+        """
+        canvas.SetImage(self.image)
+        return matrix.SwapOnVSync(canvas)
+
+
+# ---------------------------------------------------------------------------
+# Lazy module tables
+# ---------------------------------------------------------------------------
+# Palettes, sine tables and distance fields used to be built at module import,
+# so every feature's precomputation ran during start-up (the carousel imports
+# feature modules long before they are shown). A ``@lazy_table`` builder runs
+# on its first call instead, and ``preload_feature`` warms a module's tables in
+# the background just before its turn.
+
+
+class LazyTable:
+    """Zero-argument builder whose result is computed once, on first call."""
+
+    _UNSET = object()
+
+    def __init__(self, build):
+        self._build = build
+        self._value = self._UNSET
+        self._lock = threading.Lock()
+        self.__name__ = getattr(build, "__name__", "table")
+        self.__doc__ = getattr(build, "__doc__", None)
+
+    def __call__(self):
+        value = self._value
+        if value is self._UNSET:
+            with self._lock:
+                if self._value is self._UNSET:
+                    self._value = self._build()
+                value = self._value
+        return value
+
+    @property
+    def built(self):
+        return self._value is not self._UNSET
+
+
+def lazy_table(build):
+    """Decorator: turn a table-building function into a :class:`LazyTable`.
+
+    ::
+
+        @lazy_table
+        def _palette():
+            return np.array([...], dtype=np.uint8)
+
+        frame.pixels[...] = _palette()[heat]
+    """
+    return LazyTable(build)
+
+
+def warm_lazy_tables(module):
+    """Build every :class:`LazyTable` defined at ``module`` level.
+
+    :returns: the number of tables that were built by this call.
+    """
+    built = 0
+    for value in list(vars(module).values()):
+        if isinstance(value, LazyTable) and not value.built:
+            value()
+            built += 1
+    return built
@@ -1,17 +1,20 @@
 """Raycast renderer: textured walls, fog, sprites, HUD.
 
-Per-frame cost model: 64 DDA casts in pure Python (cheap: grid is
-24x24), then one cached 1px strip paste per column, one paste per
-visible sprite slice, and a handful of HUD draws. Texture scaling is
-cached by (texture, column, height, band), so after a second or two of
-play almost every strip is a dict hit.
+Per-frame cost model: all 64 columns are cast as one batch through the
+shared :mod:`src.display._raycast` DDA (grid is 24x24), then every wall
+column -- and every lifting door flap -- is gathered from a pre-shaded
+texture atlas into the frame array in one pass each. One conversion to a
+PIL image follows, then one paste per visible sprite slice and a handful
+of HUD draws.
 """
 
 import math
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 from src.display._fonts import _draw_text, _text_width
+from src.display._raycast import cast_rays, draw_wall_columns
 from .constants import (
     WIDTH, HEIGHT, FOV, MAX_DEPTH, WALL_SCALE, TEX_SIZE, SHADE_BANDS,
     SIDE_DIM, FOG_BASE, FOG_STEP, FOG_MIN, FLICKER_DEPTH, FLICKER_HZ,
@@ -20,6 +23,12 @@ from .constants import (
 )
 
 HORIZON = HEIGHT // 2
+CAST_STEPS = 64
+
+_COLUMNS = np.arange(WIDTH)
+# Per-column angle offset from the view centre, and its fisheye correction.
+_COL_OFFSET = np.arctan((2.0 * _COLUMNS / WIDTH - 1.0) * math.tan(FOV / 2.0))
+_COL_FIX = np.cos(_COL_OFFSET)
 
 
 def _mix(c0, c1, t):
@@ -104,6 +113,13 @@ def _tex_door(locked):
 
 
 TEX_BRICK, TEX_MOSS, TEX_CRACK, TEX_TORCH, TEX_DOOR, TEX_LOCK = range(6)
+TEX_COUNT = 6
+
+
+def _wall_variety(mx, my):
+    """Deterministic variety without storing a texture map (cell arrays in)."""
+    h = (mx * 928371 + my * 689287) & 0xFF
+    return np.where(h < 40, TEX_MOSS, np.where(h < 72, TEX_CRACK, TEX_BRICK))
 
 
 # ---------------------------------------------------------------------------
@@ -213,7 +229,13 @@ class Renderer:
                         k *= SIDE_DIM
                     self.shaded[(tid, side, band)] = img.point(
                         lambda v, k=k: int(v * k))
-        self._strip_cache = {}
+        # The same images as one (tex, side, band) atlas for column gathers.
+        self._atlas = np.stack([
+            np.asarray(self.shaded[(tid, side, band)])
+            for tid in range(TEX_COUNT) for side in (0, 1)
+            for band in range(SHADE_BANDS)])
+        self._floor = None
+        self._floor_cache = None
         self._sprite_cache = {}
         self._bg_cache = {}
         self.zbuf = [MAX_DEPTH] * WIDTH
@@ -240,10 +262,11 @@ class Renderer:
             t = (y - HORIZON) / (HEIGHT - HORIZON)
             d.line([(0, y), (WIDTH - 1, y)],
                    fill=_scale(_mix(FLOOR_FAR, FLOOR_NEAR, t), k * deep))
+        bg = np.asarray(img)
         if len(self._bg_cache) > 24:
             self._bg_cache.clear()
-        self._bg_cache[key] = img
-        return img
+        self._bg_cache[key] = bg
+        return bg
 
     def _build_vignette(self):
         img = Image.new("L", (WIDTH, HEIGHT), 0)
@@ -254,101 +277,75 @@ class Renderer:
         return img
 
     # -- walls ---------------------------------------------------------------
-    def _tex_for(self, fm, mx, my, tile):
-        if tile == T_DOOR:
-            return TEX_DOOR
-        if tile == T_LOCKED:
-            return TEX_LOCK
-        if (mx, my) in fm.torches:
-            return TEX_TORCH
-        # Deterministic variety without storing a texture map.
-        h = (mx * 928371 + my * 689287) & 0xFF
-        if h < 40:
-            return TEX_MOSS
-        if h < 72:
-            return TEX_CRACK
-        return TEX_BRICK
-
-    def _cast(self, fm, px, py, ang):
-        """One DDA ray.
-
-        Returns (dist, tex_id, tex_x, side, door_open, behind) where
-        ``behind`` is the continuation hit past a partially open door --
-        so a lifting door shows the room beyond through the growing gap
-        instead of a void.
+    def _floor_arrays(self, fm):
+        """``(tiles, wall_tex)`` arrays for ``fm``, cached per floor.
+
+        ``wall_tex`` is the texture each cell shows as a wall: the torch
+        texture on torch cells, hashed variety elsewhere.
         """
-        rdx = math.cos(ang)
-        rdy = math.sin(ang)
-        mx, my = int(px), int(py)
-        ddx = abs(1.0 / rdx) if rdx else 1e30
-        ddy = abs(1.0 / rdy) if rdy else 1e30
-        if rdx < 0:
-            stepx, sdx = -1, (px - mx) * ddx
-        else:
-            stepx, sdx = 1, (mx + 1.0 - px) * ddx
-        if rdy < 0:
-            stepy, sdy = -1, (py - my) * ddy
-        else:
-            stepy, sdy = 1, (my + 1.0 - py) * ddy
-
-        door_hit = None
-        for _ in range(64):
-            if sdx < sdy:
-                sdx += ddx
-                mx += stepx
-                side = 0
-            else:
-                sdy += ddy
-                my += stepy
-                side = 1
-            tile = fm.tile(mx, my)
-            if tile == T_WALL or (
-                    tile in (T_DOOR, T_LOCKED) and fm.blocks_ray(mx, my)):
-                if side == 0:
-                    dist = sdx - ddx
-                    wall_x = py + dist * rdy
-                else:
-                    dist = sdy - ddy
-                    wall_x = px + dist * rdx
-                wall_x -= math.floor(wall_x)
-                door = fm.doors.get((mx, my))
-                open_t = door.open_t if door is not None else 0.0
-                hit = (max(0.05, dist), self._tex_for(fm, mx, my, tile),
-                       min(TEX_SIZE - 1, int(wall_x * TEX_SIZE)), side,
-                       open_t)
-                if open_t > 0.0 and door_hit is None:
-                    door_hit = hit          # see through the gap: keep going
-                    continue
-                if door_hit is not None:
-                    return door_hit + (hit,)
-                return hit + (None,)
-        far = (MAX_DEPTH, TEX_BRICK, 0, 0, 0.0)
-        if door_hit is not None:
-            return door_hit + (far,)
-        return far + (None,)
-
-    def _strip(self, tex_id, tex_x, height, side, band):
-        key = (tex_id, tex_x, height, side, band)
-        strip = self._strip_cache.get(key)
-        if strip is None:
-            col = self.shaded[(tex_id, side, band)].crop(
-                (tex_x, 0, tex_x + 1, TEX_SIZE))
-            strip = col.resize((1, height), Image.NEAREST)
-            if len(self._strip_cache) > 60000:
-                self._strip_cache.clear()
-            self._strip_cache[key] = strip
-        return strip
-
-    def _wall_strip(self, frame, col, dist, tex_id, tex_x, side, fog):
-        """Draw one full wall column (no door slide)."""
-        h = min(HEIGHT * 3, max(1, int(WALL_SCALE * HEIGHT / dist)))
-        band = min(SHADE_BANDS - 1, int(dist / fog * SHADE_BANDS))
-        if tex_id == TEX_TORCH:
-            band = min(band, SHADE_BANDS // 2)       # sconces glow in fog
-        if band >= SHADE_BANDS - 1:
-            return                                   # fully fogged
-        strip = self._strip(tex_id, tex_x, h, side, band)
-        frame.paste(strip, (col, HORIZON - h // 2))
+        if self._floor is not fm:
+            tiles = np.array(fm.grid)
+            ys, xs = np.indices(tiles.shape)
+            tex = _wall_variety(xs, ys)
+            for x, y in fm.torches:
+                tex[y, x] = TEX_TORCH
+            self._floor, self._floor_cache = fm, (tiles, tex)
+        return self._floor_cache
+
+    def _cast_columns(self, fm, px, py, angles):
+        """DDA rays for every angle at once.
+
+        Returns ``(near, behind, through)``: ``near`` and ``behind`` are
+        ``(dist, tex_id, tex_x, side, open_t)`` arrays and ``through`` marks
+        rays whose near hit is a partially open door. For those, ``behind``
+        is the continuation hit past it -- so a lifting door shows the room
+        beyond through the growing gap instead of a void.
+        """
+        tiles, wall_tex = self._floor_arrays(fm)
+        rows, cols = tiles.shape
+        open_t = np.zeros(tiles.shape)
+        for (x, y), door in fm.doors.items():
+            open_t[y, x] = door.open_t
+        is_door = (tiles == T_DOOR) | (tiles == T_LOCKED)
+        # fm.blocks_ray: open doors vanish, everything else draws.
+        solid = (tiles == T_WALL) | (is_door & (open_t < 1.0))
+        gap = is_door & (open_t > 0.0) & (open_t < 1.0)
+        hits, front = cast_rays(solid, px, py, angles, CAST_STEPS, see_through=gap)
+
+        # Both hit layers in one pass: front hits first, then the rest.
+        n = len(hits.dist)
+        hit, mx, my, dist, wall_x, side = (
+            np.concatenate([getattr(front, f), getattr(hits, f)])
+            for f in ("hit", "cell_x", "cell_y", "dist", "wall_x", "side"))
+        inside = (mx >= 0) & (mx < cols) & (my >= 0) & (my < rows)
+        cell = (np.clip(my, 0, rows - 1), np.clip(mx, 0, cols - 1))
+        tile = np.where(inside, tiles[cell], T_WALL)
+        tex = np.where(inside, wall_tex[cell], _wall_variety(mx, my))
+        tex = np.where(tile == T_DOOR, TEX_DOOR, np.where(tile == T_LOCKED, TEX_LOCK, tex))
+        # A ray that finds nothing draws far brick.
+        layers = (np.where(hit, np.maximum(0.05, dist), MAX_DEPTH),
+                  np.where(hit, tex, TEX_BRICK),
+                  np.where(hit, np.minimum(TEX_SIZE - 1, (wall_x * TEX_SIZE).astype(int)), 0),
+                  np.where(hit, side, 0),
+                  np.where(hit & inside, open_t[cell], 0.0))
+        through = front.hit
+        behind = tuple(a[n:] for a in layers)
+        near = tuple(np.where(through, a[:n], b) for a, b in zip(layers, behind))
+        return near, behind, through
+
+    def _draw_walls(self, frame, cols, dist, tex_id, tex_x, side, fog,
+                    open_t=None):
+        """Draw full wall columns, or with ``open_t`` the visible part of
+        each lifting door: its BOTTOM edge stays at the top of the doorway."""
+        h = np.minimum(HEIGHT * 3, np.maximum(1, (WALL_SCALE * HEIGHT / dist).astype(int)))
+        band = np.minimum(SHADE_BANDS - 1, (dist / fog * SHADE_BANDS).astype(int))
+        band = np.where(tex_id == TEX_TORCH, np.minimum(band, SHADE_BANDS // 2), band)  # sconces glow in fog
+        count = h if open_t is None else (h * (1.0 - open_t)).astype(int)
+        keep = (band < SHADE_BANDS - 1) & (count > 0)             # fully fogged
+        tex = ((tex_id * 2 + side) * SHADE_BANDS + band)[keep]
+        draw_wall_columns(frame, cols[keep], (HORIZON - h // 2)[keep], count[keep],
+                          h[keep], self._atlas, tex, tex_x[keep],
+                          skip=None if open_t is None else (h - count)[keep])
 
     # -- sprites --------------------------------------------------------------
     def _sprite_scaled(self, name, size, band, flash):
@@ -507,40 +504,23 @@ class Renderer:
 
         frame = self._background(game.depth, light_q).copy()
 
-        cos_fix = [0.0] * WIDTH
-        for col in range(WIDTH):
-            off = math.atan((2.0 * col / WIDTH - 1.0) * math.tan(FOV / 2.0))
-            ang = hero.heading + off
-            dist, tex_id, tex_x, side, open_t, behind = self._cast(
-                fm, hero.x, hero.y, ang)
-            # Correct fisheye with the angle offset from centre.
-            fix = math.cos(off)
-            dist = max(0.05, dist * fix)
-            self.zbuf[col] = dist
-
-            # Scene beyond a lifting door first, then the door flap on top.
-            if behind is not None:
-                bdist = max(0.05, behind[0] * fix)
-                self._wall_strip(frame, col, bdist, behind[1], behind[2],
-                                 behind[3], fog)
-                if open_t >= 1.0:
-                    self.zbuf[col] = bdist
-                    continue
-                h = min(HEIGHT * 3, max(1, int(WALL_SCALE * HEIGHT / dist)))
-                band = min(SHADE_BANDS - 1, int(dist / fog * SHADE_BANDS))
-                vis = int(h * (1.0 - open_t))
-                if vis > 0 and band < SHADE_BANDS - 1:
-                    # The door lifts: its BOTTOM edge stays visible at the
-                    # top of the doorway.
-                    strip = self._strip(tex_id, tex_x, h, side, band).crop(
-                        (0, h - vis, 1, h))
-                    frame.paste(strip, (col, HORIZON - h // 2))
-                if open_t > 0.5:
-                    self.zbuf[col] = bdist   # sprites show through the gap
-                continue
-
-            self._wall_strip(frame, col, dist, tex_id, tex_x, side, fog)
-
+        near, behind, through = self._cast_columns(
+            fm, hero.x, hero.y, hero.heading + _COL_OFFSET)
+        # Correct fisheye with the angle offset from centre.
+        dist = np.maximum(0.05, near[0] * _COL_FIX)
+        bdist = np.maximum(0.05, behind[0] * _COL_FIX)
+
+        # Scene beyond a lifting door first, then the door flap on top.
+        back = [np.where(through, b, n) for n, b in zip(near[1:4], behind[1:4])]
+        self._draw_walls(frame, _COLUMNS, np.where(through, bdist, dist),
+                         *back, fog)
+        self._draw_walls(frame, _COLUMNS[through], dist[through],
+                         *(a[through] for a in near[1:4]), fog,
+                         open_t=near[4][through])
+        # Sprites show through a door more than half open.
+        self.zbuf = np.where(through & (near[4] > 0.5), bdist, dist).tolist()
+
+        frame = Image.fromarray(frame)
         self._draw_sprites(frame, game, fog)
         self._draw_hud(frame, game)
         self._overlays(frame, game)
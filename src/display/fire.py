@@ -2,10 +2,9 @@
 """Fire effect simulation for 64x64 LED matrix."""
 
 import time
-import random
 import logging
-from PIL import Image
-from src.display._shared import should_stop
+import numpy as np
+from src.display._shared import should_stop, FrameBuffer, lazy_table
 
 logger = logging.getLogger(__name__)
 
@@ -35,15 +34,56 @@ def _build_palette():
         palette.append((min(r, 255), min(g, 255), min(b, 255)))
     return palette
 
-PALETTE = _build_palette()
+
+@lazy_table
+def _palette_array():
+    """The palette as a (256, 3) array, so a whole heat field maps to colours
+    with one fancy-index lookup."""
+    return np.array(_build_palette(), dtype=np.uint8)
+
+# Row ``y`` of the field averages the row below it (y + 1, three taps with
+# horizontal wrap) and the row two below (y + 2), clamped to the seed row.
+_BELOW2_ROWS = np.minimum(np.arange(2, HEIGHT + 2), HEIGHT)
+
+
+def _new_heat():
+    """Return an empty heat field (extra row at the bottom for seeding)."""
+    return np.zeros((HEIGHT + 1, WIDTH), dtype=np.int16)
+
+
+def _step_heat(heat, rng):
+    """Advance the heat field one frame in place.
+
+    Every visible row is computed from the *previous* frame's rows below it,
+    exactly as the original top-to-bottom loop did, so the whole update is a
+    handful of array operations: bulk-seed the bottom row, 4-neighbour
+    average via ``np.roll`` for the wrapped left/right taps, subtract a
+    random cooling field and clamp.
+    """
+    # Seed bottom row with random hot values (70%) or embers (30%)
+    hot = rng.random(WIDTH) > 0.3
+    heat[HEIGHT] = np.where(hot,
+                            rng.integers(160, 256, WIDTH),
+                            rng.integers(0, 101, WIDTH))
+
+    below = heat[1:].astype(np.float32)
+    total = (np.roll(below, 1, axis=1) + below + np.roll(below, -1, axis=1)
+             + heat[_BELOW2_ROWS])
+    total *= 0.25
+    total -= rng.uniform(0.5, 3.0, (HEIGHT, WIDTH)).astype(np.float32)
+    np.clip(total, 0, 255, out=total)
+    heat[:HEIGHT] = total  # truncates like the original int()
+    return heat
 
 
 def run(matrix, duration=60):
     """Run the fire effect for the specified duration."""
     start_time = time.time()
     
-    # Heat buffer (extra row at bottom for seeding)
-    heat = [[0] * WIDTH for _ in range(HEIGHT + 1)]
+    heat = _new_heat()
+    rng = np.random.default_rng()
+    frame = FrameBuffer(WIDTH, HEIGHT)
+    palette = _palette_array()
     
     try:
         while time.time() - start_time < duration:
@@ -51,34 +91,11 @@ def run(matrix, duration=60):
                 break
             frame_start = time.time()
             
-            # Seed bottom row with random hot values
-            for x in range(WIDTH):
-                heat[HEIGHT][x] = random.randint(160, 255) if random.random() > 0.3 else random.randint(0, 100)
-            
-            # Propagate heat upward (pre-generate cooling per row to cut
-            # 4096 random.uniform calls down to 64 random.choices calls)
-            for y in range(0, HEIGHT):
-                cool_row = [random.uniform(0.5, 3.0) for _ in range(WIDTH)]
-                row_below = heat[y + 1]
-                row_below2 = heat[min(y + 2, HEIGHT)]
-                row_out = heat[y]
-                for x in range(WIDTH):
-                    left = row_below[(x - 1) % WIDTH]
-                    center = row_below[x]
-                    right = row_below[(x + 1) % WIDTH]
-                    below = row_below2[x]
-                    avg = (left + center + right + below) * 0.25
-                    row_out[x] = max(0, min(255, int(avg - cool_row[x])))
-            
-            # Render to image
-            image = Image.new("RGB", (WIDTH, HEIGHT))
-            pixels = image.load()
-            for y in range(HEIGHT):
-                for x in range(WIDTH):
-                    idx = min(255, max(0, heat[y][x]))
-                    pixels[x, y] = PALETTE[idx]
+            _step_heat(heat, rng)
             
-            matrix.SetImage(image)
+            # Render: palette lookup for every pixel at once
+            frame.pixels[...] = palette[heat[:HEIGHT]]
+            frame.show(matrix)
             
             elapsed = time.time() - frame_start
             sleep_time = FRAME_INTERVAL - elapsed
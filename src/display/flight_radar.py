@@ -20,8 +20,10 @@ point-and-radius endpoint that is exactly the shape of a radar query:
 
     https://api.adsb.lol/v2/point/<lat>/<lon>/<radius_nm>
 
-Polling happens on a background thread so the render loop never blocks on the
-network (``src/main.py`` has a frame-hang watchdog that would otherwise trip).
+Polling happens in the background feed scheduler (``src/display/_feeds.py``)
+so the render loop never blocks on the network (``src/main.py`` has a
+frame-hang watchdog that would otherwise trip), and the contacts are already
+there when the radar comes round in the carousel.
 Between polls the contacts are dead-reckoned along their last known track and
 ground speed, so blips drift smoothly instead of teleporting every poll.
 """
@@ -31,12 +33,13 @@ import json
 import math
 import time
 import logging
-import threading
 
+import numpy as np
 import requests
-from PIL import Image, ImageDraw, ImageChops
+from PIL import Image, ImageDraw
 
-from src.display._shared import should_stop
+from src.display import _feeds
+from src.display._shared import lazy_table, should_stop
 from src.display._fonts import _draw_text, _text_width
 
 logger = logging.getLogger(__name__)
@@ -45,7 +48,7 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
     os.path.abspath(__file__))))
 
 WIDTH, HEIGHT = 64, 64
-FRAME_INTERVAL = 1.0 / 30
+FRAME_INTERVAL = 1.0 / 60
 
 # Scope geometry. The centre sits between pixels so the scope is symmetric.
 CX, CY = 31.5, 31.5
@@ -58,9 +61,11 @@ SWEEP_PERIOD = 4.0          # seconds per revolution
 
 # The beam trail has to fade in well under a second or it becomes a bright
 # wedge covering a quarter of the scope.
-BEAM_DECAY = 0.80           # ~27 degrees of visible trail at 30fps
+BEAM_DECAY = 0.80           # per 1/30 s: ~27 degrees of visible trail
+DECAY_STEP = 1.0 / 30       # the time step BEAM_DECAY is quoted for
 BEAM_FILL = 0.30            # trail brightness relative to the leading edge
 BEAM_STEP_DEG = 1.0         # sub-step the trail so it has no comb gaps
+RAY_TABLE_STEPS = 720       # precomputed beam rays, every half degree
 
 # The map underlay must sit below everything: brighter than the scope
 # background, dimmer than the range rings, far dimmer than any aircraft.
@@ -83,6 +88,7 @@ RING = (0, 52, 34)
 RING_MAJOR = (0, 78, 50)
 TICK = (0, 96, 60)
 BEAM = (40, 255, 120)
+_BEAM_RGB = np.array(BEAM, dtype=np.float32)
 HUD_BG = (0, 14, 20)
 HUD_TEXT = (120, 220, 255)
 HUD_DIM = (40, 90, 110)
@@ -247,12 +253,6 @@ def _blip_size(category):
     return BLIP_SIZE.get(category, DEFAULT_BLIP_SIZE)
 
 
-def _decay_table(factor):
-    """768-entry point() table so the decay runs at C speed on all 3 bands."""
-    band = [int(v * factor) for v in range(256)]
-    return band * 3
-
-
 # --------------------------------------------------------------------------
 # aircraft feed
 # --------------------------------------------------------------------------
@@ -354,55 +354,36 @@ def _parse_contacts(payload, lat0, lon0):
     return contacts
 
 
-class AircraftFeed:
-    """Polls an ADS-B aggregator on a background thread.
+class AircraftFeed(_feeds.Feed):
+    """Polls an ADS-B aggregator for the contacts around one station.
 
     ``run()`` must never block on the network, so every network touch lives
-    here and the render loop only ever reads the latest snapshot.
+    here and the render loop only ever reads the latest snapshot. One feed
+    per location is kept warm by the process-wide feed scheduler (see
+    :func:`shared_feed`); :meth:`start` still runs it standalone.
     """
 
     def __init__(self, lat, lon, radius_miles, poll_seconds):
+        super().__init__("flight_radar", interval=poll_seconds)
+        self.key = (lat, lon, radius_miles, poll_seconds)
         self.lat = lat
         self.lon = lon
         self.radius_miles = radius_miles
         self.poll_seconds = poll_seconds
-        self._lock = threading.Lock()
-        self._contacts = []
-        self._stop = threading.Event()
-        self._thread = None
-        self.online = None      # None = still acquiring, then True/False
-        self.last_update = 0.0
-
-    # -- lifecycle ---------------------------------------------------------
-    def start(self):
-        self._thread = threading.Thread(target=self._loop, daemon=True)
-        self._thread.start()
-
-    def stop(self):
-        self._stop.set()
+        self.data = []
 
     # -- data --------------------------------------------------------------
     def snapshot(self):
         with self._lock:
-            return list(self._contacts), self.online
+            return list(self.data), self.online
 
     def advance(self, dt):
         with self._lock:
-            for c in self._contacts:
+            for c in self.data:
                 c.advance(dt)
 
-    def _loop(self):
-        while not self._stop.is_set():
-            contacts = self._poll_once()
-            with self._lock:
-                if contacts is None:
-                    self.online = False
-                else:
-                    self._contacts = contacts
-                    self.online = True
-                    self.last_update = time.time()
-            # Interruptible wait so stopping the demo does not hang for a poll.
-            self._stop.wait(self.poll_seconds)
+    def fetch(self):
+        return self._poll_once()
 
     def _poll_once(self):
         """Try each endpoint in turn. Returns None if all of them failed."""
@@ -412,7 +393,7 @@ class AircraftFeed:
                                   lon=round(self.lon, 5),
                                   radius=radius_nm)
             try:
-                resp = requests.get(
+                resp = _feeds.http_get(
                     url, timeout=8, headers={"User-Agent": USER_AGENT})
                 if resp.status_code != 200:
                     logger.warning("flight_radar: %s returned HTTP %s",
@@ -425,6 +406,17 @@ class AircraftFeed:
         return None
 
 
+def shared_feed(cfg):
+    """The scheduler-driven :class:`AircraftFeed` for ``cfg``'s station."""
+    return _feeds.register(AircraftFeed(cfg["lat"], cfg["lon"],
+                                        cfg["radius_miles"], cfg["poll_seconds"]))
+
+
+def register_feeds():
+    """Register the aircraft feed with the background feed scheduler."""
+    return shared_feed(_load_config())
+
+
 # --------------------------------------------------------------------------
 # rendering
 # --------------------------------------------------------------------------
@@ -499,18 +491,66 @@ def _scope_mask():
     return mask
 
 
+def _ray_pixels(bearing):
+    """Flat indices of the pixels a beam ray at ``bearing`` lights."""
+    layer = Image.new("L", (WIDTH, HEIGHT), 0)
+    rad = math.radians(bearing - 90)
+    ImageDraw.Draw(layer).line(
+        [(CX, CY), (CX + SCOPE_R * math.cos(rad), CY + SCOPE_R * math.sin(rad))],
+        fill=255)
+    return np.flatnonzero(np.asarray(layer))
+
+
+@lazy_table
+def _beam_rays():
+    """Per-bearing ray pixel indices (RAY_TABLE_STEPS of them), disc-clipped."""
+    inside = np.asarray(_scope_mask()).ravel() > 0
+    rays = []
+    for i in range(RAY_TABLE_STEPS):
+        idx = _ray_pixels(i * 360.0 / RAY_TABLE_STEPS)
+        rays.append(idx[inside[idx]])
+    return rays
+
+
+@lazy_table
+def _centre_mark():
+    """Pixel indices of the centre cross."""
+    layer = Image.new("L", (WIDTH, HEIGHT), 0)
+    draw = ImageDraw.Draw(layer)
+    draw.line([(CX - 2, CY), (CX + 2, CY)], fill=255)
+    draw.line([(CX, CY - 2), (CX, CY + 2)], fill=255)
+    return np.flatnonzero(np.asarray(layer))
+
+
+def _ray(bearing):
+    """Table ray nearest to ``bearing`` (degrees)."""
+    return _beam_rays()[int(round(bearing * RAY_TABLE_STEPS / 360.0)) % RAY_TABLE_STEPS]
+
+
 class Scope:
-    """Holds the static layers plus the decaying phosphor layer."""
+    """Holds the static layers plus the decaying phosphor layer.
+
+    The phosphor is one float array of beam brightness (0..1 of BEAM) that
+    decays in place; rays are written into it through the precomputed
+    per-bearing pixel table, and :meth:`compose` blends it onto the static
+    scope in a reused frame buffer.
+    """
 
     def __init__(self, radius_miles, map_data=None, lat0=None, lon0=None):
         self.radius_miles = radius_miles
         self.px_per_mile = SCOPE_R / radius_miles
         self.background = _build_scope(radius_miles, map_data, lat0, lon0)
-        self.mask = _scope_mask()
-        self.beam_layer = Image.new("RGB", (WIDTH, HEIGHT), (0, 0, 0))
-        self._beam_decay = _decay_table(BEAM_DECAY)
+        self._background = np.asarray(self.background, dtype=np.float32)
+        self._glow = np.zeros((HEIGHT, WIDTH), dtype=np.float32)
+        self._blend = np.empty((HEIGHT, WIDTH, 3), dtype=np.float32)
+        self._frame = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
         self.sweep = 0.0
 
+    @property
+    def beam_layer(self):
+        """The phosphor trail as an RGB image (for inspection)."""
+        return Image.fromarray((self._glow[..., None] * _BEAM_RGB).astype(np.uint8))
+
     # -- placement ---------------------------------------------------------
     def to_screen(self, contact):
         return (CX + contact.east * self.px_per_mile,
@@ -520,8 +560,9 @@ class Scope:
         return contact.distance <= self.radius_miles
 
     # -- per-frame ---------------------------------------------------------
-    def decay(self):
-        self.beam_layer = self.beam_layer.point(self._beam_decay)
+    def decay(self, dt=DECAY_STEP):
+        """Fade the phosphor by ``dt`` seconds' worth, whatever the frame rate."""
+        self._glow *= BEAM_DECAY ** (dt / DECAY_STEP)
 
     def advance_sweep(self, dt):
         """Move the beam, returning the (start, end) bearings it just covered."""
@@ -529,12 +570,6 @@ class Scope:
         self.sweep = (self.sweep + 360.0 * dt / SWEEP_PERIOD) % 360.0
         return previous, self.sweep
 
-    def _beam_ray(self, draw, bearing, color):
-        rad = math.radians(bearing - 90)
-        draw.line([(CX, CY),
-                   (CX + SCOPE_R * math.cos(rad), CY + SCOPE_R * math.sin(rad))],
-                  fill=color)
-
     def draw_beam(self, sweep_start=None):
         """Lay down the trail: uniform rays across the angle just traversed.
 
@@ -546,14 +581,13 @@ class Scope:
         alternating bright and dim lines. The bright leading edge is drawn at
         compose time instead, so it never accumulates.
         """
-        draw = ImageDraw.Draw(self.beam_layer)
-        fill = tuple(int(c * BEAM_FILL) for c in BEAM)
         span = 0.0
         if sweep_start is not None:
             span = (self.sweep - sweep_start) % 360.0
         steps = max(1, int(span / BEAM_STEP_DEG))
+        glow = self._glow.reshape(-1)
         for i in range(steps):
-            self._beam_ray(draw, self.sweep - i * BEAM_STEP_DEG, fill)
+            glow[_ray(self.sweep - i * BEAM_STEP_DEG)] = BEAM_FILL
 
     def paint(self, frame, contact):
         """Draw one contact live onto the composed frame.
@@ -585,21 +619,21 @@ class Scope:
             draw.ellipse([x - r, y - r, x + r, y + r], fill=color)
 
     def compose(self):
-        glow = Image.new("RGB", (WIDTH, HEIGHT), (0, 0, 0))
-        glow.paste(self.beam_layer, (0, 0), self.mask)
-        frame = ImageChops.add(self.background, glow)
-
-        draw = ImageDraw.Draw(frame)
+        np.multiply(self._glow[..., None], _BEAM_RGB, out=self._blend)
+        self._blend += self._background
+        np.minimum(self._blend, 255.0, out=self._blend)
+        frame = self._frame
+        frame[...] = self._blend
+        flat = frame.reshape(-1, 3)
         # Leading edge, drawn live rather than accumulated (see draw_beam).
-        self._beam_ray(draw, self.sweep, BEAM)
+        flat[_ray(self.sweep)] = BEAM
 
         # Centre marker: the station itself (Whole Foods on Lamar, per
         # config). Drawn after the beam so it never gets washed out --
         # knowing where the centre is turns the display from dots on a
         # circle into "that plane is over MY head".
-        draw.line([(CX - 2, CY), (CX + 2, CY)], fill=CENTRE_MARK)
-        draw.line([(CX, CY - 2), (CX, CY + 2)], fill=CENTRE_MARK)
-        return frame
+        flat[_centre_mark()] = CENTRE_MARK
+        return Image.fromarray(frame)
 
 
 def _format_altitude(contact):
@@ -682,9 +716,8 @@ def run(matrix, duration=60):
                   map_data=_load_map(cfg["lat"], cfg["lon"],
                                      cfg["radius_miles"]),
                   lat0=cfg["lat"], lon0=cfg["lon"])
-    feed = AircraftFeed(cfg["lat"], cfg["lon"],
-                        cfg["radius_miles"], cfg["poll_seconds"])
-    feed.start()
+    feed = shared_feed(cfg)
+    _feeds.start_feeds()
 
     show_ground = cfg["show_ground"]
     start = time.time()
@@ -705,7 +738,7 @@ def run(matrix, duration=60):
             visible = [c for c in contacts if scope.in_range(c)
                        and (show_ground or not c.on_ground)]
 
-            scope.decay()
+            scope.decay(dt)
             sweep_start, _sweep_end = scope.advance_sweep(dt)
             scope.draw_beam(sweep_start)
 
@@ -734,7 +767,6 @@ def run(matrix, duration=60):
     except Exception:
         logger.error("Error in flight_radar demo", exc_info=True)
     finally:
-        feed.stop()
         try:
             matrix.Clear()
         except Exception:
@@ -16,8 +16,9 @@ import time
 import math
 import random
 import logging
+import numpy as np
 from PIL import Image
-from src.display._shared import should_stop, interruptible_sleep
+from src.display._shared import should_stop, interruptible_sleep, FrameBuffer
 from src.display._utils import _hsv_to_rgb
 
 logger = logging.getLogger(__name__)
@@ -130,6 +131,33 @@ def _mandelbrot_iter(cx, cy, max_iter):
     return max_iter
 
 
+def _mandelbrot_iters(real, imag, max_iter):
+    """Array form of :func:`_mandelbrot_iter` over whole coordinate grids.
+
+    Escaped points are frozen in place (``np.where`` on the active mask) so
+    their values never overflow, and the returned counts match the scalar
+    version point for point.
+    """
+    zx = np.zeros_like(real)
+    zy = np.zeros_like(imag)
+    iters = np.full(real.shape, max_iter, dtype=np.intp)
+    active = np.ones(real.shape, dtype=bool)
+    for i in range(max_iter):
+        escaped = active & (zx * zx + zy * zy > 4.0)
+        iters[escaped] = i
+        active &= ~escaped
+        if not active.any():
+            break
+        zx, zy = (np.where(active, zx * zx - zy * zy + real, zx),
+                  np.where(active, 2 * zx * zy + imag, zy))
+    return iters
+
+
+# Pixel offsets from the panel centre, in panel widths/heights.
+_MANDEL_DX = (np.arange(WIDTH) - WIDTH / 2) / WIDTH
+_MANDEL_DY = (np.arange(HEIGHT) - HEIGHT / 2) / HEIGHT
+
+
 def _mandelbrot_view(t):
     """Camera for progress ``t`` in 0..1: (scale, cx, cy, max_iter).
 
@@ -162,6 +190,7 @@ def _run_mandelbrot(matrix, duration=20):
     Stays on the edge of the set where detail is infinite.
     """
     start = time.time()
+    frame = FrameBuffer(WIDTH, HEIGHT)
 
     while time.time() - start < duration:
         if should_stop():
@@ -173,25 +202,19 @@ def _run_mandelbrot(matrix, duration=20):
         t = min(1.0, (time.time() - start) / duration)
         scale, cx, cy, max_iter = _mandelbrot_view(t)
 
-        image = Image.new("RGB", (WIDTH, HEIGHT), (0, 0, 0))
-        pixels = image.load()
-
-        for py in range(HEIGHT):
-            for px in range(WIDTH):
-                # Map pixel to complex plane
-                real = cx + (px - WIDTH / 2) * scale / WIDTH
-                imag = cy + (py - HEIGHT / 2) * scale / HEIGHT
-
-                iters = _mandelbrot_iter(real, imag, max_iter)
-
-                if iters == max_iter:
-                    pixels[px, py] = (0, 0, 0)
-                else:
-                    # Smooth coloring with shifted palette as we zoom
-                    color = _depth_color(iters, max_iter, hue_offset=t * 0.5)
-                    pixels[px, py] = color
-
-        matrix.SetImage(image)
+        # Map the pixel grid to the complex plane in one go
+        real = cx + _MANDEL_DX[np.newaxis, :] * scale
+        imag = cy + _MANDEL_DY[:, np.newaxis] * scale
+        real, imag = np.broadcast_arrays(real, imag)
+        iters = _mandelbrot_iters(real, imag, max_iter)
+
+        # Smooth coloring with shifted palette as we zoom; one palette entry
+        # per iteration count, interior (== max_iter) stays black.
+        palette = np.zeros((max_iter + 1, 3), dtype=np.uint8)
+        palette[:max_iter] = [_depth_color(i, max_iter, hue_offset=t * 0.5)
+                              for i in range(max_iter)]
+        frame.pixels[...] = palette[iters]
+        frame.show(matrix)
 
         elapsed = time.time() - frame_start
         sleep_time = FRAME_INTERVAL - elapsed
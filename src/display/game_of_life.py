@@ -1,125 +1,283 @@
 #!/usr/bin/env python3
-"""Conway's Game of Life for 64x64 LED matrix."""
+"""Conway's Game of Life for 64x64 LED matrix.
+
+The life engine works on whole numpy grids: a generation is a toroidal
+3x3 neighbour sum (six ``np.roll`` adds), the birth/survival rule, and an
+age update, with no per-cell Python. That makes a world much larger than
+the panel affordable, so the simulation runs on a hidden ``WORLD_WIDTH x
+WORLD_HEIGHT`` torus and the 64x64 view slowly pans across it.
+
+A settled world is detected with a bounded ring of per-generation board
+signatures (any cycle up to ``CYCLE_MAX_PERIOD`` generations, including
+gliders circling the torus), and reseeded from a library of long-lived
+methuselahs and glider guns rather than random noise.
+"""
 
 import time
-import random
 import logging
-from PIL import Image
-from src.display._shared import should_stop
+from collections import deque
+import numpy as np
+from src.display._shared import should_stop, FrameBuffer, lazy_table
 
 logger = logging.getLogger(__name__)
 
 WIDTH, HEIGHT = 64, 64
-FRAME_INTERVAL = 1.0 / 10  # Slower to appreciate the patterns
-
-
-def _random_grid(density=0.3):
-    """Create a random initial state."""
-    return [[1 if random.random() < density else 0 for _ in range(WIDTH)] for _ in range(HEIGHT)]
-
-
-def _count_neighbors(grid, x, y):
-    """Count live neighbors (wrapping at edges)."""
-    count = 0
-    for dy in (-1, 0, 1):
-        for dx in (-1, 0, 1):
-            if dx == 0 and dy == 0:
-                continue
-            nx = (x + dx) % WIDTH
-            ny = (y + dy) % HEIGHT
-            count += grid[ny][nx]
-    return count
-
-
-def _next_generation(grid, buf=None):
-    """Compute the next generation into buf (avoids per-frame allocation)."""
-    if buf is None:
-        buf = [[0] * WIDTH for _ in range(HEIGHT)]
-    for y in range(HEIGHT):
-        row = buf[y]
-        for x in range(WIDTH):
-            neighbors = _count_neighbors(grid, x, y)
-            if grid[y][x]:
-                row[x] = 1 if neighbors in (2, 3) else 0
+FRAME_INTERVAL = 1.0 / 15
+
+# Hidden world the view pans across (wraps at the edges like the panel did).
+WORLD_WIDTH, WORLD_HEIGHT = 256, 256
+# View drift in cells per generation; slow enough to follow a pattern.
+PAN_VELOCITY = (0.25, 0.1)
+
+# Ages are capped here; every colour band is reached well before it.
+_AGE_CAP = 50
+# Below WORLD_CELLS / _MIN_ALIVE_DIVISOR live cells the world is reseeded.
+_MIN_ALIVE_DIVISOR = 2000
+# Longest repeating cycle the settle detector recognises, and how many
+# consecutive repeats confirm it (a single signature match can be chance).
+CYCLE_MAX_PERIOD = 64
+_CYCLE_CONFIRM = 16
+# Patterns dropped into a freshly cleared world on reseed.
+_RESEED_PATTERNS = (4, 8)
+
+# Reseed library in run-length encoding (b = dead, o = alive, $ = new row).
+# Methuselahs evolve for thousands of generations from a handful of cells;
+# the guns emit a glider every 30 / 120 generations.
+PATTERNS = {
+    "r_pentomino": "b2o$2o$bo!",
+    "acorn": "bo$3bo$2o2b3o!",
+    "rabbits": "o3b3o$3o2bo$bo!",
+    "gosper_glider_gun": ("24bo$22bobo$12b2o6b2o12b2o$11bo3bo4b2o12b2o$"
+                          "2o8bo5bo3b2o$2o8bo3bob2o4bobo$10bo5bo7bo$"
+                          "11bo3bo$12b2o!"),
+    "simkin_glider_gun": ("2o5b2o$2o5b2o2$4b2o$4b2o5$22b2ob2o$21bo5bo$"
+                          "21bo6bo2b2o$21b3o3bo3b2o$26bo4$20b2o$20bo$"
+                          "21b3o$23bo!"),
+}
+
+
+def _random_grid(density=0.3, shape=(WORLD_HEIGHT, WORLD_WIDTH), rng=None):
+    """Create a random initial state as a uint8 array of 0/1 cells."""
+    rng = rng if rng is not None else np.random.default_rng()
+    return (rng.random(shape) < density).astype(np.uint8)
+
+
+def _neighbor_counts(grid):
+    """Live-neighbour count of every cell, wrapping at the edges."""
+    column = grid + np.roll(grid, 1, axis=0) + np.roll(grid, -1, axis=0)
+    return column + np.roll(column, 1, axis=1) + np.roll(column, -1, axis=1) - grid
+
+
+def _next_generation(grid, out=None):
+    """Compute the next generation into ``out`` (avoids per-frame allocation)."""
+    counts = _neighbor_counts(grid)
+    if out is None:
+        out = np.empty_like(grid)
+    np.logical_or(counts == 3, (counts == 2) & (grid == 1), out=out, casting="unsafe")
+    return out
+
+
+def _update_ages(ages, grid):
+    """Age surviving cells by one generation (capped); dead cells reset to 0."""
+    np.minimum(ages + 1, _AGE_CAP, out=ages)
+    ages *= grid
+    return ages
+
+
+def _parse_rle(rle):
+    """Decode a run-length-encoded pattern into a uint8 0/1 array."""
+    rows = [[]]
+    run = ""
+    for ch in rle:
+        if ch.isdigit():
+            run += ch
+            continue
+        count = int(run) if run else 1
+        run = ""
+        if ch == "b":
+            rows[-1].extend([0] * count)
+        elif ch == "o":
+            rows[-1].extend([1] * count)
+        elif ch == "$":
+            rows.extend([] for _ in range(count))
+        elif ch == "!":
+            break
+    pattern = np.zeros((len(rows), max(len(r) for r in rows)), dtype=np.uint8)
+    for y, row in enumerate(rows):
+        pattern[y, :len(row)] = row
+    return pattern
+
+
+@lazy_table
+def _pattern_library():
+    """Every library pattern in all eight rotations/reflections."""
+    library = []
+    for rle in PATTERNS.values():
+        base = _parse_rle(rle)
+        variants = {}
+        for flipped in (base, base[:, ::-1]):
+            for turns in range(4):
+                variant = np.ascontiguousarray(np.rot90(flipped, turns))
+                variants[(variant.shape, variant.tobytes())] = variant
+        library.append(list(variants.values()))
+    return library
+
+
+def _stamp(grid, pattern, top, left):
+    """OR ``pattern`` into ``grid`` at ``(top, left)``, wrapping at the edges."""
+    h, w = grid.shape
+    rows = (top + np.arange(pattern.shape[0])) % h
+    cols = (left + np.arange(pattern.shape[1])) % w
+    grid[np.ix_(rows, cols)] |= pattern
+
+
+def _reseed(grid, ages, rng, focus=None):
+    """Clear the world and drop a few random library patterns into it.
+
+    The first pattern lands at ``focus`` (the centre of the view, as a
+    ``(row, col)``) so the panel shows the new evolution from its start.
+    """
+    grid[...] = 0
+    ages[...] = 0
+    library = _pattern_library()
+    h, w = grid.shape
+    for i in range(int(rng.integers(*_RESEED_PATTERNS, endpoint=True))):
+        variants = library[int(rng.integers(len(library)))]
+        pattern = variants[int(rng.integers(len(variants)))]
+        if i == 0 and focus is not None:
+            top = focus[0] - pattern.shape[0] // 2
+            left = focus[1] - pattern.shape[1] // 2
+        else:
+            top, left = int(rng.integers(h)), int(rng.integers(w))
+        _stamp(grid, pattern, top, left)
+
+
+def _board_signature(grid):
+    """Hash of the board that is unchanged by translation on the torus.
+
+    Sorted row and column populations survive any wrap-around shift, so a
+    glider field returns to the same signature every few generations even
+    though the board itself only repeats after a full lap of the world.
+    """
+    rows = np.sort(grid.sum(axis=1, dtype=np.uint16))
+    cols = np.sort(grid.sum(axis=0, dtype=np.uint16))
+    return hash((rows.tobytes(), cols.tobytes()))
+
+
+class _CycleDetector:
+    """Detects a repeating board within the last ``max_period`` generations.
+
+    A bounded ring of signatures plus a count per signature make each
+    :meth:`observe` O(1). A cycle is reported once ``confirm`` consecutive
+    generations all repeat an earlier one.
+    """
+
+    def __init__(self, max_period=CYCLE_MAX_PERIOD, confirm=_CYCLE_CONFIRM):
+        self._ring = deque(maxlen=max_period)
+        self._counts = {}
+        self._confirm = confirm
+        self._repeats = 0
+
+    def reset(self):
+        self._ring.clear()
+        self._counts.clear()
+        self._repeats = 0
+
+    def observe(self, signature):
+        """Record one generation; return True once the world is cycling."""
+        if signature in self._counts:
+            self._repeats += 1
+        else:
+            self._repeats = 0
+        if len(self._ring) == self._ring.maxlen:
+            oldest = self._ring[0]
+            remaining = self._counts[oldest] - 1
+            if remaining:
+                self._counts[oldest] = remaining
             else:
-                row[x] = 1 if neighbors == 3 else 0
-    return buf
-
-
-def _grid_to_image(grid, age_map):
-    """Convert grid to colored image. Older cells are warmer colors."""
-    image = Image.new("RGB", (WIDTH, HEIGHT), (0, 0, 0))
-    pixels = image.load()
-    for y in range(HEIGHT):
-        for x in range(WIDTH):
-            if grid[y][x]:
-                age = min(age_map[y][x], 50)
-                # Young cells are cyan, aging cells turn green, old cells are yellow
-                if age < 5:
-                    pixels[x, y] = (0, 200, 255)
-                elif age < 15:
-                    pixels[x, y] = (0, 255, 100)
-                elif age < 30:
-                    pixels[x, y] = (200, 255, 0)
-                else:
-                    pixels[x, y] = (255, 200, 0)
-    return image
+                del self._counts[oldest]
+        self._ring.append(signature)
+        self._counts[signature] = self._counts.get(signature, 0) + 1
+        return self._repeats >= self._confirm
+
+
+@lazy_table
+def _age_palette():
+    """Colour per ``age + 1`` for live cells; index 0 is a dead cell (black).
+
+    Young cells are cyan, aging cells turn green, old cells are yellow.
+    """
+    palette = np.zeros((_AGE_CAP + 2, 3), dtype=np.uint8)
+    for age in range(_AGE_CAP + 1):
+        if age < 5:
+            color = (0, 200, 255)
+        elif age < 15:
+            color = (0, 255, 100)
+        elif age < 30:
+            color = (200, 255, 0)
+        else:
+            color = (255, 200, 0)
+        palette[age + 1] = color
+    return palette
+
+
+def _view_indices(offset, size, world_size):
+    """World row/column indices of a wrapped ``size``-cell window."""
+    return (int(offset) + np.arange(size)) % world_size
+
+
+def _render_view(grid, ages, rows, cols, out):
+    """Write the age-coloured window ``grid[rows][:, cols]`` into ``out``."""
+    view = np.ix_(rows, cols)
+    out[...] = _age_palette()[(ages[view] + 1) * grid[view]]
 
 
 def run(matrix, duration=60):
     """Run the Game of Life for the specified duration."""
     start_time = time.time()
-    grid = _random_grid(0.35)
-    _buf = [[0] * WIDTH for _ in range(HEIGHT)]
-    age_map = [[0] * WIDTH for _ in range(HEIGHT)]
-    stale_count = 0
-    prev_alive = -1
-    
+    rng = np.random.default_rng()
+    grid = _random_grid(0.35, rng=rng)
+    buf = np.empty_like(grid)
+    ages = np.zeros(grid.shape, dtype=np.uint8)
+    frame = FrameBuffer(WIDTH, HEIGHT)
+    world_h, world_w = grid.shape
+    min_alive = grid.size // _MIN_ALIVE_DIVISOR
+    pan_x = float(rng.integers(world_w))
+    pan_y = float(rng.integers(world_h))
+    cycles = _CycleDetector()
+
     try:
         while time.time() - start_time < duration:
             if should_stop():
                 break
             frame_start = time.time()
-            
-            # Render
-            image = _grid_to_image(grid, age_map)
-            matrix.SetImage(image)
-            
+
+            # Render the panned window
+            rows = _view_indices(pan_y, HEIGHT, world_h)
+            cols = _view_indices(pan_x, WIDTH, world_w)
+            _render_view(grid, ages, rows, cols, frame.pixels)
+            frame.show(matrix)
+            pan_x = (pan_x + PAN_VELOCITY[0]) % world_w
+            pan_y = (pan_y + PAN_VELOCITY[1]) % world_h
+
             # Update (double-buffer: swap grid <-> buf to avoid allocation)
-            new_grid = _next_generation(grid, _buf)
-            
-            # Update age map
-            for y in range(HEIGHT):
-                for x in range(WIDTH):
-                    if new_grid[y][x]:
-                        age_map[y][x] += 1
-                    else:
-                        age_map[y][x] = 0
-            
-            # Detect stale states and reset
-            alive = sum(sum(row) for row in new_grid)
-            if alive == prev_alive:
-                stale_count += 1
-            else:
-                stale_count = 0
-            prev_alive = alive
-            
-            if stale_count > 30 or alive < 10:
-                # Inject some random life
-                for _ in range(WIDTH * HEIGHT // 4):
-                    x = random.randint(0, WIDTH - 1)
-                    y = random.randint(0, HEIGHT - 1)
-                    new_grid[y][x] = 1
-                    age_map[y][x] = 0
-                stale_count = 0
-            
-            grid, _buf = new_grid, grid
-            
+            new_grid = _next_generation(grid, buf)
+            _update_ages(ages, new_grid)
+
+            # Reseed once the world has settled into a cycle or died out
+            if (cycles.observe(_board_signature(new_grid))
+                    or int(new_grid.sum()) < min_alive):
+                focus = (int(pan_y) + HEIGHT // 2, int(pan_x) + WIDTH // 2)
+                _reseed(new_grid, ages, rng, focus)
+                cycles.reset()
+
+            grid, buf = new_grid, grid
+
             elapsed = time.time() - frame_start
             sleep_time = FRAME_INTERVAL - elapsed
             if sleep_time > 0:
                 time.sleep(sleep_time)
-                
+
     except Exception as e:
         logger.error("Error in Game of Life: %s", e, exc_info=True)
     finally:
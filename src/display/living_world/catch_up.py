@@ -0,0 +1,102 @@
+"""Offline fast-forward for a resumed world.
+
+While the panel shows other features the saved world stands still. On
+resume, :class:`CatchUp` advances it by ``CATCH_UP_FRACTION`` of the
+wall-clock time it was away (at most ``CATCH_UP_MAX_TICKS``), running the
+render-free :func:`~.step._simulate_tick` in a background thread. The
+thread steps ``CATCH_UP_CHUNK_TICKS`` ticks per hold of the world lock and
+sleeps between chunks to stay within ``CATCH_UP_CPU_BUDGET`` of one core,
+so the frame loop keeps drawing -- the village visibly hurries forward --
+and the rest of the system stays responsive.
+"""
+
+import logging
+import threading
+import time
+
+from .constants import (
+    FRAME_INTERVAL, CATCH_UP_FRACTION, CATCH_UP_MAX_TICKS,
+    CATCH_UP_CPU_BUDGET, CATCH_UP_CHUNK_TICKS,
+)
+from .step import _simulate_tick, _world_clock
+
+logger = logging.getLogger(__name__)
+
+
+def _catch_up_ticks(saved, now=None):
+    """Ticks to fast-forward a save by, from the time it was written."""
+    saved_at = saved.get("saved_at") if saved else None
+    if not saved_at:
+        return 0
+    away = max(0.0, (now if now is not None else time.time()) - saved_at)
+    return min(CATCH_UP_MAX_TICKS, int(away * CATCH_UP_FRACTION / FRAME_INTERVAL))
+
+
+class CatchUp:
+    """Background fast-forward of a world state dict.
+
+    ``lock`` is the world lock shared with the frame loop; the thread only
+    mutates the state while holding it. ``sim_tick`` and ``elapsed`` (world
+    seconds) are where the world has got to; the frame loop adopts them once
+    :attr:`running` turns False, or after :meth:`stop`.
+    """
+
+    def __init__(self, state, lock, sim_tick, elapsed, ticks, camera_x,
+                 cpu_budget=CATCH_UP_CPU_BUDGET, chunk=CATCH_UP_CHUNK_TICKS):
+        self.state = state
+        self.lock = lock
+        self.sim_tick = sim_tick
+        self.elapsed = elapsed
+        self.target = ticks
+        self.done = 0
+        self.camera_x = camera_x
+        self._budget = max(0.01, min(1.0, cpu_budget))
+        self._chunk = max(1, chunk)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="living-world-catch-up",
+                                        daemon=True)
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def start(self):
+        logger.info("Living world catch-up: fast-forwarding %d ticks (%.0f s of world time)",
+                    self.target, self.target * FRAME_INTERVAL)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        """Stop early (the world keeps whatever progress was made)."""
+        self._stop.set()
+        if self._thread.ident is not None:
+            self._thread.join(timeout)
+
+    def _step_chunk(self):
+        for _ in range(min(self._chunk, self.target - self.done)):
+            day_phase, _ambient, season_info = _world_clock(self.elapsed)
+            _simulate_tick(self.state, self.sim_tick, day_phase, season_info[0], self.camera_x)
+            self.sim_tick += 1
+            self.elapsed += FRAME_INTERVAL
+            self.done += 1
+
+    def _run(self):
+        started = time.monotonic()
+        try:
+            while self.done < self.target and not self._stop.is_set():
+                if not self.lock.acquire(timeout=0.1):
+                    continue
+                t0 = time.monotonic()
+                try:
+                    self._step_chunk()
+                finally:
+                    self.lock.release()
+                busy = time.monotonic() - t0
+                # Sleep so busy / (busy + idle) stays within the CPU budget.
+                self._stop.wait(busy * (1.0 - self._budget) / self._budget)
+        except Exception as e:
+            logger.error("Living world catch-up failed after %d ticks: %s",
+                         self.done, e, exc_info=True)
+            return
+        logger.info("Living world catch-up: %d/%d ticks in %.1f s",
+                    self.done, self.target, time.monotonic() - started)
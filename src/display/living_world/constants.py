@@ -10,6 +10,17 @@ WIDTH, HEIGHT = DISPLAY_WIDTH, DISPLAY_HEIGHT
 FRAME_INTERVAL = 1.0 / 18
 DAY_CYCLE_SECONDS = 900.0
 
+# Offline catch-up: a resumed world is fast-forwarded (headless, in a
+# background thread) by this fraction of the wall-clock time it sat saved.
+CATCH_UP_FRACTION = 0.25
+CATCH_UP_MAX_TICKS = 30000        # ~28 minutes of world time at most
+CATCH_UP_CPU_BUDGET = 0.5         # share of one core the catch-up may use
+CATCH_UP_CHUNK_TICKS = 20         # ticks stepped per hold of the world lock
+
+# Periodic autosave while running (the save is deleted once loaded, so
+# without it a crash or power cut would lose the whole session).
+AUTOSAVE_INTERVAL_TICKS = 18 * 120   # ~2 minutes
+
 # Season system
 SEASON_CYCLE_DAYS = 4          # Full season cycle = 4 day/night cycles
 SEASONS = ["spring", "summer", "autumn", "winter"]
@@ -1,39 +1,112 @@
-"""Post-processing light passes applied after all rendering."""
+"""Post-processing light passes applied after all rendering.
+
+Artificial light is accumulated into a :class:`LightMap` -- a per-pixel
+gain (how much of the pixel's own colour is added) and an additive tint --
+by splatting precomputed mask arrays for every emitter, then applied to the
+frame once and clamped to ``MAX_LIGHT_LEVEL``. Overlapping lights add up
+instead of compounding pass after pass.
+"""
 
 import random
 
+import numpy as np
+from PIL import Image
+
+from src.display._shared import lazy_table
 from .constants import (
     LIGHT_MASK, LANTERN_MASK, WATCHTOWER_LIGHT_MASK, TORCH_POST_LIGHT_MASK,
     DISPLAY_WIDTH, DISPLAY_HEIGHT, CAMPFIRE_LOW_FUEL_THRESHOLD,
     MAX_LIGHT_LEVEL,
 )
+from .spatial import column_index
 
 
-def _apply_campfire_light(pixels, structures, ambient, camera_x):
+def _mask_array(mask):
+    """Turn a ``[(dx, dy, intensity)]`` mask into (weights, covered, radius)."""
+    radius = max(max(abs(dx), abs(dy)) for dx, dy, _ in mask)
+    size = 2 * radius + 1
+    weights = np.zeros((size, size), dtype=np.float64)
+    covered = np.zeros((size, size), dtype=bool)
+    for dx, dy, intensity in mask:
+        weights[dy + radius, dx + radius] = intensity / 255.0
+        covered[dy + radius, dx + radius] = True
+    return weights, covered, radius
+
+
+@lazy_table
+def _light_masks():
+    return {
+        "campfire": _mask_array(LIGHT_MASK),
+        "lantern": _mask_array(LANTERN_MASK),
+        "watchtower": _mask_array(WATCHTOWER_LIGHT_MASK),
+        "torch_post": _mask_array(TORCH_POST_LIGHT_MASK),
+    }
+
+
+class LightMap:
+    """Additive light buffer for one frame.
+
+    Each lit pixel becomes ``c + c * gain + add`` per channel, truncated and
+    clamped to ``[0, MAX_LIGHT_LEVEL]`` -- the formula the per-light passes
+    used, summed over every light that reaches the pixel.
+    """
+
+    def __init__(self, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT):
+        self.gain = np.zeros((height, width, 3), dtype=np.float64)
+        self.add = np.zeros((height, width, 3), dtype=np.float64)
+        self.covered = np.zeros((height, width), dtype=bool)
+
+    def splat(self, kind, x, y, strength, boost, gain_tint, add_tint):
+        """Add one emitter's mask centred on screen pixel ``(x, y)``.
+
+        ``strength`` scales the whole mask (the night factor), ``boost`` and
+        ``gain_tint`` set the per-channel self-brightening, and ``add_tint``
+        the per-channel colour added at full intensity.
+        """
+        weights, covered, r = _light_masks()[kind]
+        height, width = self.covered.shape
+        x0, y0 = max(0, x - r), max(0, y - r)
+        x1, y1 = min(width, x + r + 1), min(height, y + r + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        mx, my = x0 - (x - r), y0 - (y - r)
+        w = weights[my:my + y1 - y0, mx:mx + x1 - x0, None] * strength
+        self.gain[y0:y1, x0:x1] += w * (boost * np.asarray(gain_tint))
+        self.add[y0:y1, x0:x1] += w * np.asarray(add_tint, dtype=np.float64)
+        self.covered[y0:y1, x0:x1] |= covered[my:my + y1 - y0, mx:mx + x1 - x0]
+
+    def apply(self, target):
+        """Light ``target``: a PIL RGB image, or a pixel accessor (slow path)."""
+        if not self.covered.any():
+            return
+        if hasattr(target, "paste"):
+            frame = np.asarray(target, dtype=np.float64)
+            lit = np.clip(np.trunc(frame + frame * self.gain + self.add), 0, MAX_LIGHT_LEVEL)
+            out = np.where(self.covered[..., None], lit, frame).astype(np.uint8)
+            target.paste(Image.fromarray(out))
+            return
+        cap = MAX_LIGHT_LEVEL
+        for py, px in zip(*np.nonzero(self.covered)):
+            g, a = self.gain[py, px], self.add[py, px]
+            c = target[int(px), int(py)]
+            target[int(px), int(py)] = tuple(
+                max(0, min(cap, int(c[i] + c[i] * g[i] + a[i]))) for i in range(3))
+
+
+def _add_campfire_light(lights, structures, ambient, camera_x):
     if ambient > 0.6: return
     nf = max(0.0, (0.6 - ambient) / 0.45)
-    cap = MAX_LIGHT_LEVEL
-    visible = [s for s in structures if camera_x - 10 <= s.x <= camera_x + DISPLAY_WIDTH + 10]
+    visible = column_index(structures).in_range(camera_x - 10, camera_x + DISPLAY_WIDTH + 10)
     for s in visible:
         if s.type != "campfire" or s.fuel <= 0: continue
-        fx = s.x - camera_x
-        fy = s.y
-        for dx, dy, intensity in LIGHT_MASK:
-            px, py = fx + dx, fy + dy
-            if 0 <= px < DISPLAY_WIDTH and 0 <= py < DISPLAY_HEIGHT:
-                att = (intensity / 255.0) * nf
-                boost = (intensity / 255.0) * 0.85 * nf
-                r, g, b = pixels[px, py]
-                nr = max(0, min(cap, int(r + r * boost + 40 * att)))
-                ng = max(0, min(cap, int(g + g * boost * 0.6 + 20 * att)))
-                nb = max(0, min(cap, int(b + b * boost * 0.2)))
-                pixels[px, py] = (nr, ng, nb)
+        lights.splat("campfire", s.x - camera_x, s.y, nf, 0.85, (1.0, 0.6, 0.2), (40, 20, 0))
 
-def _apply_lantern_light(pixels, structures, ambient, camera_x):
+def _add_lantern_light(lights, pixels, structures, ambient, camera_x):
+    """Lantern glow; the lantern pixels themselves are drawn straight away."""
     if ambient > 0.3: return
     nf = max(0.0, (0.3 - ambient) / 0.15)
     cap = MAX_LIGHT_LEVEL
-    visible = [s for s in structures if camera_x - 10 <= s.x <= camera_x + DISPLAY_WIDTH + 10]
+    visible = column_index(structures).in_range(camera_x - 10, camera_x + DISPLAY_WIDTH + 10)
     for s in visible:
         if s.type not in ("house_small", "house_large") or s.under_construction: continue
         lx = s.door_x - camera_x
@@ -41,52 +114,53 @@ def _apply_lantern_light(pixels, structures, ambient, camera_x):
         if not (0 <= lx < DISPLAY_WIDTH and 0 <= ly < DISPLAY_HEIGHT): continue
         flicker = random.randint(-20, 20)
         pixels[lx, ly] = (min(cap, max(200, 255 + flicker)), min(cap, max(160, 200 + flicker)), 80)
-        for dx, dy, intensity in LANTERN_MASK:
-            px, py = lx + dx, ly + dy
-            if 0 <= px < DISPLAY_WIDTH and 0 <= py < DISPLAY_HEIGHT:
-                att = (intensity / 255.0) * nf
-                boost = (intensity / 255.0) * 0.5 * nf
-                r, g, b = pixels[px, py]
-                nr = max(0, min(cap, int(r + r * boost + 20 * att)))
-                ng = max(0, min(cap, int(g + g * boost * 0.5 + 10 * att)))
-                nb = max(0, min(cap, int(b + b * boost * 0.2)))
-                pixels[px, py] = (nr, ng, nb)
+        lights.splat("lantern", lx, ly, nf, 0.5, (1.0, 0.5, 0.2), (20, 10, 0))
 
-def _apply_watchtower_light(pixels, structures, ambient, camera_x):
+def _add_watchtower_light(lights, structures, ambient, camera_x):
     if ambient > 0.3: return
     nf = max(0.0, (0.3 - ambient) / 0.15)
-    cap = MAX_LIGHT_LEVEL
-    visible = [s for s in structures if camera_x - 10 <= s.x <= camera_x + DISPLAY_WIDTH + 10]
+    visible = column_index(structures).in_range(camera_x - 10, camera_x + DISPLAY_WIDTH + 10)
     for s in visible:
         if s.type != "watchtower" or s.under_construction: continue
-        lx = s.x - camera_x
-        ly = s.y
-        for dx, dy, intensity in WATCHTOWER_LIGHT_MASK:
-            px, py = lx + dx, ly + dy
-            if 0 <= px < DISPLAY_WIDTH and 0 <= py < DISPLAY_HEIGHT:
-                att = (intensity / 255.0) * nf
-                boost = (intensity / 255.0) * 0.7 * nf
-                r, g, b = pixels[px, py]
-                nr = max(0, min(cap, int(r + r * boost + 30 * att)))
-                ng = max(0, min(cap, int(g + g * boost * 0.5 + 15 * att)))
-                nb = max(0, min(cap, int(b + b * boost * 0.2)))
-                pixels[px, py] = (nr, ng, nb)
+        lights.splat("watchtower", s.x - camera_x, s.y, nf, 0.7, (1.0, 0.5, 0.2), (30, 15, 0))
 
-def _apply_torch_post_light(pixels, torch_posts, ambient, camera_x):
+def _add_torch_post_light(lights, torch_posts, ambient, camera_x):
     if ambient > 0.3: return
     nf = max(0.0, (0.3 - ambient) / 0.15)
-    cap = MAX_LIGHT_LEVEL
     visible = [(tx, ty) for tx, ty in torch_posts if camera_x - 10 <= tx <= camera_x + DISPLAY_WIDTH + 10]
     for tx, ty in visible:
-        lx = tx - camera_x
-        ly = ty - 1
-        for dx, dy, intensity in TORCH_POST_LIGHT_MASK:
-            px, py = lx + dx, ly + dy
-            if 0 <= px < DISPLAY_WIDTH and 0 <= py < DISPLAY_HEIGHT:
-                att = (intensity / 255.0) * nf
-                boost = (intensity / 255.0) * 0.5 * nf
-                r, g, b = pixels[px, py]
-                nr = max(0, min(cap, int(r + r * boost + 20 * att)))
-                ng = max(0, min(cap, int(g + g * boost * 0.4 + 10 * att)))
-                nb = max(0, min(cap, int(b + b * boost * 0.2)))
-                pixels[px, py] = (nr, ng, nb)
+        lights.splat("torch_post", tx - camera_x, ty - 1, nf, 0.5, (1.0, 0.4, 0.2), (20, 10, 0))
+
+
+def _apply_night_lights(image, structures, torch_posts, ambient, camera_x):
+    """Every artificial light source in a single light-map pass."""
+    if ambient > 0.6: return
+    lights = LightMap()
+    _add_campfire_light(lights, structures, ambient, camera_x)
+    _add_lantern_light(lights, image.load(), structures, ambient, camera_x)
+    _add_watchtower_light(lights, structures, ambient, camera_x)
+    _add_torch_post_light(lights, torch_posts, ambient, camera_x)
+    lights.apply(image)
+
+
+# Single-source passes on a pixel accessor (kept for callers and tests that
+# light one kind of emitter at a time).
+def _apply_campfire_light(pixels, structures, ambient, camera_x):
+    lights = LightMap()
+    _add_campfire_light(lights, structures, ambient, camera_x)
+    lights.apply(pixels)
+
+def _apply_lantern_light(pixels, structures, ambient, camera_x):
+    lights = LightMap()
+    _add_lantern_light(lights, pixels, structures, ambient, camera_x)
+    lights.apply(pixels)
+
+def _apply_watchtower_light(pixels, structures, ambient, camera_x):
+    lights = LightMap()
+    _add_watchtower_light(lights, structures, ambient, camera_x)
+    lights.apply(pixels)
+
+def _apply_torch_post_light(pixels, torch_posts, ambient, camera_x):
+    lights = LightMap()
+    _add_torch_post_light(lights, torch_posts, ambient, camera_x)
+    lights.apply(pixels)
@@ -1,14 +1,53 @@
-"""Save / restore world state to JSON for persistence across restarts."""
+"""Save / restore world state for persistence across restarts.
+
+Saves are written in a compact binary format (version 2)::
+
+    header   "LWSV", u16 version, u16 flags, u32 meta length   (little-endian)
+    meta     JSON (zlib-compressed when flags & 1): scalars, table layouts
+    blobs    the block grid as one byte per cell, heights/path wear and
+             numeric entity columns as packed int32/int64/float64 arrays,
+             each blob zlib-compressed on its own when compression is on
+
+Entity lists are stored column by column ("tables"): every attribute of a
+list becomes one typed column, and cross-references stay the ``_*_idx``
+integer columns they were in the JSON format. Blobs are compressed
+separately so an autosave can reuse the compressed bytes of any section
+that has not changed since the last write (the grid, usually).
+
+:func:`load_world` still reads ``version: 1`` JSON saves (the ``.json``
+file beside the save path), so existing worlds migrate on their next save;
+both formats decode to the same dict.
+"""
 
 import time
 import json
 import os
 import logging
+import struct
+import sys
 import tempfile
+import zlib
+from array import array
 
 logger = logging.getLogger(__name__)
 
-_SAVE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "config", "living_world_save.json")
+_SAVE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "..", "config", "living_world_save.lwb")
+
+SAVE_VERSION = 2
+_MAGIC = b"LWSV"
+_HEADER = struct.Struct("<4sHHI")
+_FLAG_COMPRESSED = 1
+_ENTITY_TABLES = ("villagers", "structures", "farms", "trees", "animals",
+                  "flowers", "lumber_items")
+_INT32_RANGE = (-2 ** 31, 2 ** 31 - 1)
+
+# Blob name -> (raw bytes, compressed bytes) from the last write.
+_compressed_sections = {}
+
+
+def _legacy_path(path):
+    """Where a ``version: 1`` JSON save for ``path`` would be."""
+    return os.path.splitext(os.path.abspath(path))[0] + ".json"
 
 
 def _entity_to_dict(obj):
@@ -41,8 +80,8 @@ def save_world(*, villagers, structures, trees, farms, heights, world,
                fireflies, smoke_particles, fish_jumps, flowers,
                rain_drops, grass_fires, path_wear, torch_posts,
                lumber_items, stars, camera_x, sim_tick, start_time,
-               follow_target_idx=None):
-    """Serialize all world state to a JSON file."""
+               follow_target_idx=None, compress=True):
+    """Serialize all world state to the binary save file."""
     try:
         # Build villager -> index map for cross-references
         v_idx = {id(v): i for i, v in enumerate(villagers)}
@@ -50,9 +89,10 @@ def save_world(*, villagers, structures, trees, farms, heights, world,
         f_idx = {id(f): i for i, f in enumerate(farms)}
 
         data = {
-            "version": 1,
+            "version": SAVE_VERSION,
             "sim_tick": sim_tick,
         "elapsed": time.time() - start_time if start_time else 0.0,
+            "saved_at": time.time(),
             "camera_x": camera_x,
             "heights": heights,
             "world": world,
@@ -95,21 +135,7 @@ def save_world(*, villagers, structures, trees, farms, heights, world,
         # Weather
         data["weather"] = _entity_to_dict(weather)
 
-        path = os.path.abspath(_SAVE_PATH)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        # Atomic write: write to temp file first, then replace
-        dir_name = os.path.dirname(path)
-        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
-        try:
-            with os.fdopen(fd, 'w') as fp:
-                json.dump(data, fp, separators=(",", ":"))
-            os.replace(tmp_path, path)
-        except Exception:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        path = _write_save(data, _SAVE_PATH, compress=compress)
         logger.info("World state saved to %s", path)
         return True
     except Exception as e:
@@ -117,18 +143,213 @@ def save_world(*, villagers, structures, trees, farms, heights, world,
         return False
 
 
-def load_world():
-    """Load world state from JSON.  Returns the data dict or None if not available."""
-    path = os.path.abspath(_SAVE_PATH)
-    if not os.path.exists(path):
-        return None
+def _pack_column(values):
+    """Pick a storage kind for one column and pack it.
+
+    Returns (kind, payload): bytes for the packed kinds, a list for "json".
+    """
+    if values and all(type(v) is bool for v in values):
+        return "bool", bytes(values)
+    if values and all(type(v) is int for v in values):
+        lo, hi = min(values), max(values)
+        typecode = "i" if _INT32_RANGE[0] <= lo and hi <= _INT32_RANGE[1] else "q"
+        if typecode == "q" and (lo < -2 ** 63 or hi >= 2 ** 63):
+            return "json", list(values)
+        return ("i32" if typecode == "i" else "i64"), _array_bytes(typecode, values)
+    if values and all(type(v) is float for v in values):
+        return "f64", _array_bytes("d", values)
+    return "json", list(values)
+
+
+def _array_bytes(typecode, values):
+    arr = array(typecode, values)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _array_values(typecode, raw):
+    arr = array(typecode)
+    arr.frombytes(raw)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr.tolist()
+
+
+_ARRAY_TYPECODES = {"i32": "i", "i64": "q", "f64": "d"}
+
+
+class _BlobWriter:
+    """Collects the blob section, compressing (and reusing) each blob."""
+
+    def __init__(self, compress):
+        self.compress = compress
+        self.parts = []
+        self.offset = 0
+
+    def add(self, name, raw):
+        """Append one blob; returns its layout entry for the meta."""
+        stored = raw
+        if self.compress:
+            cached = _compressed_sections.get(name)
+            if cached is not None and cached[0] == raw:
+                stored = cached[1]
+            else:
+                stored = zlib.compress(raw, 6)
+                _compressed_sections[name] = (raw, stored)
+        entry = {"off": self.offset, "len": len(stored), "z": self.compress}
+        self.parts.append(stored)
+        self.offset += len(stored)
+        return entry
+
+
+def _encode_table(name, records, blobs):
+    keys = []
+    for rec in records:
+        for k in rec:
+            if k not in keys:
+                keys.append(k)
+    columns = []
+    for k in keys:
+        missing = [i for i, rec in enumerate(records) if k not in rec]
+        values = [rec.get(k) for rec in records]
+        kind, payload = _pack_column(values) if not missing else ("json", values)
+        col = {"name": k, "kind": kind}
+        if missing:
+            col["missing"] = missing
+        if kind == "json":
+            col["values"] = payload
+        else:
+            col["blob"] = blobs.add(f"{name}.{k}", payload)
+        columns.append(col)
+    return {"count": len(records), "columns": columns}
+
+
+def _encode_save(data, compress=True):
+    """Encode a save dict (the shape :func:`save_world` builds) to bytes."""
+    blobs = _BlobWriter(compress)
+    world = data["world"]
+    meta = {
+        "scalars": {k: v for k, v in data.items()
+                    if k not in _ENTITY_TABLES and k not in ("world", "heights", "path_wear")},
+        "grid": {"rows": len(world), "cols": len(world[0]) if world else 0,
+                 "blob": blobs.add("world", bytes(bytearray(c for row in world for c in row)))},
+        "arrays": {},
+        "tables": {},
+    }
+    for key in ("heights", "path_wear"):
+        if key in data:
+            kind, payload = _pack_column(list(data[key]))
+            if kind == "json":
+                meta["arrays"][key] = {"kind": kind, "values": payload}
+            else:
+                meta["arrays"][key] = {"kind": kind, "blob": blobs.add(key, payload)}
+    for name in _ENTITY_TABLES:
+        if name in data:
+            meta["tables"][name] = _encode_table(name, data[name], blobs)
+    meta_raw = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    flags = 0
+    if compress:
+        meta_raw = zlib.compress(meta_raw, 6)
+        flags |= _FLAG_COMPRESSED
+    return b"".join([_HEADER.pack(_MAGIC, SAVE_VERSION, flags, len(meta_raw)), meta_raw]
+                    + blobs.parts)
+
+
+def _decode_save(raw):
+    """Decode a binary save back into the dict shape of a JSON save."""
+    magic, version, flags, meta_len = _HEADER.unpack_from(raw, 0)
+    if magic != _MAGIC:
+        raise ValueError("not a living world save")
+    if version != SAVE_VERSION:
+        raise ValueError(f"unsupported save version {version}")
+    start = _HEADER.size
+    meta_raw = raw[start:start + meta_len]
+    if flags & _FLAG_COMPRESSED:
+        meta_raw = zlib.decompress(meta_raw)
+    meta = json.loads(meta_raw.decode("utf-8"))
+    base = start + meta_len
+
+    def blob(entry):
+        chunk = raw[base + entry["off"]:base + entry["off"] + entry["len"]]
+        return zlib.decompress(chunk) if entry["z"] else bytes(chunk)
+
+    def column(desc):
+        kind = desc["kind"]
+        if kind == "json":
+            return desc["values"]
+        payload = blob(desc["blob"])
+        if kind == "bool":
+            return [bool(b) for b in payload]
+        return _array_values(_ARRAY_TYPECODES[kind], payload)
+
+    data = dict(meta["scalars"])
+    grid = meta["grid"]
+    cells = blob(grid["blob"])
+    cols = grid["cols"]
+    data["world"] = [list(cells[r * cols:(r + 1) * cols]) for r in range(grid["rows"])]
+    for key, desc in meta["arrays"].items():
+        data[key] = column(desc)
+    for name, table in meta["tables"].items():
+        records = [{} for _ in range(table["count"])]
+        for col in table["columns"]:
+            missing = set(col.get("missing", ()))
+            key = col["name"]
+            for i, v in enumerate(column(col)):
+                if i not in missing:
+                    records[i][key] = v
+        data[name] = records
+    return data
+
+
+def _write_save(data, path, compress=True):
+    """Atomically write ``data`` as a binary save.  Returns the path written."""
+    payload = _encode_save(data, compress=compress)
+    path = os.path.abspath(path)
+    dir_name = os.path.dirname(path)
+    os.makedirs(dir_name, exist_ok=True)
+    # Atomic write: write to temp file first, then replace
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
     try:
-        with open(path, "r") as fp:
-            data = json.load(fp)
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(payload)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+def read_save_file(path):
+    """Read the save at ``path``, falling back to its v1 JSON sibling.
+
+    Returns the data dict, or None when there is no save. Raises on I/O and
+    decoding errors, including unsupported versions.
+    """
+    for candidate in dict.fromkeys((os.path.abspath(path), _legacy_path(path))):
+        if not os.path.exists(candidate):
+            continue
+        with open(candidate, "rb") as fp:
+            raw = fp.read()
+        if raw[:len(_MAGIC)] == _MAGIC:
+            return _decode_save(raw)
+        data = json.loads(raw.decode("utf-8"))
         if data.get("version") != 1:
-            logger.warning("Incompatible save version, ignoring")
+            raise ValueError(f"unsupported save version {data.get('version')}")
+        return data
+    return None
+
+
+def load_world():
+    """Load world state (binary, or a v1 JSON save).  Returns the data dict or None."""
+    try:
+        data = read_save_file(_SAVE_PATH)
+        if data is None:
             return None
-        logger.info("World state loaded from %s", path)
+        logger.info("World state loaded (save version %s)", data.get("version"))
         return data
     except Exception as e:
         logger.warning("Failed to load world state: %s", e)
@@ -136,13 +357,13 @@ def load_world():
 
 
 def delete_save():
-    """Remove the save file after a successful load."""
-    path = os.path.abspath(_SAVE_PATH)
-    try:
-        if os.path.exists(path):
-            os.remove(path)
-    except Exception:
-        pass
+    """Remove the save file(s) after a successful load."""
+    for path in (os.path.abspath(_SAVE_PATH), _legacy_path(_SAVE_PATH)):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception:
+            pass
 
 
 def restore_entities(data):
@@ -163,7 +384,11 @@ def restore_entities(data):
                     continue
                 if hasattr(obj, k):
                     current = getattr(obj, k)
-                    if isinstance(current, tuple) and isinstance(v, list):
+                    # Colours come back from the save as lists; PIL only
+                    # takes tuples (bubble_color defaults to None, so the
+                    # current value alone cannot tell).
+                    if isinstance(v, list) and (isinstance(current, tuple)
+                                                or k.endswith("_color")):
                         setattr(obj, k, tuple(v))
                     else:
                         setattr(obj, k, v)
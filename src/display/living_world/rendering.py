@@ -124,9 +124,8 @@ def _render_clouds(pixels, clouds, ambient, camera_x):
                         _clamp((bg[2] * bg_weight + base_col[2] * fg_weight) // 10, 0, 255),
                     )
 
-def _render_terrain_and_water(pixels, world, heights, ambient, camera_x, path_wear, day_phase, sim_tick, season_info=None):
-    """Merged terrain + water render pass. Handles both block types in a single
-    iteration over the visible columns, avoiding a redundant second full pass."""
+def _terrain_colors(day_phase, season_info):
+    """Grass colour, leaf colour and day-phase tint for the terrain pass."""
     offset = _seasonal_color_offset(day_phase)
     # Compute blended seasonal colors for grass and leaves
     if season_info is not None:
@@ -144,41 +143,151 @@ def _render_terrain_and_water(pixels, world, heights, ambient, camera_x, path_we
     else:
         grass_color = BLOCK_COLORS[GRASS]
         leaf_color = BLOCK_COLORS[LEAF]
+    return grass_color, leaf_color, offset
+
+def _terrain_color(b, worn, ambient, grass_color, leaf_color, offset):
+    """Lit colour of a solid block, or None if it is not drawn."""
+    bc = BLOCK_COLORS.get(b)
+    if bc is None: return None
+    if b == GRASS and worn:
+        bc = BLOCK_COLORS[PATH_DIRT]
+    elif b == GRASS:
+        bc = grass_color
+    elif b == LEAF:
+        bc = leaf_color
+    c = _apply_ambient(bc, ambient)
+    if b in (GRASS, LEAF):
+        c = (_clamp(c[0] + offset[0], 0, 255),
+             _clamp(c[1] + offset[1], 0, 255),
+             _clamp(c[2] + offset[2], 0, 255))
+    return c
+
+def _water_pixel(c, shimmer, ambient):
+    """Per-frame shimmer (and night sparkle) on a lit water colour."""
+    c = (_clamp(c[0], 0, 255), _clamp(c[1], 0, 255), _clamp(c[2] + shimmer, 0, 255))
+    if ambient < 0.3 and random.random() < 0.05:
+        c = (_clamp(c[0] + 10, 0, 255), _clamp(c[1] + 15, 0, 255), _clamp(c[2] + 30, 0, 255))
+    return c
+
+def _water_shimmer(wx, sim_tick):
+    return int(15 * math.sin(wx * 0.5 + sim_tick * 0.15))
+
+def _render_terrain_and_water(pixels, world, heights, ambient, camera_x, path_wear, day_phase, sim_tick, season_info=None):
+    """Merged terrain + water render pass. Handles both block types in a single
+    iteration over the visible columns, avoiding a redundant second full pass.
+
+    This is the uncached pass; the main loop draws through a
+    :class:`TerrainLayer`, which produces the same pixels."""
+    grass_color, leaf_color, offset = _terrain_colors(day_phase, season_info)
     for sx in range(DISPLAY_WIDTH):
         wx = sx + camera_x
         if wx < 0 or wx >= WORLD_WIDTH: continue
+        shimmer = _water_shimmer(wx, sim_tick)
+        worn = path_wear[wx] >= 50
         for y in range(DISPLAY_HEIGHT):
             b = world[y][wx]
             if b == AIR: continue
             if b == WATER:
-                # Water rendering (was _render_water)
                 is_surface = (y == 0 or world[y - 1][wx] != WATER)
-                if is_surface:
-                    bc = WATER_SURFACE_COLOR
-                else:
-                    bc = BLOCK_COLORS[WATER]
-                shimmer = int(15 * math.sin(wx * 0.5 + sim_tick * 0.15))
-                c = _apply_ambient(bc, ambient)
-                c = (_clamp(c[0], 0, 255), _clamp(c[1], 0, 255), _clamp(c[2] + shimmer, 0, 255))
-                if ambient < 0.3 and random.random() < 0.05:
-                    c = (_clamp(c[0] + 10, 0, 255), _clamp(c[1] + 15, 0, 255), _clamp(c[2] + 30, 0, 255))
-                pixels[sx, y] = c
+                bc = WATER_SURFACE_COLOR if is_surface else BLOCK_COLORS[WATER]
+                pixels[sx, y] = _water_pixel(_apply_ambient(bc, ambient), shimmer, ambient)
             else:
-                # Terrain rendering (was _render_terrain)
-                bc = BLOCK_COLORS.get(b)
-                if bc is None: continue
-                if b == GRASS and path_wear[wx] >= 50:
-                    bc = BLOCK_COLORS[PATH_DIRT]
-                elif b == GRASS:
-                    bc = grass_color
-                elif b == LEAF:
-                    bc = leaf_color
-                c = _apply_ambient(bc, ambient)
-                if b in (GRASS, LEAF):
-                    c = (_clamp(c[0] + offset[0], 0, 255),
-                         _clamp(c[1] + offset[1], 0, 255),
-                         _clamp(c[2] + offset[2], 0, 255))
-                pixels[sx, y] = c
+                c = _terrain_color(b, worn, ambient, grass_color, leaf_color, offset)
+                if c is not None:
+                    pixels[sx, y] = c
+
+
+# Ambient is quantised to this step for the cached terrain layer, so a slow
+# dawn or dusk repaints the layer a few dozen times instead of every frame.
+TERRAIN_AMBIENT_STEP = 1.0 / 64
+
+
+class TerrainLayer:
+    """Cached, lit terrain for the whole world, blitted through the camera.
+
+    Solid blocks are drawn once into a world-wide RGBA layer (transparent
+    where there is air or water) and a frame just pastes the camera window
+    over the sky. A world column is redrawn only when it is dirty: a block
+    in it changed (found by diffing rows against a shadow copy, like
+    :class:`~.terrain.WaterSim`), its path wear crossed the worn-path
+    threshold, or :meth:`mark_dirty` was called. Every column is redrawn
+    when the quantised ambient, the season blend or the day-phase tint
+    changes. Water keeps its per-frame shimmer and sparkle, drawn from a
+    cached per-column list of lit water cells.
+    """
+
+    def __init__(self, world):
+        from PIL import Image
+        self.world = world
+        self.layer = Image.new("RGBA", (WORLD_WIDTH, DISPLAY_HEIGHT))
+        self._layer_px = self.layer.load()
+        self._shadow = [row[:] for row in world]
+        self._worn = [None] * WORLD_WIDTH
+        self._water = [()] * WORLD_WIDTH
+        self._dirty = set(range(WORLD_WIDTH))
+        self._key = None
+
+    def mark_dirty(self, x):
+        """Force world column ``x`` to be redrawn on the next frame."""
+        if 0 <= x < WORLD_WIDTH:
+            self._dirty.add(x)
+
+    def _sync_world_edits(self):
+        shadow = self._shadow
+        dirty = self._dirty
+        for y, row in enumerate(self.world):
+            old = shadow[y]
+            if row != old:
+                for x, (b, was) in enumerate(zip(row, old)):
+                    if b != was:
+                        dirty.add(x)
+                shadow[y] = row[:]
+
+    def _redraw_column(self, wx, worn, ambient, colors):
+        world, px = self.world, self._layer_px
+        water = []
+        clear = (0, 0, 0, 0)
+        for y in range(DISPLAY_HEIGHT):
+            b = world[y][wx]
+            if b == WATER:
+                is_surface = (y == 0 or world[y - 1][wx] != WATER)
+                bc = WATER_SURFACE_COLOR if is_surface else BLOCK_COLORS[WATER]
+                water.append((y, _apply_ambient(bc, ambient)))
+                px[wx, y] = clear
+                continue
+            c = None if b == AIR else _terrain_color(b, worn, ambient, *colors)
+            px[wx, y] = clear if c is None else c + (255,)
+        self._water[wx] = water
+        self._worn[wx] = worn
+
+    def render(self, image, ambient, camera_x, path_wear, day_phase, sim_tick, season_info=None):
+        """Draw terrain and water for the camera window onto ``image``."""
+        lit = round(ambient / TERRAIN_AMBIENT_STEP) * TERRAIN_AMBIENT_STEP
+        colors = _terrain_colors(day_phase, season_info)
+        key = (lit, colors)
+        if key != self._key:
+            self._key = key
+            self._dirty.update(range(WORLD_WIDTH))
+        self._sync_world_edits()
+        lo = max(0, camera_x)
+        hi = min(WORLD_WIDTH, camera_x + DISPLAY_WIDTH)
+        dirty = self._dirty
+        worn_cache = self._worn
+        for wx in range(lo, hi):
+            worn = path_wear[wx] >= 50
+            if wx in dirty or worn_cache[wx] != worn:
+                self._redraw_column(wx, worn, lit, colors)
+                dirty.discard(wx)
+        window = self.layer.crop((camera_x, 0, camera_x + DISPLAY_WIDTH, DISPLAY_HEIGHT))
+        image.paste(window, (0, 0), window)
+        pixels = image.load()
+        for wx in range(lo, hi):
+            water = self._water[wx]
+            if water:
+                sx = wx - camera_x
+                shimmer = _water_shimmer(wx, sim_tick)
+                for y, c in water:
+                    pixels[sx, y] = _water_pixel(c, shimmer, ambient)
 
 
 # Keep old names as aliases for backward compatibility
@@ -5,6 +5,7 @@ import random
 import logging
 import json
 import os
+import threading
 
 from PIL import Image
 
@@ -14,47 +15,30 @@ from .constants import (
     DISPLAY_WIDTH, DISPLAY_HEIGHT, WORLD_WIDTH,
     AIR, GRASS, WATER,
     FRAME_INTERVAL, FLOWER_COLORS,
-    CAMERA_FOLLOW_RE_EVAL, CAMERA_SMOOTH_SPEED,
-    FARM_GROWTH_CHECK_INTERVAL,
+    CAMERA_FOLLOW_RE_EVAL, CAMERA_SMOOTH_SPEED, AUTOSAVE_INTERVAL_TICKS,
 )
 from .utils import _clamp
 from .entities import Villager, Flower, Weather
 from .terrain import (
     _generate_height_profile, _fill_terrain, _flood_valleys,
     _guarantee_pond, _settle_water, _place_sand, _place_trees,
-    _generate_stars, _get_valley_cols, _simulate_water,
-)
-from .day_night import (
-    _compute_day_phase, _compute_ambient, _compute_season_transition,
-    _check_solar_eclipse, _check_lunar_eclipse,
-)
-from .constants import ECLIPSE_AMBIENT_MIN
-from .weather import (
-    _update_weather, _update_rain, _update_lightning,
-    _update_grass_fires, _update_water_levels,
-)
-from .structures import _update_structures, _claim_unowned_house
-from .villager_ai import (
-    _update_villagers, _maybe_spawn_villager, _handle_reproduction,
-    _handle_villager_aging, _respawn_if_empty,
+    _generate_stars, _get_valley_cols, WaterSim,
 )
+from .weather import _update_rain
 from .world_updates import (
-    _grow_trees, _move_clouds, _move_birds, _animate_bird_wings,
+    _move_clouds, _move_birds, _animate_bird_wings,
     _maybe_spawn_bird, _maybe_spawn_cloud,
     _update_fireflies, _emit_smoke, _update_smoke,
     _maybe_fish_jump, _update_fish_jumps,
-    _maybe_grow_flower, _update_torch_posts,
-    _flatten_around_houses,
-    _maybe_spawn_animal, _update_animals,
     _maybe_spawn_shooting_star, _update_shooting_stars,
-    _grow_crops,
     _update_snow,
-    _maybe_spawn_caravan, _update_caravans,
 )
+from .step import _simulate_tick, _world_clock
+from .catch_up import CatchUp, _catch_up_ticks
 from .rendering import (
     _render_sky, _render_sun_moon, _render_stars, _render_shooting_stars,
     _render_clouds,
-    _render_terrain_and_water, _render_flowers, _render_bridges,
+    TerrainLayer, _render_flowers, _render_bridges,
     _render_structures, _render_trees, _render_lumber_items,
     _render_villagers, _render_birds, _render_fish_jumps,
     _render_smoke, _render_fireflies, _render_rain,
@@ -62,10 +46,7 @@ from .rendering import (
     _render_animals, _render_farms, _render_snow,
     _render_boats, _render_caravans,
 )
-from .lighting import (
-    _apply_campfire_light, _apply_lantern_light,
-    _apply_watchtower_light, _apply_torch_post_light,
-)
+from .lighting import _apply_night_lights
 from .persistence import save_world, load_world, delete_save, restore_entities
 from .world_api import write_live_snapshot
 
@@ -218,6 +199,8 @@ def run(matrix, duration=900):
             fireflies, smoke_particles, fish_jumps = [], [], []
             rain_drops, grass_fires = [], []
             follow_target = None
+            water = WaterSim(world)
+            terrain_layer = TerrainLayer(world)
             delete_save()
             restored = True
             logger.info("Restored world from save (tick=%d, %d villagers)", sim_tick, len(villagers))
@@ -231,8 +214,9 @@ def run(matrix, duration=900):
         _fill_terrain(world, heights)
         _flood_valleys(world, heights)
         _guarantee_pond(heights, world)
-        _settle_water(world, ticks=20)
+        water = _settle_water(world, ticks=20)
         _place_sand(world)
+        terrain_layer = TerrainLayer(world)
         trees = _place_trees(heights, world)
         stars = _generate_stars()
         clouds, birds = [], []
@@ -276,6 +260,39 @@ def run(matrix, duration=900):
     # Wall-clock start of THIS run: the only clock the duration check uses.
     run_start = time.time()
     image = Image.new("RGB", (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+
+    def _world_state():
+        return dict(
+            villagers=villagers, structures=structures, trees=trees,
+            farms=farms, animals=animals, flowers=flowers,
+            lumber_items=lumber_items, weather=weather, heights=heights,
+            world=world, path_wear=path_wear, torch_posts=torch_posts,
+            grass_fires=grass_fires, caravans=caravans, water=water,
+        )
+
+    def _save():
+        save_world(
+            villagers=villagers, structures=structures, trees=trees,
+            farms=farms, heights=heights, world=world, weather=weather,
+            clouds=clouds, birds=birds, animals=animals,
+            shooting_stars=shooting_stars, fireflies=fireflies,
+            smoke_particles=smoke_particles, fish_jumps=fish_jumps,
+            flowers=flowers, rain_drops=rain_drops,
+            grass_fires=grass_fires, path_wear=path_wear,
+            torch_posts=torch_posts, lumber_items=lumber_items,
+            stars=stars, camera_x=camera_x, sim_tick=sim_tick,
+            start_time=start_time,
+        )
+
+    state = _world_state()
+    # The frame loop and the offline catch-up both mutate the world; each
+    # holds this lock while it does.
+    world_lock = threading.Lock()
+    catch_up = None
+    catch_up_ticks = _catch_up_ticks(saved) if restored else 0
+    if catch_up_ticks > 0:
+        catch_up = CatchUp(state, world_lock, sim_tick, _saved_elapsed,
+                           catch_up_ticks, camera_x).start()
     try:
         while not should_stop():
             if duration > 0 and time.time() - run_start >= duration:
@@ -284,14 +301,18 @@ def run(matrix, duration=900):
             if getattr(weather, '_reset_requested', False):
                 weather._reset_requested = False
                 logger.info("World reset requested -- regenerating")
+                if catch_up is not None:
+                    catch_up.stop()
+                    catch_up = None
                 seed = random.randint(0, 999999)
                 heights = _generate_height_profile(seed)
                 world = [[AIR] * WORLD_WIDTH for _ in range(DISPLAY_HEIGHT)]
                 _fill_terrain(world, heights)
                 _flood_valleys(world, heights)
                 _guarantee_pond(heights, world)
-                _settle_water(world, ticks=20)
+                water = _settle_water(world, ticks=20)
                 _place_sand(world)
+                terrain_layer = TerrainLayer(world)
                 trees = _place_trees(heights, world)
                 stars = _generate_stars()
                 clouds, birds = [], []
@@ -327,115 +348,97 @@ def run(matrix, duration=900):
                     if 0 <= sy < DISPLAY_HEIGHT and world[sy][x] == GRASS:
                         if not any(f.x == x for f in flowers):
                             flowers.append(Flower(x, sy, random.choice(FLOWER_COLORS)))
+                state = _world_state()
                 start_time = time.time()
                 continue
             frame_start = time.time()
-            elapsed = time.time() - start_time
-            day_phase = _compute_day_phase(elapsed)
-            ambient = _compute_ambient(day_phase)
-            # Eclipse ambient override
-            solar_eclipse = _check_solar_eclipse(elapsed, day_phase)
-            lunar_eclipse = _check_lunar_eclipse(elapsed, day_phase)
-            if solar_eclipse > 0:
-                ambient = max(ECLIPSE_AMBIENT_MIN, ambient * (1.0 - solar_eclipse * 0.9))
-            season_info = _compute_season_transition(elapsed)
-            current_season = season_info[0]
-            _update_weather(weather, sim_tick)
-            _move_clouds(clouds, weather)
-            _move_birds(birds, sim_tick, trees)
-            if sim_tick % 3 == 0:
-                _update_villagers(villagers, heights, world, trees, structures, lumber_items, flowers, path_wear, day_phase, sim_tick, weather, farms=farms, animals=animals)
-            if sim_tick % 4 == 0:
-                _simulate_water(world)
-                _animate_bird_wings(birds)
-            if sim_tick % 10 == 0:
-                _grow_trees(trees, heights, world, sim_tick, weather, structures, current_season=current_season)
-            if sim_tick % FARM_GROWTH_CHECK_INTERVAL == 0:
-                _grow_crops(farms, weather=weather, current_season=current_season)
-            if sim_tick % 90 == 0:
-                _maybe_spawn_bird(birds, day_phase, weather, camera_x)
-                _maybe_spawn_cloud(clouds, weather, camera_x)
-            if sim_tick % 2 == 0:
-                _update_fireflies(fireflies, day_phase, heights, trees, camera_x)
-                _update_animals(animals, heights, world, villagers, sim_tick)
-            _maybe_spawn_shooting_star(shooting_stars, ambient)
-            _update_shooting_stars(shooting_stars)
-            _maybe_spawn_animal(animals, heights, world, sim_tick, villagers, current_season=current_season)
-            _maybe_spawn_caravan(caravans, heights, world, sim_tick, villagers)
-            _update_caravans(caravans, heights, world, villagers, sim_tick)
-            if sim_tick % 3 == 0:
-                _emit_smoke(smoke_particles, structures, camera_x)
-                _update_smoke(smoke_particles)
-            if sim_tick % 200 == 0:
-                _maybe_fish_jump(fish_jumps, world, heights, day_phase, camera_x)
-            _update_fish_jumps(fish_jumps)
-            if sim_tick % 500 == 0:
-                _maybe_grow_flower(flowers, heights, world, trees, camera_x, weather, current_season=current_season)
-            _maybe_spawn_villager(villagers, heights, world, structures, trees, sim_tick)
-            _handle_reproduction(villagers, heights, world, structures, sim_tick)
-            _handle_villager_aging(villagers, structures, farms=farms)
-            _respawn_if_empty(villagers, heights, world, structures)
-            _update_structures(structures, villagers)
-            _update_rain(rain_drops, weather, heights, world, camera_x)
-            _update_lightning(weather, trees, grass_fires, heights, world, camera_x, sim_tick, structures=structures)
-            _update_grass_fires(grass_fires)
-            _update_water_levels(world, heights, weather, sim_tick)
-            _update_torch_posts(torch_posts, path_wear, heights, structures, sim_tick)
-            _flatten_around_houses(structures, heights, world, villagers, sim_tick, day_phase)
-            for it in lumber_items: it.age += 1
-            lumber_items[:] = [it for it in lumber_items if it.age < 5400]
-            if sim_tick % CAMERA_FOLLOW_RE_EVAL == 0:
-                follow_target = _select_follow_target(villagers, structures)
-            if follow_target is not None:
-                camera_x = _update_camera(camera_x, int(follow_target.x), sim_tick)
-            pixels = image.load()
-            _render_sky(pixels, day_phase, weather, camera_x)
-            _render_sun_moon(pixels, day_phase, elapsed)
-            _render_stars(pixels, stars, ambient, sim_tick)
-            _render_shooting_stars(pixels, shooting_stars, ambient)
-            _render_clouds(pixels, clouds, ambient, camera_x)
-            _render_terrain_and_water(pixels, world, heights, ambient, camera_x, path_wear, day_phase, sim_tick, season_info=season_info)
-            _render_flowers(pixels, flowers, ambient, camera_x)
-            _render_bridges(pixels, structures, ambient, camera_x)
-            _render_structures(pixels, structures, ambient, sim_tick, camera_x, day_phase)
-            _render_trees(pixels, trees, ambient, sim_tick, camera_x, weather, day_phase, season_info=season_info)
-            _render_lumber_items(pixels, lumber_items, ambient, camera_x)
-            _render_farms(pixels, farms, ambient, camera_x)
-            _render_villagers(pixels, villagers, ambient, sim_tick, camera_x)
-            # Render active boats from villagers
-            active_boats = [v.boat for v in villagers if v.boat is not None and v.boat.active]
-            _render_boats(pixels, active_boats, ambient, camera_x)
-            _render_caravans(pixels, caravans, ambient, camera_x)
-            _render_animals(pixels, animals, heights, ambient, camera_x)
-            _render_birds(pixels, birds, ambient, sim_tick, camera_x)
-            _render_fish_jumps(pixels, fish_jumps, camera_x)
-            _render_smoke(pixels, smoke_particles, ambient, camera_x)
-            _render_fireflies(pixels, fireflies, sim_tick, camera_x)
-            _render_rain(pixels, rain_drops, camera_x)
-            _update_snow(snow_flakes, heights, world, camera_x, current_season)
-            _render_snow(pixels, snow_flakes, camera_x)
-            _render_grass_fires(pixels, grass_fires, camera_x)
-            _render_torch_posts(pixels, torch_posts, ambient, camera_x)
-            _render_lightning(pixels, weather)
-            _apply_campfire_light(pixels, structures, ambient, camera_x)
-            _apply_lantern_light(pixels, structures, ambient, camera_x)
-            _apply_watchtower_light(pixels, structures, ambient, camera_x)
-            _apply_torch_post_light(pixels, torch_posts, ambient, camera_x)
-            matrix.SetImage(image)
-            # --- Live snapshot for web UI (every ~3s) ---
-            if sim_tick % 54 == 0:  # ~3s at 18fps
-                write_live_snapshot(
-                    villagers=villagers, structures=structures, trees=trees,
-                    farms=farms, animals=animals, heights=heights,
-                    weather=weather, camera_x=camera_x, sim_tick=sim_tick,
-                )
-            # --- Check for web UI commands (non-disruptive, throttled) ---
-            lw_cmd = None
-            if sim_tick % 30 == 0:
-                lw_cmd = _check_living_world_command()
-            if lw_cmd is not None:
-                _apply_living_world_command(lw_cmd, weather, villagers, heights, world, structures, sim_tick, start_time)
-            sim_tick += 1
+            world_lock.acquire()
+            try:
+                if catch_up is not None and not catch_up.running:
+                    sim_tick, start_time = catch_up.sim_tick, time.time() - catch_up.elapsed
+                    catch_up = None
+                if catch_up is not None:
+                    # Fast-forwarding: the catch-up owns the world clock and
+                    # tick; sim_tick only paces the visual effects meanwhile.
+                    elapsed = catch_up.elapsed
+                else:
+                    elapsed = time.time() - start_time
+                day_phase, ambient, season_info = _world_clock(elapsed)
+                current_season = season_info[0]
+                if catch_up is None:
+                    _simulate_tick(state, sim_tick, day_phase, current_season, camera_x)
+                _move_clouds(clouds, weather)
+                _move_birds(birds, sim_tick, trees)
+                if sim_tick % 4 == 0:
+                    _animate_bird_wings(birds)
+                if sim_tick % 90 == 0:
+                    _maybe_spawn_bird(birds, day_phase, weather, camera_x)
+                    _maybe_spawn_cloud(clouds, weather, camera_x)
+                if sim_tick % 2 == 0:
+                    _update_fireflies(fireflies, day_phase, heights, trees, camera_x)
+                _maybe_spawn_shooting_star(shooting_stars, ambient)
+                _update_shooting_stars(shooting_stars)
+                if sim_tick % 3 == 0:
+                    _emit_smoke(smoke_particles, structures, camera_x)
+                    _update_smoke(smoke_particles)
+                if sim_tick % 200 == 0:
+                    _maybe_fish_jump(fish_jumps, world, heights, day_phase, camera_x)
+                _update_fish_jumps(fish_jumps)
+                _update_rain(rain_drops, weather, heights, world, camera_x)
+                if sim_tick % CAMERA_FOLLOW_RE_EVAL == 0:
+                    follow_target = _select_follow_target(villagers, structures)
+                if follow_target is not None:
+                    camera_x = _update_camera(camera_x, int(follow_target.x), sim_tick)
+                pixels = image.load()
+                _render_sky(pixels, day_phase, weather, camera_x)
+                _render_sun_moon(pixels, day_phase, elapsed)
+                _render_stars(pixels, stars, ambient, sim_tick)
+                _render_shooting_stars(pixels, shooting_stars, ambient)
+                _render_clouds(pixels, clouds, ambient, camera_x)
+                terrain_layer.render(image, ambient, camera_x, path_wear, day_phase, sim_tick, season_info=season_info)
+                _render_flowers(pixels, flowers, ambient, camera_x)
+                _render_bridges(pixels, structures, ambient, camera_x)
+                _render_structures(pixels, structures, ambient, sim_tick, camera_x, day_phase)
+                _render_trees(pixels, trees, ambient, sim_tick, camera_x, weather, day_phase, season_info=season_info)
+                _render_lumber_items(pixels, lumber_items, ambient, camera_x)
+                _render_farms(pixels, farms, ambient, camera_x)
+                _render_villagers(pixels, villagers, ambient, sim_tick, camera_x)
+                # Render active boats from villagers
+                active_boats = [v.boat for v in villagers if v.boat is not None and v.boat.active]
+                _render_boats(pixels, active_boats, ambient, camera_x)
+                _render_caravans(pixels, caravans, ambient, camera_x)
+                _render_animals(pixels, animals, heights, ambient, camera_x)
+                _render_birds(pixels, birds, ambient, sim_tick, camera_x)
+                _render_fish_jumps(pixels, fish_jumps, camera_x)
+                _render_smoke(pixels, smoke_particles, ambient, camera_x)
+                _render_fireflies(pixels, fireflies, sim_tick, camera_x)
+                _render_rain(pixels, rain_drops, camera_x)
+                _update_snow(snow_flakes, heights, world, camera_x, current_season)
+                _render_snow(pixels, snow_flakes, camera_x)
+                _render_grass_fires(pixels, grass_fires, camera_x)
+                _render_torch_posts(pixels, torch_posts, ambient, camera_x)
+                _render_lightning(pixels, weather)
+                _apply_night_lights(image, structures, torch_posts, ambient, camera_x)
+                matrix.SetImage(image)
+                # --- Live snapshot for web UI (every ~3s) ---
+                if sim_tick % 54 == 0:  # ~3s at 18fps
+                    write_live_snapshot(
+                        villagers=villagers, structures=structures, trees=trees,
+                        farms=farms, animals=animals, heights=heights,
+                        weather=weather, camera_x=camera_x, sim_tick=sim_tick,
+                    )
+                # --- Check for web UI commands (non-disruptive, throttled) ---
+                lw_cmd = None
+                if sim_tick % 30 == 0:
+                    lw_cmd = _check_living_world_command()
+                if lw_cmd is not None:
+                    _apply_living_world_command(lw_cmd, weather, villagers, heights, world, structures, sim_tick, start_time)
+                # --- Periodic autosave (not mid catch-up: its clock is still moving) ---
+                if catch_up is None and sim_tick and sim_tick % AUTOSAVE_INTERVAL_TICKS == 0:
+                    _save()
+                sim_tick += 1
+            finally:
+                world_lock.release()
             frame_elapsed = time.time() - frame_start
             sleep_time = FRAME_INTERVAL - frame_elapsed
             if sleep_time > 0:
@@ -443,20 +446,13 @@ def run(matrix, duration=900):
     except Exception as e:
         logger.error("Error in living_world: %s", e, exc_info=True)
     finally:
+        if catch_up is not None:
+            # Keep whatever the catch-up got through.
+            catch_up.stop()
+            sim_tick, start_time = catch_up.sim_tick, time.time() - catch_up.elapsed
         # --- Save world state for next run ---
         try:
-            save_world(
-                villagers=villagers, structures=structures, trees=trees,
-                farms=farms, heights=heights, world=world, weather=weather,
-                clouds=clouds, birds=birds, animals=animals,
-                shooting_stars=shooting_stars, fireflies=fireflies,
-                smoke_particles=smoke_particles, fish_jumps=fish_jumps,
-                flowers=flowers, rain_drops=rain_drops,
-                grass_fires=grass_fires, path_wear=path_wear,
-                torch_posts=torch_posts, lumber_items=lumber_items,
-                stars=stars, camera_x=camera_x, sim_tick=sim_tick,
-                start_time=start_time,
-            )
+            _save()
         except Exception as save_err:
             logger.warning("Could not save world: %s", save_err)
         try:
@@ -0,0 +1,157 @@
+"""Column-bucketed spatial index for world entity lists.
+
+Villager AI, the site finders and the light passes keep asking "what is
+near column x?" and "how many campfires are there?". Answering each of
+those with a scan of the whole ``structures``/``trees``/``animals`` list
+made every tick slower the longer a world lived. A :class:`ColumnIndex`
+answers them from buckets of ``BUCKET_WIDTH`` columns plus per-kind lists,
+so a query touches only the entities in the columns it asks about.
+
+Each entity list has one index, fetched with :func:`column_index`, and it
+follows the list as the world changes:
+
+* appended entities are picked up by the next query (an O(1) check of the
+  list's length and last element when nothing changed);
+* removals and filters such as ``animals[:] = [...]`` trigger a rebuild;
+* entities that change column call :meth:`ColumnIndex.move` (animals,
+  and houses that widen and shift left when upgraded -- trees, farms and
+  fires never move once placed);
+* a slot overwritten in place (a dead tree regrowing elsewhere) goes
+  through :meth:`ColumnIndex.replace`, since ``refresh`` cannot see it.
+
+Lists are otherwise only ever appended to or filtered in this package;
+inserting into the middle of an indexed list is not supported.
+"""
+
+import math
+from operator import itemgetter
+
+from .constants import WORLD_WIDTH
+
+BUCKET_WIDTH = 8
+_NUM_BUCKETS = (WORLD_WIDTH + BUCKET_WIDTH - 1) // BUCKET_WIDTH
+
+# Indexes by (id(list), kind attribute); the list itself is kept alongside
+# so its id cannot be reused while the entry exists. Old worlds' lists fall
+# out once newer ones push them past the cap.
+_MAX_INDEXES = 32
+_indexes = {}
+
+
+def _bucket_of(x):
+    return min(_NUM_BUCKETS - 1, max(0, int(x) // BUCKET_WIDTH))
+
+
+class ColumnIndex:
+    """Entities of one list bucketed by column and grouped by kind.
+
+    ``kind_attr`` names the attribute used for :meth:`count` and
+    :meth:`of_kind` (``"type"`` for structures, ``"animal_type"`` for
+    animals). Query results are always in list order, so code switching
+    from a list scan keeps its tie-breaking.
+    """
+
+    def __init__(self, entities, kind_attr="type"):
+        self.entities = entities
+        self.kind_attr = kind_attr
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-index the whole list."""
+        self._buckets = [[] for _ in range(_NUM_BUCKETS)]
+        self._kinds = {}
+        self._where = {}       # id(entity) -> [seq, bucket]
+        self._size = 0
+        self._last = None
+        self._next_seq = 0
+        self._add(self.entities)
+
+    def _add(self, new_entities):
+        kind_attr = self.kind_attr
+        for e in new_entities:
+            seq = self._next_seq
+            self._next_seq += 1
+            bucket = _bucket_of(e.x)
+            self._buckets[bucket].append((seq, e))
+            self._where[id(e)] = [seq, bucket]
+            kind = getattr(e, kind_attr, None)
+            self._kinds.setdefault(kind, []).append(e)
+        self._size = len(self.entities)
+        self._last = self.entities[-1] if self.entities else None
+
+    def refresh(self):
+        """Bring the index up to date with its list (cheap when unchanged)."""
+        entities = self.entities
+        n = len(entities)
+        size = self._size
+        if n == size and (n == 0 or entities[-1] is self._last):
+            return self
+        if size and n > size and entities[size - 1] is self._last:
+            self._add(entities[size:])
+        else:
+            self.rebuild()
+        return self
+
+    def move(self, entity):
+        """Re-bucket ``entity`` after its ``x`` changed."""
+        self.refresh()
+        where = self._where.get(id(entity))
+        if where is None:
+            return
+        bucket = _bucket_of(entity.x)
+        seq, old = where
+        if bucket != old:
+            self._buckets[old].remove((seq, entity))
+            self._buckets[bucket].append((seq, entity))
+            where[1] = bucket
+
+    def replace(self, i, entity):
+        """Overwrite slot ``i`` of the list with ``entity`` and re-index."""
+        self.entities[i] = entity
+        self.rebuild()
+
+    def in_range(self, lo, hi):
+        """Entities with ``lo <= x <= hi``, in list order."""
+        self.refresh()
+        first = _bucket_of(max(0, math.floor(lo)))
+        last = _bucket_of(max(0, math.floor(hi)))
+        if hi < 0:
+            last = -1
+        hits = []
+        for bucket in self._buckets[first:last + 1]:
+            for seq, e in bucket:
+                if lo <= e.x <= hi:
+                    hits.append((seq, e))
+        if len(hits) > 1:
+            hits.sort(key=itemgetter(0))
+        return [e for _, e in hits]
+
+    def near(self, x, radius):
+        """Entities within ``radius`` columns of ``x``, in list order."""
+        return self.in_range(x - radius, x + radius)
+
+    def of_kind(self, kind):
+        """All entities of one kind, in list order."""
+        self.refresh()
+        return self._kinds.get(kind, ())
+
+    def count(self, kind):
+        """Number of entities of one kind."""
+        self.refresh()
+        return len(self._kinds.get(kind, ()))
+
+    def __len__(self):
+        return len(self.refresh().entities)
+
+
+def column_index(entities, kind_attr="type"):
+    """Return the (refreshed) index for an entity list, creating it once."""
+    key = (id(entities), kind_attr)
+    entry = _indexes.get(key)
+    if entry is not None and entry[0] is entities:
+        return entry[1].refresh()
+    index = ColumnIndex(entities, kind_attr)
+    _indexes[key] = (entities, index)
+    while len(_indexes) > _MAX_INDEXES:
+        del _indexes[next(iter(_indexes))]
+    return index
@@ -0,0 +1,87 @@
+"""Render-free simulation step.
+
+:func:`_simulate_tick` advances everything that persists in a save --
+villagers, structures, terrain, water, trees, farms, animals, weather --
+by one tick, without touching the purely visual effects (clouds, birds,
+fireflies, smoke, rain drops, snow, shooting stars, fish) or the camera.
+The frame loop calls it every frame before rendering, and the offline
+catch-up (:mod:`.catch_up`) calls it thousands of times in a row.
+
+World state travels in a plain dict with the keys :func:`restore_entities`
+returns plus ``grass_fires``, ``caravans`` and ``water`` (a
+:class:`~.terrain.WaterSim`).
+"""
+
+from .constants import ECLIPSE_AMBIENT_MIN, FARM_GROWTH_CHECK_INTERVAL
+from .day_night import (
+    _compute_day_phase, _compute_ambient, _compute_season_transition,
+    _check_solar_eclipse,
+)
+from .weather import (
+    _update_weather, _update_lightning, _update_grass_fires,
+    _update_water_levels,
+)
+from .structures import _update_structures
+from .villager_ai import (
+    _update_villagers, _maybe_spawn_villager, _handle_reproduction,
+    _handle_villager_aging, _respawn_if_empty,
+)
+from .world_updates import (
+    _grow_trees, _maybe_grow_flower, _update_torch_posts,
+    _flatten_around_houses, _maybe_spawn_animal, _update_animals,
+    _grow_crops, _maybe_spawn_caravan, _update_caravans,
+)
+
+
+def _world_clock(elapsed):
+    """Day phase, ambient light and season transition at ``elapsed`` seconds."""
+    day_phase = _compute_day_phase(elapsed)
+    ambient = _compute_ambient(day_phase)
+    # Eclipse ambient override
+    solar_eclipse = _check_solar_eclipse(elapsed, day_phase)
+    if solar_eclipse > 0:
+        ambient = max(ECLIPSE_AMBIENT_MIN, ambient * (1.0 - solar_eclipse * 0.9))
+    return day_phase, ambient, _compute_season_transition(elapsed)
+
+
+def _simulate_tick(state, sim_tick, day_phase, current_season, camera_x):
+    """Advance the persistent world one tick (no rendering)."""
+    villagers = state["villagers"]
+    structures = state["structures"]
+    trees = state["trees"]
+    farms = state["farms"]
+    animals = state["animals"]
+    heights = state["heights"]
+    world = state["world"]
+    weather = state["weather"]
+    path_wear = state["path_wear"]
+    lumber_items = state["lumber_items"]
+    grass_fires = state["grass_fires"]
+    _update_weather(weather, sim_tick)
+    if sim_tick % 3 == 0:
+        _update_villagers(villagers, heights, world, trees, structures, lumber_items, state["flowers"], path_wear, day_phase, sim_tick, weather, farms=farms, animals=animals)
+    if sim_tick % 4 == 0:
+        state["water"].step()
+    if sim_tick % 10 == 0:
+        _grow_trees(trees, heights, world, sim_tick, weather, structures, current_season=current_season)
+    if sim_tick % FARM_GROWTH_CHECK_INTERVAL == 0:
+        _grow_crops(farms, weather=weather, current_season=current_season)
+    if sim_tick % 2 == 0:
+        _update_animals(animals, heights, world, villagers, sim_tick)
+    _maybe_spawn_animal(animals, heights, world, sim_tick, villagers, current_season=current_season)
+    _maybe_spawn_caravan(state["caravans"], heights, world, sim_tick, villagers)
+    _update_caravans(state["caravans"], heights, world, villagers, sim_tick)
+    if sim_tick % 500 == 0:
+        _maybe_grow_flower(state["flowers"], heights, world, trees, camera_x, weather, current_season=current_season)
+    _maybe_spawn_villager(villagers, heights, world, structures, trees, sim_tick)
+    _handle_reproduction(villagers, heights, world, structures, sim_tick)
+    _handle_villager_aging(villagers, structures, farms=farms)
+    _respawn_if_empty(villagers, heights, world, structures)
+    _update_structures(structures, villagers)
+    _update_lightning(weather, trees, grass_fires, heights, world, camera_x, sim_tick, structures=structures)
+    _update_grass_fires(grass_fires)
+    _update_water_levels(world, heights, weather, sim_tick)
+    _update_torch_posts(state["torch_posts"], path_wear, heights, structures, sim_tick)
+    _flatten_around_houses(structures, heights, world, villagers, sim_tick, day_phase)
+    for it in lumber_items: it.age += 1
+    lumber_items[:] = [it for it in lumber_items if it.age < 5400]
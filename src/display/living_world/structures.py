@@ -7,16 +7,24 @@ from .constants import (
     BRIDGE_MAX_GAP, WATER, GRASS, DIRT, STONE, AIR, MINE_MAX_DEPTH,
     CAMPFIRE_LOW_FUEL_THRESHOLD, CREMATION_FLASH_FRAMES,
     WELL_FIRE_PREVENTION_RADIUS, WELL_MIN_SPACING,
+    HOUSE_DIMENSIONS, CASTLE_WIDTH, BANK_WIDTH, STORAGE_WIDTH,
 )
 from .utils import _clamp
 from .terrain import _get_valley_cols
+from .spatial import column_index
+
+# Widest a structure can be; "is anything within its width of x?" checks
+# query the column index this far either side and then test exactly.
+STRUCTURE_REACH = max(
+    BRIDGE_MAX_GAP, CASTLE_WIDTH, BANK_WIDTH, STORAGE_WIDTH,
+    max(w for w, _ in HOUSE_DIMENSIONS.values()),
+) + 2
 
 
 def _min_campfire_distance(x, structures):
     md = 999
-    for s in structures:
-        if s.type == "campfire":
-            md = min(md, abs(s.x - x))
+    for s in column_index(structures).of_kind("campfire"):
+        md = min(md, abs(s.x - x))
     return md
 
 def _find_water_gap(world, heights, start_x, direction):
@@ -54,8 +62,8 @@ def _find_water_gap(world, heights, start_x, direction):
 
 def _find_bridge_at(x, structures):
     """Check if a bridge covers column x. Returns the bridge Structure or None."""
-    for s in structures:
-        if s.type == "bridge" and s.x <= x < s.x + s.width:
+    for s in column_index(structures).of_kind("bridge"):
+        if s.x <= x < s.x + s.width:
             return s
     return None
 
@@ -63,11 +71,13 @@ def _find_campfire_site(structures, trees, heights, world):
     vc = _get_valley_cols(world)
     cands = list(range(8, WORLD_WIDTH - 8))
     random.shuffle(cands)
+    structure_index = column_index(structures)
+    tree_index = column_index(trees)
     for x in cands:
         if x in vc: continue
         if _min_campfire_distance(x, structures) < CAMPFIRE_MIN_SPACING: continue
-        if any(s.type in ("house_small", "house_large") and abs(s.x - x) < 3 for s in structures): continue
-        if any(t.alive and abs(t.x - x) < 3 for t in trees): continue
+        if any(s.type in ("house_small", "house_large") and abs(s.x - x) < 3 for s in structure_index.near(x, 3)): continue
+        if any(t.alive and abs(t.x - x) < 3 for t in tree_index.near(x, 3)): continue
         h = heights[x]
         if 0 <= h < DISPLAY_HEIGHT and world[h][x] == GRASS: return x
     return None
@@ -76,6 +86,8 @@ def _find_build_site(structures, trees, heights, world, w, h):
     vc = _get_valley_cols(world)
     cands = list(range(4, WORLD_WIDTH - w - 4))
     random.shuffle(cands)
+    structure_index = column_index(structures)
+    tree_index = column_index(trees)
     for x in cands:
         ok = True
         for dx in range(w):
@@ -86,8 +98,8 @@ def _find_build_site(structures, trees, heights, world, w, h):
             if abs(ch - heights[x]) > 2: ok = False; break
             if 0 <= ch < DISPLAY_HEIGHT and world[ch][cx] == WATER: ok = False; break
         if not ok: continue
-        if any(abs(s.x - x) < s.width + 2 for s in structures): continue
-        if any(t.alive and abs(t.x - x) < 4 for t in trees): continue
+        if any(abs(s.x - x) < s.width + 2 for s in structure_index.near(x, STRUCTURE_REACH)): continue
+        if any(t.alive and abs(t.x - x) < 4 for t in tree_index.near(x, 4)): continue
         sy = heights[x] - h
         if sy < 2: continue
         return (x, sy)
@@ -97,17 +109,19 @@ def _find_mine_site(structures, trees, heights, world, near_x):
     vc = _get_valley_cols(world)
     cands = list(range(max(4, near_x - 20), min(WORLD_WIDTH - 4, near_x + 20)))
     random.shuffle(cands)
+    structure_index = column_index(structures)
+    tree_index = column_index(trees)
     for x in cands:
         if x in vc: continue
-        if any(s.type == "mine" and abs(s.x - x) < 5 for s in structures): continue
-        if any(t.alive and abs(t.x - x) < 3 for t in trees): continue
+        if any(s.type == "mine" and abs(s.x - x) < 5 for s in structure_index.near(x, 5)): continue
+        if any(t.alive and abs(t.x - x) < 3 for t in tree_index.near(x, 3)): continue
         h = heights[x]
         if 0 <= h < DISPLAY_HEIGHT and world[h][x] in (GRASS, DIRT): return x
     return None
 
 def _has_mine_at(x, structures):
-    for s in structures:
-        if s.type == "mine" and s.x == x:
+    for s in column_index(structures).of_kind("mine"):
+        if s.x == x:
             return True
     return False
 
@@ -148,8 +162,8 @@ def _level_foundation(x, width, heights, world, villager, structures):
 
 def _is_protected_by_well(x, structures):
     """Check if column x is within the fire prevention radius of any well."""
-    for s in structures:
-        if s.type == "well" and abs(s.x - x) <= WELL_FIRE_PREVENTION_RADIUS:
+    for s in column_index(structures).of_kind("well"):
+        if abs(s.x - x) <= WELL_FIRE_PREVENTION_RADIUS:
             return True
     return False
 
@@ -167,17 +181,19 @@ def _find_well_site(structures, trees, heights, world, near_x):
     vc = _get_valley_cols(world)
     cands = list(range(max(4, near_x - 25), min(WORLD_WIDTH - 4, near_x + 25)))
     random.shuffle(cands)
+    structure_index = column_index(structures)
+    tree_index = column_index(trees)
     for x in cands:
         if x in vc:
             continue
         # Check well spacing
-        if any(s.type == "well" and abs(s.x - x) < WELL_MIN_SPACING for s in structures):
+        if any(abs(s.x - x) < WELL_MIN_SPACING for s in structure_index.of_kind("well")):
             continue
         # Not too close to other structures
-        if any(abs(s.x - x) < 3 for s in structures):
+        if any(abs(s.x - x) < 3 for s in structure_index.near(x, 3)):
             continue
         # Not too close to trees
-        if any(t.alive and abs(t.x - x) < 3 for t in trees):
+        if any(t.alive and abs(t.x - x) < 3 for t in tree_index.near(x, 3)):
             continue
         h = heights[x]
         if 0 <= h < DISPLAY_HEIGHT and world[h][x] == GRASS:
@@ -191,6 +207,8 @@ def _find_storage_site(structures, trees, heights, world, near_x):
     vc = _get_valley_cols(world)
     cands = list(range(max(4, near_x - 20), min(WORLD_WIDTH - STORAGE_WIDTH - 4, near_x + 20)))
     random.shuffle(cands)
+    structure_index = column_index(structures)
+    tree_index = column_index(trees)
     for x in cands:
         ok = True
         for dx in range(STORAGE_WIDTH):
@@ -201,8 +219,8 @@ def _find_storage_site(structures, trees, heights, world, near_x):
             if abs(ch - heights[x]) > 1: ok = False; break
             if 0 <= ch < DISPLAY_HEIGHT and world[ch][cx] == WATER: ok = False; break
         if not ok: continue
-        if any(abs(s.x - x) < s.width + 2 for s in structures): continue
-        if any(t.alive and abs(t.x - x) < 3 for t in trees): continue
+        if any(abs(s.x - x) < s.width + 2 for s in structure_index.near(x, STRUCTURE_REACH)): continue
+        if any(t.alive and abs(t.x - x) < 3 for t in tree_index.near(x, 3)): continue
         sy = heights[x]
         if 0 <= sy < DISPLAY_HEIGHT:
             return (x, sy - 3)  # 3 = STORAGE_HEIGHT
@@ -215,6 +233,8 @@ def _find_bank_site(structures, trees, heights, world, near_x):
     vc = _get_valley_cols(world)
     cands = list(range(max(4, near_x - 20), min(WORLD_WIDTH - BANK_WIDTH - 4, near_x + 20)))
     random.shuffle(cands)
+    structure_index = column_index(structures)
+    tree_index = column_index(trees)
     for x in cands:
         ok = True
         for dx in range(BANK_WIDTH):
@@ -225,8 +245,8 @@ def _find_bank_site(structures, trees, heights, world, near_x):
             if abs(ch - heights[x]) > 1: ok = False; break
             if 0 <= ch < DISPLAY_HEIGHT and world[ch][cx] == WATER: ok = False; break
         if not ok: continue
-        if any(abs(s.x - x) < s.width + 2 for s in structures): continue
-        if any(t.alive and abs(t.x - x) < 3 for t in trees): continue
+        if any(abs(s.x - x) < s.width + 2 for s in structure_index.near(x, STRUCTURE_REACH)): continue
+        if any(t.alive and abs(t.x - x) < 3 for t in tree_index.near(x, 3)): continue
         sy = heights[x]
         if 0 <= sy < DISPLAY_HEIGHT:
             return (x, sy - BANK_HEIGHT)
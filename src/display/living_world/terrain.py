@@ -97,32 +97,119 @@ def _guarantee_pond(heights, world):
             if 0 <= y < DISPLAY_HEIGHT and world[y][x] == AIR:
                 world[y][x] = WATER
 
-def _simulate_water(world):
-    for y in range(DISPLAY_HEIGHT-2,-1,-1):
-        for x in range(WORLD_WIDTH):
-            if world[y][x] != WATER: continue
-            if y+1 < DISPLAY_HEIGHT and world[y+1][x] == AIR:
-                world[y+1][x] = WATER; world[y][x] = AIR; continue
-            if y+1 < DISPLAY_HEIGHT and world[y+1][x] != AIR:
-                dirs = [1,-1] if random.random() < 0.5 else [-1,1]
-                moved = False
-                for d in dirs:
-                    nx = x+d
-                    if 0 < nx < WORLD_WIDTH-1 and world[y][nx] == AIR:
-                        world[y][nx] = WATER; world[y][x] = AIR; moved = True; break
-                if moved: continue
-    for x in range(1, WORLD_WIDTH-1):
-        for y in range(DISPLAY_HEIGHT):
-            if world[y][x] != WATER: continue
+class WaterSim:
+    """Active-cell water engine for a ``world[y][x]`` block grid.
+
+    Only water cells that might move are visited: the set starts with every
+    water cell, a cell that can neither fall nor spread drops out, and a
+    cell is woken again when anything in its 3x3 neighbourhood changes.
+    Changes made by the rest of the simulation (rain, evaporation, digging,
+    terrain flattening) are found by comparing each row against a shadow
+    copy, which costs one list comparison per row when nothing changed, so
+    ponds at rest cost almost nothing per step.
+
+    The per-cell rules and visiting order are those of the original full
+    scan: fall into air below, else slide sideways into air; then surface
+    water drifts sideways onto non-water ground with 30% chance.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self._shadow = [row[:] for row in world]
+        self._active = set()
+        self.wake_all()
+
+    @property
+    def settled(self):
+        """True when no water cell can move until something changes."""
+        return not self._active
+
+    def wake_all(self):
+        """Mark every water cell as possibly unsettled."""
+        for y, row in enumerate(self.world):
+            if WATER in row:
+                self._active.update((x, y) for x, b in enumerate(row) if b == WATER)
+
+    def wake(self, x, y):
+        """Mark the water around ``(x, y)`` as possibly unsettled."""
+        world = self.world
+        active = self._active
+        for ny in (y - 1, y, y + 1):
+            if 0 <= ny < DISPLAY_HEIGHT:
+                row = world[ny]
+                for nx in (x - 1, x, x + 1):
+                    if 0 <= nx < WORLD_WIDTH and row[nx] == WATER:
+                        active.add((nx, ny))
+
+    def _sync_external_edits(self):
+        shadow = self._shadow
+        for y, row in enumerate(self.world):
+            old = shadow[y]
+            if row != old:
+                for x, (b, was) in enumerate(zip(row, old)):
+                    if b != was:
+                        self.wake(x, y)
+                shadow[y] = row[:]
+
+    def _move(self, x, y, nx, ny):
+        world, shadow = self.world, self._shadow
+        world[ny][nx] = WATER
+        world[y][x] = AIR
+        shadow[ny][nx] = WATER
+        shadow[y][x] = AIR
+        self.wake(x, y)
+        self.wake(nx, ny)
+
+    def step(self):
+        """Advance the water one tick. Returns the number of cells moved."""
+        self._sync_external_edits()
+        if not self._active:
+            return 0
+        world = self.world
+        candidates = self._active
+        self._active = set()  # cells woken from here on move next step
+        moves = 0
+        # Fall, or slide sideways when resting on something (bottom rows first).
+        for x, y in sorted(candidates, key=lambda c: (-c[1], c[0])):
+            if y > DISPLAY_HEIGHT - 2 or world[y][x] != WATER:
+                continue
+            if world[y+1][x] == AIR:
+                self._move(x, y, x, y+1); moves += 1; continue
+            dirs = [1,-1] if random.random() < 0.5 else [-1,1]
+            for d in dirs:
+                nx = x+d
+                if 0 < nx < WORLD_WIDTH-1 and world[y][nx] == AIR:
+                    self._move(x, y, nx, y); moves += 1; break
+        # Surface water drifts onto neighbouring ground (column order).
+        for x, y in sorted(candidates | self._active):
+            if not 0 < x < WORLD_WIDTH-1 or world[y][x] != WATER:
+                continue
             if y == 0 or world[y-1][x] == AIR:
                 for d in [1,-1]:
                     nx = x+d
                     if 0 < nx < WORLD_WIDTH-1 and world[y][nx] == AIR and y+1 < DISPLAY_HEIGHT and world[y+1][nx] != WATER:
                         if random.random() < 0.3:
-                            world[y][nx] = WATER; world[y][x] = AIR; break
+                            self._move(x, y, nx, y); moves += 1; break
+                        # Still free to drift: keep it awake for the next roll.
+                        self._active.add((x, y))
+        return moves
+
+
+def _simulate_water(world):
+    """One full-world water step (see :class:`WaterSim`)."""
+    WaterSim(world).step()
 
 def _settle_water(world, ticks=20):
-    for _ in range(ticks): _simulate_water(world)
+    """Run up to ``ticks`` water steps, stopping early once at rest.
+
+    Returns the :class:`WaterSim` so the caller can keep stepping it.
+    """
+    water = WaterSim(world)
+    for _ in range(ticks):
+        water.step()
+        if water.settled:
+            break
+    return water
 
 def _place_sand(world):
     spots = []
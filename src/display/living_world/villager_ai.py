@@ -51,13 +51,14 @@ from .structures import (
     _find_bridge_at, _find_water_gap, _level_foundation,
     _min_campfire_distance, _transfer_house_ownership, _claim_unowned_house,
     _find_well_site, _find_storage_site, _find_bank_site,
-    _get_storage, _get_bank,
+    _get_storage, _get_bank, STRUCTURE_REACH,
 )
 from .terrain import (
     _get_valley_cols, _flatten_terrain, _find_steep_spot,
     _find_extreme_terrain_near_home, _too_close_to_structure,
 )
 from .day_night import _compute_ambient
+from .spatial import column_index
 
 
 def _compute_population_cap(structures):
@@ -102,7 +103,7 @@ def _find_nearest_fire(villager, trees, grass_fires, villagers):
     best = None
     best_dist = FIREFIGHT_DETECT_RADIUS + 1
     # Check burning trees
-    for t in trees:
+    for t in column_index(trees).near(vx, FIREFIGHT_DETECT_RADIUS):
         if t.alive and t.on_fire and id(t) not in targeted:
             d = abs(t.x - vx)
             if d <= FIREFIGHT_DETECT_RADIUS and d < best_dist:
@@ -110,7 +111,7 @@ def _find_nearest_fire(villager, trees, grass_fires, villagers):
                 best = t
     # Check grass fires
     if grass_fires:
-        for gf in grass_fires:
+        for gf in column_index(grass_fires).near(vx, FIREFIGHT_DETECT_RADIUS):
             if id(gf) not in targeted:
                 d = abs(gf.x - vx)
                 if d <= FIREFIGHT_DETECT_RADIUS and d < best_dist:
@@ -129,6 +130,9 @@ def _find_farm_site(villager, farms, heights, world, structures, trees):
         return None
     home_x = villager.home.x
     vc = _get_valley_cols(world)
+    structure_index = column_index(structures)
+    tree_index = column_index(trees)
+    farm_index = column_index(farms)
     # Search outward from house in both directions
     for dist in range(3, 20):
         for direction in (1, -1):
@@ -150,17 +154,17 @@ def _find_farm_site(villager, farms, heights, world, structures, trees):
                 if abs(heights[cx] - heights[start_x]) > 1:
                     ok = False; break
                 # Not too close to structures
-                for s in structures:
+                for s in structure_index.near(cx, STRUCTURE_REACH):
                     if s.x - 2 <= cx <= s.x + s.width + 1:
                         ok = False; break
                 if not ok: break
                 # Not too close to trees
-                for t in trees:
+                for t in tree_index.near(cx, 2):
                     if t.alive and abs(t.x - cx) < 2:
                         ok = False; break
                 if not ok: break
                 # Not overlapping existing farms
-                for f in farms:
+                for f in farm_index.near(cx, FARM_WIDTH):
                     if f.x <= cx < f.x + f.width:
                         ok = False; break
                 if not ok: break
@@ -210,7 +214,8 @@ def _evaluate_goals(v, ctx):
 
     # --- Housing ---
     if v.home is None:
-        hc = sum(1 for s in structures if s.type in ("house_small", "house_large"))
+        structure_index = column_index(structures)
+        hc = structure_index.count("house_small") + structure_index.count("house_large")
         max_houses = max(1, pop // 3) if pop > 0 else 0
         if hc < max_houses:
             # Rain/storm motivates homeless villagers to build shelter
@@ -763,7 +768,7 @@ def _handle_building(v, structures, heights, world, farms, sim_tick):
     return False
 
 
-def _handle_upgrading(v):
+def _handle_upgrading(v, structures):
     """Handle the 'upgrading' state -- count down and upgrade the house level."""
     v.task_timer -= 1
     if v.task_timer <= 0:
@@ -772,6 +777,7 @@ def _handle_upgrading(v):
             ow, oh = HOUSE_DIMENSIONS[ol]; nw, nh = HOUSE_DIMENSIONS[nl]
             v.upgrade_target.level = nl; v.upgrade_target.width = nw; v.upgrade_target.height = nh
             v.upgrade_target.x = max(0, v.upgrade_target.x - (nw - ow) // 2)
+            column_index(structures).move(v.upgrade_target)
             v.upgrade_target.y -= (nh - oh)
             tmpl = HOUSE_TEMPLATES[nl]
             for _row in tmpl['grid']:
@@ -1215,7 +1221,7 @@ def _execute_idle_goal(v, goal, structures, trees, heights, world, lumber_items,
         best_animal = None
         best_d = 999
         search_range = 30 if v.has_bow else 20
-        for a in animals:
+        for a in column_index(animals, "animal_type").near(vx, search_range):
             if a.alive:
                 d = abs(int(round(a.x)) - vx)
                 if d < best_d and d < search_range:
@@ -1510,15 +1516,16 @@ def _update_villagers(villagers, heights, world, trees, structures, lumber_items
     pop = len(villagers)
     max_campfires = max(1, pop//3) if pop > 0 else 0
     max_houses = max(1, pop//3) if pop > 0 else 0
-    campfire_count = sum(1 for s in structures if s.type == "campfire")
-    mine_count = sum(1 for s in structures if s.type == "mine")
-    bridge_count = sum(1 for s in structures if s.type == "bridge")
-    well_count = sum(1 for s in structures if s.type == "well")
-    castle_count = sum(1 for s in structures if s.type == "castle")
-    storage_count = sum(1 for s in structures if s.type == "storage")
-    bank_count = sum(1 for s in structures if s.type == "bank")
-    watchtower_exists = any(s.type == "watchtower" for s in structures)
-    granary_exists = any(s.type == "granary" for s in structures)
+    structure_index = column_index(structures)
+    campfire_count = structure_index.count("campfire")
+    mine_count = structure_index.count("mine")
+    bridge_count = structure_index.count("bridge")
+    well_count = structure_index.count("well")
+    castle_count = structure_index.count("castle")
+    storage_count = structure_index.count("storage")
+    bank_count = structure_index.count("bank")
+    watchtower_exists = structure_index.count("watchtower") > 0
+    granary_exists = structure_index.count("granary") > 0
     granary = _get_granary(structures)
     storage = _get_storage(structures)
     _handle_villager_trading(villagers, sim_tick=sim_tick)
@@ -1569,7 +1576,7 @@ def _update_villagers(villagers, heights, world, trees, structures, lumber_items
         elif v.state == "building":
             _handle_building(v, structures, heights, world, farms, sim_tick)
         elif v.state == "upgrading":
-            _handle_upgrading(v)
+            _handle_upgrading(v, structures)
         elif v.state == "refueling":
             _handle_refueling(v)
         elif v.state == "trading":
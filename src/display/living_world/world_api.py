@@ -14,16 +14,139 @@ import threading
 logger = logging.getLogger(__name__)
 
 _SAVE_PATH = os.path.join(
-    os.path.dirname(__file__), "..", "..", "..", "config", "living_world_save.json"
+    os.path.dirname(__file__), "..", "..", "..", "config", "living_world_save.lwb"
 )
 
 # --- Live state sharing ---
-# The simulation writes a snapshot here periodically; the web UI reads it.
+# The simulation publishes a snapshot here periodically; the web UI reads it.
+# The file itself is a keyframe (a full snapshot); between keyframes only the
+# fields that changed are appended to a sibling ".delta.jsonl" log, and
+# nothing at all is written while nothing observable changes.
 _LIVE_SNAPSHOT_PATH = os.path.join(
     os.path.dirname(__file__), "..", "..", "..", "logs", "living_world_snapshot.json"
 )
 _SNAPSHOT_INTERVAL = 3.0  # seconds between live snapshots
 _last_snapshot_time = 0.0
+_KEYFRAME_MAX_DELTAS = 40     # deltas (~2 min) before the next full keyframe
+_HEARTBEAT_INTERVAL = 15.0    # republish an unchanged world this often
+_LIVE_FRESH_SECONDS = 30      # older live snapshots are ignored
+# Fields that advance every publish and do not count as a change.
+_CLOCK_FIELDS = ("sim_tick", "timestamp")
+
+
+def _delta_path(live_path):
+    return os.path.splitext(live_path)[0] + ".delta.jsonl"
+
+
+def _diff_snapshot(old, new):
+    """Fields of ``new`` that differ from ``old``, clock fields excluded.
+
+    Returns ``(changed, patch)``: whole values to replace, and for lists
+    that kept their length, ``{index: item}`` of just the changed items.
+    """
+    changed, patch = {}, {}
+    for key, value in new.items():
+        if key in _CLOCK_FIELDS:
+            continue
+        prev = old.get(key)
+        if prev == value:
+            continue
+        if isinstance(value, list) and isinstance(prev, list) and len(prev) == len(value):
+            patch[key] = {str(i): v for i, (p, v) in enumerate(zip(prev, value)) if p != v}
+        else:
+            changed[key] = value
+    return changed, patch
+
+
+def _apply_delta(snapshot, record):
+    """Apply one delta-log record to a snapshot in place."""
+    snapshot.update(record.get("set", {}))
+    for key, items in record.get("patch", {}).items():
+        target = snapshot.get(key)
+        for i, item in items.items():
+            target[int(i)] = item
+    for key in _CLOCK_FIELDS:
+        if key in record:
+            snapshot[key] = record[key]
+
+
+class SnapshotPublisher:
+    """Writes live snapshots as keyframes plus an append-only delta log.
+
+    A delta record is ``{"base": keyframe_id, "sim_tick", "timestamp",
+    "set": {...}, "patch": {...}}``; readers apply the records whose base
+    matches the keyframe they loaded. A new keyframe is written first, after
+    :data:`_KEYFRAME_MAX_DELTAS` deltas, or once the deltas outweigh a
+    keyframe, and the log is truncated after it.
+    """
+
+    def __init__(self):
+        self._reset(None)
+
+    def _reset(self, path):
+        self._path = path
+        self._last = None
+        self._keyframe_id = None
+        self._keyframe_bytes = 0
+        self._deltas = 0
+        self._delta_bytes = 0
+        self._last_write = 0.0
+
+    def publish(self, snapshot, now):
+        """Publish ``snapshot``; returns "keyframe", "delta" or None (skipped)."""
+        path = os.path.abspath(_LIVE_SNAPSHOT_PATH)
+        if path != self._path or not os.path.exists(path):
+            self._reset(path)
+        if (self._last is None or self._deltas >= _KEYFRAME_MAX_DELTAS
+                or self._delta_bytes > self._keyframe_bytes):
+            self._write_keyframe(path, snapshot, now)
+            return "keyframe"
+        changed, patch = _diff_snapshot(self._last, snapshot)
+        if not changed and not patch and now - self._last_write < _HEARTBEAT_INTERVAL:
+            return None
+        record = {"base": self._keyframe_id, "sim_tick": snapshot.get("sim_tick"),
+                  "timestamp": now}
+        if changed:
+            record["set"] = changed
+        if patch:
+            record["patch"] = patch
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with open(_delta_path(path), "a") as fp:
+            fp.write(line)
+        self._last = snapshot
+        self._deltas += 1
+        self._delta_bytes += len(line)
+        self._last_write = now
+        return "delta"
+
+    def _write_keyframe(self, path, snapshot, now):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        keyframe = dict(snapshot, keyframe_id=now)
+        text = json.dumps(keyframe, separators=(",", ":"))
+        # Atomic write: write to temp file first, then replace
+        dir_name = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                fp.write(text)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        # Deltas against the previous keyframe no longer apply.
+        open(_delta_path(path), "w").close()
+        self._last = snapshot
+        self._keyframe_id = now
+        self._keyframe_bytes = len(text)
+        self._deltas = 0
+        self._delta_bytes = 0
+        self._last_write = now
+
+
+_publisher = SnapshotPublisher()
 
 
 def write_live_snapshot(*, villagers, structures, trees, farms, animals,
@@ -70,7 +193,7 @@ def write_live_snapshot(*, villagers, structures, trees, farms, animals,
             "world_width": len(heights),
             "display_width": 64,
             "display_height": 64,
-            "heights": heights,
+            "heights": list(heights),
             "villagers": v_list,
             "structures": s_list,
             "trees": t_list,
@@ -79,25 +202,30 @@ def write_live_snapshot(*, villagers, structures, trees, farms, animals,
             "population": len(villagers),
             "timestamp": now,
         }
-        path = os.path.abspath(_LIVE_SNAPSHOT_PATH)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        # Atomic write: write to temp file first, then replace
-        dir_name = os.path.dirname(path)
-        fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
-        try:
-            with os.fdopen(fd, 'w') as fp:
-                json.dump(snapshot, fp, separators=(",", ":"))
-            os.replace(tmp_path, path)
-        except Exception:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        _publisher.publish(snapshot, now)
     except Exception as e:
         logger.debug("Failed to write live snapshot: %s", e)
 
 
+def _read_live_snapshot(live_path):
+    """The latest live snapshot: the keyframe with its delta log applied."""
+    with open(live_path, "r") as fp:
+        snapshot = json.load(fp)
+    base = snapshot.pop("keyframe_id", None)
+    try:
+        with open(_delta_path(live_path), "r") as fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # a record still being appended
+                if record.get("base") == base:
+                    _apply_delta(snapshot, record)
+    except FileNotFoundError:
+        pass
+    return snapshot
+
+
 def get_world_snapshot():
     """Return world state for the web UI.
 
@@ -108,21 +236,17 @@ def get_world_snapshot():
     live_path = os.path.abspath(_LIVE_SNAPSHOT_PATH)
     if os.path.exists(live_path):
         try:
-            mtime = os.path.getmtime(live_path)
-            if time.time() - mtime < 30:  # fresh enough
-                with open(live_path, "r") as fp:
-                    return json.load(fp)
+            snapshot = _read_live_snapshot(live_path)
+            if time.time() - snapshot.get("timestamp", 0) < _LIVE_FRESH_SECONDS:
+                return snapshot
         except Exception:
             pass
 
     # Fallback to persistence save
-    path = os.path.abspath(_SAVE_PATH)
-    if not os.path.exists(path):
-        return None
+    from .persistence import read_save_file
     try:
-        with open(path, "r") as fp:
-            data = json.load(fp)
-        if data.get("version") != 1:
+        data = read_save_file(_SAVE_PATH)
+        if data is None:
             return None
 
         # Extract simplified villager data
@@ -29,6 +29,7 @@ from .entities import Tree, Bird, Cloud, Firefly, Smoke, FishJump, Flower, Anima
 from .utils import _clamp
 from .terrain import _get_valley_cols, _flatten_column_toward, _too_close_to_structure
 from .day_night import _compute_ambient
+from .spatial import column_index
 
 def _grow_trees(trees, heights, world, sim_tick, weather=None, structures=None, current_season=None):
     if structures is None:
@@ -74,7 +75,7 @@ def _grow_trees(trees, heights, world, sim_tick, weather=None, structures=None,
                         break
                 nx = random.randint(4, WORLD_WIDTH-5); att += 1
             if att < 20:
-                trees[i] = Tree(nx, heights[nx], 0.0, random.randint(5,9), random.randint(2,4), random.randint(0,1))
+                column_index(trees).replace(i, Tree(nx, heights[nx], 0.0, random.randint(5,9), random.randint(2,4), random.randint(0,1)))
 
 def _move_clouds(clouds, weather):
     sm = 2.0 if weather.is_storming() else (1.5 if weather.is_raining() else 1.0)
@@ -345,8 +346,9 @@ def _maybe_spawn_animal(animals, heights, world, tick, villagers, current_season
         return
     if random.random() > season_chance:
         return
-    deer_count = sum(1 for a in animals if a.animal_type == "deer")
-    rabbit_count = sum(1 for a in animals if a.animal_type == "rabbit")
+    animal_index = column_index(animals, "animal_type")
+    deer_count = animal_index.count("deer")
+    rabbit_count = animal_index.count("rabbit")
     can_deer = deer_count < MAX_DEER
     can_rabbit = rabbit_count < MAX_RABBITS
     if not can_deer and not can_rabbit:
@@ -388,6 +390,7 @@ def _maybe_spawn_animal(animals, heights, world, tick, villagers, current_season
 
 def _update_animals(animals, heights, world, villagers, tick):
     """Update animal behavior: idle, walk, flee from villagers."""
+    animal_index = column_index(animals, "animal_type")
     for animal in animals:
         if not animal.alive:
             continue
@@ -427,6 +430,7 @@ def _update_animals(animals, heights, world, villagers, tick):
             else:
                 animal.x = float(_clamp(new_x, 0, WORLD_WIDTH - 1))
                 animal.y = heights[_clamp(int(round(animal.x)), 0, WORLD_WIDTH - 1)]
+                animal_index.move(animal)
             animal.walk_timer -= 1
             if animal.walk_timer <= 0:
                 animal.state = "idle"
@@ -450,6 +454,7 @@ def _update_animals(animals, heights, world, villagers, tick):
             else:
                 animal.x = float(_clamp(new_x, 0, WORLD_WIDTH - 1))
                 animal.y = heights[_clamp(int(round(animal.x)), 0, WORLD_WIDTH - 1)]
+                animal_index.move(animal)
             animal.flee_timer -= 1
             if animal.flee_timer <= 0:
                 animal.state = "idle"
@@ -10,8 +10,12 @@ import math
 import random
 import time
 import logging
+
+import numpy as np
 from PIL import Image, ImageDraw
+
 from src.display._shared import should_stop, interruptible_sleep
+from src.display._raycast import cast_rays, draw_wall_columns
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +56,12 @@ for _row in range(HEIGHT):
             int(FLOOR_COLOR[2] * _shade),
         ))
 
+_WALL_COLOR_TABLE = np.array(WALL_COLORS, dtype=np.float64)
+# Ceiling above the horizon, floor gradient below: the frame before walls.
+_BACKGROUND = np.repeat(np.array(_FLOOR_GRADIENT, dtype=np.uint8)[:, None, :], WIDTH, axis=1)
+_COLUMNS = np.arange(WIDTH)
+_MAX_STEPS = int(MAX_DEPTH * 2) + 2
+
 
 # ---------------------------------------------------------------------------
 # Maze generation  (recursive back-tracker / DFS)
@@ -132,119 +142,54 @@ def _find_start_end(grid, grid_h, grid_w):
 # Raycasting engine
 # ---------------------------------------------------------------------------
 
-def _cast_ray(grid, grid_h, grid_w, px, py, angle):
-    """Cast a single ray and return (distance, wall_type, hit_side).
-
-    Uses DDA (Digital Differential Analysis) for precise and efficient
-    ray-grid intersection.
+def _cast_columns(grid, grid_h, grid_w, px, py, angles):
+    """Cast a batch of rays; returns (distance, wall_type, hit_side) arrays.
 
-    hit_side: 0 = vertical wall face (NS), 1 = horizontal wall face (EW)
+    hit_side: 0 = vertical wall face (NS), 1 = horizontal wall face (EW).
+    Rays that leave the maze hit a type-1 wall on its edge; rays that find
+    nothing within MAX_DEPTH report (MAX_DEPTH, 1, 0).
     """
-    sin_a = math.sin(angle)
-    cos_a = math.cos(angle)
-
-    # Avoid division by zero
-    if abs(cos_a) < 1e-9:
-        cos_a = 1e-9 if cos_a >= 0 else -1e-9
-    if abs(sin_a) < 1e-9:
-        sin_a = 1e-9 if sin_a >= 0 else -1e-9
-
-    # DDA setup
-    # Step direction
-    step_x = 1 if cos_a > 0 else -1
-    step_y = 1 if sin_a > 0 else -1
-
-    # Current map cell
-    map_x = int(px)
-    map_y = int(py)
-
-    # Distance to next x/y boundary
-    if cos_a > 0:
-        t_max_x = (map_x + 1.0 - px) / cos_a
-    else:
-        t_max_x = (map_x - px) / cos_a
-
-    if sin_a > 0:
-        t_max_y = (map_y + 1.0 - py) / sin_a
-    else:
-        t_max_y = (map_y - py) / sin_a
-
-    # Distance between x/y boundaries
-    t_delta_x = abs(1.0 / cos_a)
-    t_delta_y = abs(1.0 / sin_a)
+    cells = np.asarray(grid)
+    hits, _ = cast_rays(cells != 0, px, py, angles, _MAX_STEPS, max_depth=MAX_DEPTH)
+    inside = hits.inside(grid_w, grid_h)
+    wall_type = np.where(hits.hit & inside,
+                         cells[np.clip(hits.cell_y, 0, grid_h - 1),
+                               np.clip(hits.cell_x, 0, grid_w - 1)], 1)
+    return hits.dist, wall_type, hits.side
 
-    hit_side = 0
-    dist = 0.0
 
-    for _ in range(int(MAX_DEPTH * 2) + 2):
-        if t_max_x < t_max_y:
-            dist = t_max_x
-            t_max_x += t_delta_x
-            map_x += step_x
-            hit_side = 0
-        else:
-            dist = t_max_y
-            t_max_y += t_delta_y
-            map_y += step_y
-            hit_side = 1
-
-        if dist > MAX_DEPTH:
-            return MAX_DEPTH, 1, 0
-
-        # Check bounds
-        if map_x < 0 or map_x >= grid_w or map_y < 0 or map_y >= grid_h:
-            return dist, 1, hit_side
-
-        # Check wall hit
-        if grid[map_y][map_x] != 0:
-            return dist, grid[map_y][map_x], hit_side
-
-    return MAX_DEPTH, 1, 0
+def _cast_ray(grid, grid_h, grid_w, px, py, angle):
+    """Cast a single ray and return (distance, wall_type, hit_side)."""
+    dist, wall_type, side = _cast_columns(grid, grid_h, grid_w, px, py, [angle])
+    return float(dist[0]), int(wall_type[0]), int(side[0])
 
 
 def _render_frame(image, grid, grid_h, grid_w, px, py, angle):
-    """Render the 3D view into the PIL image using column-based raycasting."""
-    pixels = image.load()
-
-    for col in range(WIDTH):
-        # Ray angle for this column
-        ray_angle = angle - HALF_FOV + (col / WIDTH) * FOV
-        dist, wall_type, hit_side = _cast_ray(grid, grid_h, grid_w, px, py, ray_angle)
-
-        # Fix fish-eye distortion
-        perp_dist = dist * math.cos(ray_angle - angle)
-        if perp_dist < 0.05:
-            perp_dist = 0.05
-
-        # Wall height on screen
-        wall_h = min(HEIGHT, int(HEIGHT / perp_dist))
-        top = max(0, (HEIGHT - wall_h) // 2)
-        bottom = min(HEIGHT - 1, top + wall_h)
-
-        # Base colour from wall type
-        wt = wall_type if 0 <= wall_type < len(WALL_COLORS) else 0
-        base_r, base_g, base_b = WALL_COLORS[wt]
-
-        # Distance shading (closer = brighter)
-        shade = max(0.15, 1.0 - perp_dist / MAX_DEPTH)
-        # Side shading (horizontal face hits are darker for depth cue)
-        if hit_side == 1:
-            shade *= 0.65
-
-        r = int(base_r * shade)
-        g = int(base_g * shade)
-        b = int(base_b * shade)
-
-        wall_color = (r, g, b)
-
-        # Draw column: ceiling, wall, floor
-        for row in range(HEIGHT):
-            if row < top:
-                pixels[col, row] = CEIL_COLOR
-            elif row <= bottom:
-                pixels[col, row] = wall_color
-            else:
-                pixels[col, row] = _FLOOR_GRADIENT[row]
+    """Render the 3D view into the PIL image, all 64 columns as one batch."""
+    ray_angles = angle - HALF_FOV + (_COLUMNS / WIDTH) * FOV
+    dist, wall_type, hit_side = _cast_columns(grid, grid_h, grid_w, px, py, ray_angles)
+
+    # Fix fish-eye distortion
+    perp_dist = np.maximum(0.05, dist * np.cos(ray_angles - angle))
+
+    # Wall height on screen
+    wall_h = np.minimum(HEIGHT, (HEIGHT / perp_dist).astype(int))
+    top = np.maximum(0, (HEIGHT - wall_h) // 2)
+    bottom = np.minimum(HEIGHT - 1, top + wall_h)
+
+    # Base colour from wall type, distance shading (closer = brighter) and
+    # side shading (horizontal face hits are darker for depth cue)
+    wt = np.where((wall_type >= 0) & (wall_type < len(WALL_COLORS)), wall_type, 0)
+    shade = np.maximum(0.15, 1.0 - perp_dist / MAX_DEPTH)
+    shade = np.where(hit_side == 1, shade * 0.65, shade)
+    colors = (_WALL_COLOR_TABLE[wt] * shade[:, None]).astype(np.uint8)
+
+    # Ceiling/floor background, then every wall column in one pass
+    frame = _BACKGROUND.copy()
+    count = bottom - top + 1
+    draw_wall_columns(frame, _COLUMNS, top, count, count,
+                      colors[:, None, None, :], _COLUMNS, np.zeros(WIDTH, dtype=int))
+    image.paste(Image.fromarray(frame))
 
 
 # ---------------------------------------------------------------------------
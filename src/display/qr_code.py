@@ -23,6 +23,14 @@ def _load_qr_config():
         return {"content": "https://github.com/RynAgain/LED_MATRIX-Project", "label": "Scan Me"}
 
 
+def preload():
+    """Import the qrcode library ahead of this feature's turn in the carousel."""
+    try:
+        import qrcode  # noqa: F401
+    except ImportError:
+        pass
+
+
 def _generate_qr_image(content, size=64):
     """Generate a QR code as a PIL Image.
     
@@ -8,12 +8,14 @@ hour or so of radar history loops, holding on the newest frame, followed
 by RainViewer's short nowcast when one is published -- so during storm
 season you can watch a cell march toward your own street.
 
-All network work lives on a background thread (index poll + tile
-fetches); the render loop only ever reads the latest list of pre-built
-64x64 overlays. With no network the basemap still draws and the HUD
-blinks NO LINK, matching the flight radar's behaviour.
-
-Tile pipeline (built once per radar frame, then cached by tile path):
+All network work (index poll + tile fetches) runs in the background
+feed scheduler (``src/display/_feeds.py``), which keeps the overlays warm
+between turns in the carousel; the render loop only ever reads the latest
+list of pre-built 64x64 overlays. With no network the basemap still draws
+and the HUD blinks NO LINK, matching the flight radar's behaviour.
+
+Tile pipeline (built once per radar frame -- tiles fetched in parallel --
+then kept in a size-bounded LRU cache on disk, keyed by path and box):
 RainViewer serves Web-Mercator tiles up to zoom 7 for radar (higher
 zooms return an error *image*, not an error status), and the tilecache
 ignores the colour-scheme path segment: every request comes back in
@@ -22,19 +24,24 @@ orange / red cores). Intensity is therefore recovered from hue and
 brightness rather than trusted grey values. The tiles covering the
 configured box are stitched, cropped, resized with alpha-weighted
 channels (plain bilinear would bleed background into cell edges) and
-quantised to an LED-friendly ramp.
+quantised to an LED-friendly ramp -- all as whole-array operations, so a
+new radar index costs milliseconds of CPU, not a spike.
 """
 
-import colorsys
+import hashlib
 import math
 import io
-import threading
+import os
+import tempfile
 import time
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
+import numpy as np
 from PIL import Image, ImageChops, ImageDraw
 
+from src.display import _feeds
 from src.display._shared import should_stop
 from src.display._fonts import _draw_text, _text_width
 from src.display.flight_radar import (
@@ -57,6 +64,15 @@ ZOOM = 7                    # RainViewer's radar maximum; 512px tiles keep
 PAST_FRAMES = 7             # radar history frames kept (10 min apart)
 NOWCAST_FRAMES = 3          # forecast frames appended after "now"
 POLL_SECONDS = 300.0        # RainViewer publishes every ~10 minutes
+RETRY_SECONDS = 60.0        # after a failed poll
+TILE_WORKERS = 4            # tiles of one frame fetched at once
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+# Built 64x64 overlays, kept across runs and restarts (a few KB each).
+OVERLAY_CACHE_DIR = os.path.join(PROJECT_ROOT, "logs", "rain_radar_cache")
+OVERLAY_CACHE_BYTES = 4 * 1024 * 1024
+OVERLAY_MEMORY_ENTRIES = 2 * (PAST_FRAMES + NOWCAST_FRAMES)
 
 FRAME_DWELL = 0.5           # seconds per animation frame
 HOLD_DWELL = 2.0            # extra dwell on the newest observed frame
@@ -121,36 +137,67 @@ def _box_px(lat, lon, radius_miles, zoom):
     return cx - half, cy - half, cx + half, cy + half
 
 
-def _intensity(r, g, b):
-    """0..1 rank of a RainViewer palette colour.
+def _hsv(rgb):
+    """Vectorised ``colorsys.rgb_to_hsv`` of an ``(..., 3)`` 0-255 array."""
+    rgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = rgb.max(axis=-1)
+    span = maxc - rgb.min(axis=-1)
+    grey = span == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(grey, 0.0, span / maxc)
+        rc = (maxc - r) / span
+        gc = (maxc - g) / span
+        bc = (maxc - b) / span
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(grey, 0.0, (h / 6.0) % 1.0)
+    return h, s, maxc
+
+
+def _intensity_array(rgb):
+    """0..1 rank of every RainViewer palette colour in an ``(..., 3)`` array.
 
     The tilecache serves one fixed palette regardless of the colour-scheme
     URL segment, so intensity is recovered from hue and brightness:
     low-saturation khaki haze is drizzle, blues run light-to-moderate as
     they darken, then yellow, orange, red and magenta escalate.
     """
-    h, s, v = colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
-    if s < 0.20:
-        return 0.05                          # grey haze
-    if 0.42 <= h <= 0.75:
-        return min(0.45, 0.15 + (1.0 - v) * 0.45)   # blues
-    if 0.20 <= h < 0.42:
-        return 0.40                          # green
-    if 0.11 <= h < 0.20:
-        return 0.08 if s < 0.60 else 0.55    # khaki drizzle vs true yellow
-    if 0.04 <= h < 0.11:
-        return 0.72                          # orange
-    if 0.75 < h < 0.93:
-        return 0.97                          # magenta / purple core
-    return 0.88                              # red
+    h, s, v = _hsv(rgb)
+    return np.select(
+        [s < 0.20,
+         (h >= 0.42) & (h <= 0.75),
+         (h >= 0.20) & (h < 0.42),
+         (h >= 0.11) & (h < 0.20),
+         (h >= 0.04) & (h < 0.11),
+         (h > 0.75) & (h < 0.93)],
+        [0.05,                                      # grey haze
+         np.minimum(0.45, 0.15 + (1.0 - v) * 0.45),  # blues
+         0.40,                                      # green
+         np.where(s < 0.60, 0.08, 0.55),            # khaki drizzle vs true yellow
+         0.72,                                      # orange
+         0.97],                                     # magenta / purple core
+        0.88)                                       # red
+
+
+def _intensity(r, g, b):
+    """0..1 rank of one RainViewer palette colour (see _intensity_array)."""
+    return float(_intensity_array((r, g, b)))
+
+
+# Band lookup: rank -> index into RAIN_BANDS -> LED colour.
+_BAND_CEILINGS = np.array([ceiling for ceiling, _ in RAIN_BANDS])
+_BAND_COLORS = np.array([color for _, color in RAIN_BANDS], dtype=np.uint8)
+
+
+def _band_index(rank):
+    """Index of the first RAIN_BANDS entry whose ceiling exceeds ``rank``."""
+    return np.minimum(np.searchsorted(_BAND_CEILINGS, rank, side="right"),
+                      len(RAIN_BANDS) - 1)
 
 
 def _color_for(rank):
     """LED colour for an intensity rank (0..1)."""
-    for ceiling, color in RAIN_BANDS:
-        if rank < ceiling:
-            return color
-    return RAIN_BANDS[-1][1]
+    return RAIN_BANDS[int(_band_index(rank))][1]
 
 
 def _colorize(rgb, alpha):
@@ -161,22 +208,14 @@ def _colorize(rgb, alpha):
     resampled edges are dropped so antialiasing haze does not litter
     the map.
     """
-    out = Image.new("RGBA", rgb.size, (0, 0, 0, 0))
-    rp = rgb.load()
-    ap = alpha.load()
-    op = out.load()
-    w, h = rgb.size
-    for y in range(h):
-        for x in range(w):
-            a = ap[x, y]
-            if a < ECHO_MIN_ALPHA:
-                continue
-            rank = _intensity(*rp[x, y][:3])
-            if rank < RAIN_MIN_RANK:
-                continue    # dry-air khaki / grey haze, not rain
-            r, g, b = _color_for(rank)
-            op[x, y] = (r, g, b, min(255, int(a * 2.2)))
-    return out
+    a = np.asarray(alpha, dtype=np.int32)
+    rank = _intensity_array(np.asarray(rgb.convert("RGB")))
+    # RAIN_MIN_RANK drops dry-air khaki / grey haze, not rain.
+    keep = (a >= ECHO_MIN_ALPHA) & (rank >= RAIN_MIN_RANK)
+    out = np.zeros(a.shape + (4,), dtype=np.uint8)
+    out[keep, :3] = _BAND_COLORS[_band_index(rank[keep])]
+    out[keep, 3] = np.minimum(255, (a[keep] * 2.2).astype(np.int32))
+    return Image.fromarray(out, "RGBA")
 
 
 def _resample_echo(rgb, alpha, box, size):
@@ -190,80 +229,136 @@ def _resample_echo(rgb, alpha, box, size):
     rgb = rgb.crop(box)
     alpha = alpha.crop(box)
     a = alpha.resize(size, Image.BILINEAR)
-    ap = a.load()
-    channels = []
-    for ch in rgb.split():
-        w = ImageChops.multiply(ch, alpha).resize(size, Image.BILINEAR)
-        wp = w.load()
-        out = Image.new("L", size, 0)
-        op = out.load()
-        for y in range(size[1]):
-            for x in range(size[0]):
-                av = ap[x, y]
-                if av:
-                    op[x, y] = min(255, wp[x, y] * 255 // av)
-        channels.append(out)
-    return Image.merge("RGB", channels), a
+    weighted = ImageChops.multiply(rgb, Image.merge("RGB", (alpha,) * 3))
+    w = np.asarray(weighted.resize(size, Image.BILINEAR), dtype=np.int32)
+    av = np.asarray(a, dtype=np.int32)[..., None]
+    out = np.where(av > 0, np.minimum(255, w * 255 // np.maximum(av, 1)), 0)
+    return Image.fromarray(out.astype(np.uint8), "RGB"), a
+
+
+# --------------------------------------------------------------------------
+# overlay cache
+# --------------------------------------------------------------------------
+
+class OverlayCache:
+    """Size-bounded LRU cache of built overlays, in memory and on disk.
+
+    Keys are strings (radar path + box); each overlay is stored as a PNG
+    named by the key's hash. Reading a file refreshes its mtime, and the
+    least recently used files are deleted once the directory outgrows
+    ``max_bytes``. The most recent overlays are also held in memory. Disk
+    errors only cost a rebuild, they never fail a poll.
+    """
+
+    def __init__(self, directory, max_bytes=OVERLAY_CACHE_BYTES,
+                 memory_entries=OVERLAY_MEMORY_ENTRIES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+
+    def _file(self, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".png")
+
+    def get(self, key):
+        overlay = self._memory.get(key)
+        if overlay is not None:
+            self._memory.move_to_end(key)
+            return overlay
+        path = self._file(key)
+        try:
+            with Image.open(path) as img:
+                overlay = img.convert("RGBA")
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        self._remember(key, overlay)
+        return overlay
+
+    def put(self, key, overlay):
+        self._remember(key, overlay)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    overlay.save(fp, format="PNG")
+                os.replace(tmp, self._file(key))
+            except Exception:
+                os.unlink(tmp)
+                raise
+            self._evict()
+        except OSError as e:
+            logger.warning("rain_radar: overlay cache write failed: %s", e)
+
+    def _remember(self, key, overlay):
+        self._memory[key] = overlay
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".png"):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
 
 
 # --------------------------------------------------------------------------
 # feed
 # --------------------------------------------------------------------------
 
-class RainFeed:
-    """Polls RainViewer on a background thread and pre-builds overlays."""
+class RainFeed(_feeds.Feed):
+    """Polls RainViewer and pre-builds overlays for one location.
+
+    Kept warm between runs by the process-wide feed scheduler (see
+    :func:`shared_feed`); :meth:`start` still runs it standalone. Built
+    overlays go to an :class:`OverlayCache` under ``cache_dir`` (default
+    :data:`OVERLAY_CACHE_DIR`), so a restart does not refetch them.
+    """
 
     def __init__(self, lat, lon, radius_miles, poll_seconds=POLL_SECONDS,
-                 zoom=ZOOM):
+                 zoom=ZOOM, cache_dir=None):
+        super().__init__("rain_radar", interval=poll_seconds,
+                         retry=min(poll_seconds, RETRY_SECONDS))
+        self.key = (lat, lon, radius_miles, poll_seconds, zoom)
         self.lat = lat
         self.lon = lon
         self.radius_miles = radius_miles
         self.poll_seconds = poll_seconds
         self.zoom = zoom
-        self._lock = threading.Lock()
-        self._frames = []
-        self._cache = {}        # tile path -> built overlay
-        self._stop = threading.Event()
-        self._thread = None
-        self.online = None      # None = acquiring, then True/False
-        self.last_update = 0.0
-
-    # -- lifecycle -----------------------------------------------------
-    def start(self):
-        self._thread = threading.Thread(target=self._loop, daemon=True)
-        self._thread.start()
-
-    def stop(self):
-        self._stop.set()
+        self.data = []
+        self._cache = OverlayCache(cache_dir or OVERLAY_CACHE_DIR)
 
     # -- data ------------------------------------------------------------
     def snapshot(self):
         with self._lock:
-            return list(self._frames), self.online
+            return list(self.data), self.online
 
-    def _loop(self):
-        while not self._stop.is_set():
-            try:
-                frames = self._poll_once()
-            except Exception:
-                logger.warning("rain_radar: poll crashed", exc_info=True)
-                frames = None
-            with self._lock:
-                if frames is None:
-                    self.online = False
-                else:
-                    self._frames = frames
-                    self.online = True
-                    self.last_update = time.time()
-            # Interruptible wait so stopping the demo never hangs a poll.
-            self._stop.wait(self.poll_seconds)
+    def fetch(self):
+        return self._poll_once()
 
     # -- network -----------------------------------------------------------
     def _fetch_index(self):
         """(host, entries) from the frame index, or None on failure."""
         try:
-            resp = requests.get(INDEX_URL, timeout=10,
-                                headers={"User-Agent": USER_AGENT})
+            resp = _feeds.http_get(INDEX_URL, timeout=10,
+                                   headers={"User-Agent": USER_AGENT})
             if resp.status_code != 200:
                 logger.warning("rain_radar: index HTTP %s", resp.status_code)
                 return None
@@ -287,8 +382,8 @@ class RainFeed:
         url = "%s%s/%d/%d/%d/%d/0/0_0.png" % (
             host, path, TILE_SIZE, self.zoom, tx, ty)
         try:
-            resp = requests.get(url, timeout=10,
-                                headers={"User-Agent": USER_AGENT})
+            resp = _feeds.http_get(url, timeout=10,
+                                   headers={"User-Agent": USER_AGENT})
             if resp.status_code != 200:
                 return None
             return Image.open(io.BytesIO(resp.content)).convert("RGBA")
@@ -304,23 +399,32 @@ class RainFeed:
         tx1, ty1 = int(x1 // TILE_SIZE), int(y1 // TILE_SIZE)
         w = (tx1 - tx0 + 1) * TILE_SIZE
         h = (ty1 - ty0 + 1) * TILE_SIZE
+        coords = [(tx, ty) for ty in range(ty0, ty1 + 1)
+                  for tx in range(tx0, tx1 + 1)]
+        with ThreadPoolExecutor(max_workers=TILE_WORKERS) as pool:
+            tiles = list(pool.map(
+                lambda c: self._fetch_tile(host, path, c[0], c[1]), coords))
+        if any(tile is None for tile in tiles):
+            return None
         rgb = Image.new("RGB", (w, h), (0, 0, 0))
         alpha = Image.new("L", (w, h), 0)
-        for ty in range(ty0, ty1 + 1):
-            for tx in range(tx0, tx1 + 1):
-                tile = self._fetch_tile(host, path, tx, ty)
-                if tile is None:
-                    return None
-                ox = (tx - tx0) * TILE_SIZE
-                oy = (ty - ty0) * TILE_SIZE
-                bands = tile.split()
-                rgb.paste(Image.merge("RGB", bands[:3]), (ox, oy))
-                alpha.paste(bands[3], (ox, oy))
+        for (tx, ty), tile in zip(coords, tiles):
+            ox = (tx - tx0) * TILE_SIZE
+            oy = (ty - ty0) * TILE_SIZE
+            bands = tile.split()
+            rgb.paste(Image.merge("RGB", bands[:3]), (ox, oy))
+            alpha.paste(bands[3], (ox, oy))
         box = (x0 - tx0 * TILE_SIZE, y0 - ty0 * TILE_SIZE,
                x1 - tx0 * TILE_SIZE, y1 - ty0 * TILE_SIZE)
         echo, a = _resample_echo(rgb, alpha, box, (WIDTH, HEIGHT))
         return _colorize(echo, a)
 
+    def _overlay_key(self, path):
+        """Cache key of a frame's overlay: radar path plus the exact box."""
+        box = _box_px(self.lat, self.lon, self.radius_miles, self.zoom)
+        return "%s|%d|%s" % (path, self.zoom,
+                             ",".join("%.2f" % v for v in box))
+
     def _poll_once(self):
         """Full poll: index + any overlays not already cached."""
         index = self._fetch_index()
@@ -329,20 +433,28 @@ class RainFeed:
         host, entries = index
         frames = []
         for e in entries:
-            overlay = self._cache.get(e["path"])
+            key = self._overlay_key(e["path"])
+            overlay = self._cache.get(key)
             if overlay is None:
                 overlay = self._build_overlay(host, e["path"])
                 if overlay is None:
                     continue
-                self._cache[e["path"]] = overlay
+                self._cache.put(key, overlay)
             frames.append({"time": e["time"], "nowcast": e["nowcast"],
                            "overlay": overlay})
-        # Drop overlays for frames RainViewer no longer serves.
-        keep = {e["path"] for e in entries}
-        self._cache = {k: v for k, v in self._cache.items() if k in keep}
         return frames or None
 
 
+def shared_feed(cfg):
+    """The scheduler-driven :class:`RainFeed` for ``cfg``'s location."""
+    return _feeds.register(RainFeed(cfg["lat"], cfg["lon"], cfg["radius_miles"]))
+
+
+def register_feeds():
+    """Register the radar feed with the background feed scheduler."""
+    return shared_feed(_radar_config())
+
+
 # --------------------------------------------------------------------------
 # rendering
 # --------------------------------------------------------------------------
@@ -454,8 +566,8 @@ def run(matrix, duration=60):
     """Run the precipitation radar demo."""
     cfg = _radar_config()
     basemap = _build_basemap(cfg["lat"], cfg["lon"], cfg["radius_miles"])
-    feed = RainFeed(cfg["lat"], cfg["lon"], cfg["radius_miles"])
-    feed.start()
+    feed = shared_feed(cfg)
+    _feeds.start_feeds()
 
     cycler = _Cycler()
     start = time.time()
@@ -493,7 +605,6 @@ def run(matrix, duration=60):
     except Exception:
         logger.error("Error in rain_radar demo", exc_info=True)
     finally:
-        feed.stop()
         try:
             matrix.Clear()
         except Exception:
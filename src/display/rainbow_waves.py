@@ -2,10 +2,9 @@
 """Rainbow wave patterns for 64x64 LED matrix."""
 
 import time
-import math
 import logging
-from PIL import Image
-from src.display._shared import should_stop
+import numpy as np
+from src.display._shared import should_stop, FrameBuffer, lazy_table
 from src.display._utils import _hsv_to_rgb
 
 logger = logging.getLogger(__name__)
@@ -13,6 +12,20 @@ logger = logging.getLogger(__name__)
 WIDTH, HEIGHT = 64, 64
 FRAME_INTERVAL = 1.0 / 30
 
+# Pixel coordinate grids; the patterns below take either scalars or these
+# arrays, so a whole frame of hues is a handful of numpy operations.
+_YS, _XS = np.mgrid[0:HEIGHT, 0:WIDTH].astype(np.float64)
+
+# Fully saturated hue wheel. 6 * 256 steps is one entry per distinct colour
+# _hsv_to_rgb can produce at s = v = 1, so the lookup loses nothing.
+_HUE_STEPS = 6 * 256
+
+
+@lazy_table
+def _hue_lut():
+    return np.array([_hsv_to_rgb(i / _HUE_STEPS, 1.0, 1.0)
+                     for i in range(_HUE_STEPS)], dtype=np.uint8)
+
 
 # Different wave patterns
 def _diagonal_wave(x, y, t):
@@ -21,29 +34,37 @@ def _diagonal_wave(x, y, t):
 def _radial_wave(x, y, t):
     dx = x - 32
     dy = y - 32
-    dist = math.sqrt(dx*dx + dy*dy)
+    dist = np.sqrt(dx*dx + dy*dy)
     return dist * 0.05 + t * 0.4
 
 def _horizontal_wave(x, y, t):
-    return x * 0.04 + math.sin(y * 0.1 + t) * 0.3 + t * 0.3
+    return x * 0.04 + np.sin(y * 0.1 + t) * 0.3 + t * 0.3
 
 def _spiral_wave(x, y, t):
     dx = x - 32
     dy = y - 32
-    angle = math.atan2(dy, dx)
-    dist = math.sqrt(dx*dx + dy*dy)
-    return angle / math.pi * 0.5 + dist * 0.03 + t * 0.4
+    angle = np.arctan2(dy, dx)
+    dist = np.sqrt(dx*dx + dy*dy)
+    return angle / np.pi * 0.5 + dist * 0.03 + t * 0.4
 
 
 PATTERNS = [_diagonal_wave, _radial_wave, _horizontal_wave, _spiral_wave]
 
 
+def _render_pattern(pattern, t, out):
+    """Evaluate ``pattern`` over the whole panel into the ``out`` RGB array."""
+    hue = pattern(_XS, _YS, t) % 1.0
+    idx = (hue * _HUE_STEPS).astype(np.intp) % _HUE_STEPS
+    out[...] = _hue_lut()[idx]
+
+
 def run(matrix, duration=60):
     """Run rainbow waves for the specified duration."""
     start_time = time.time()
     t = 0
     pattern_idx = 0
     pattern_switch_interval = 15  # Switch pattern every 15 seconds
+    frame = FrameBuffer(WIDTH, HEIGHT)
     
     try:
         while time.time() - start_time < duration:
@@ -56,15 +77,8 @@ def run(matrix, duration=60):
             pattern_idx = int(elapsed_total / pattern_switch_interval) % len(PATTERNS)
             pattern = PATTERNS[pattern_idx]
             
-            image = Image.new("RGB", (WIDTH, HEIGHT))
-            pixels = image.load()
-            
-            for y in range(HEIGHT):
-                for x in range(WIDTH):
-                    hue = pattern(x, y, t) % 1.0
-                    pixels[x, y] = _hsv_to_rgb(hue, 1.0, 1.0)
-            
-            matrix.SetImage(image)
+            _render_pattern(pattern, t, frame.pixels)
+            frame.show(matrix)
             
             t += 0.04
             
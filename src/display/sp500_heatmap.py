@@ -10,8 +10,9 @@ import time
 import json
 import os
 import logging
-import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image, ImageDraw, ImageFont
+from src.display import _feeds
 from src.display._shared import should_stop
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,14 @@ logger = logging.getLogger(__name__)
 WIDTH, HEIGHT = 64, 64
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 CACHE_PATH = os.path.join(PROJECT_ROOT, "logs", "sp500_cache.json")
+FETCH_INTERVAL = 300    # seconds between full refreshes
+RETRY_INTERVAL = 60     # after a refresh that got nothing
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote?symbols={symbols}"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+BATCH_SIZE = 50         # symbols per quote request
+FETCH_WORKERS = 6       # quote requests in flight at once
+BATCH_RETRIES = 1       # extra attempts for a failed batch
+NO_DATA_COLOR = (22, 22, 30)    # tile for a symbol without a quote
 
 # Top S&P 500 companies by approximate market cap (as of 2024)
 # We include ~500 symbols; the display will fill the 64x64 grid
@@ -65,50 +74,68 @@ SP500_SYMBOLS = [
 ]
 
 
-def _fetch_batch_quotes(symbols, batch_size=10):
+def _fetch_batch(symbols):
+    """One quote request for ``symbols``: dict of symbol -> change_pct.
+
+    Raises on any HTTP or payload failure. Symbols Yahoo does not return, or
+    returns without a change, are simply absent.
+    """
+    url = QUOTE_URL.format(symbols=",".join(symbols))
+    resp = _feeds.http_get(url, timeout=15, headers=HEADERS)
+    resp.raise_for_status()
+    results = {}
+    for quote in resp.json().get("quoteResponse", {}).get("result", []):
+        sym = quote.get("symbol", "")
+        change_pct = quote.get("regularMarketChangePercent")
+        if sym and change_pct is not None:
+            results[sym] = change_pct
+    return results
+
+
+def _fetch_batch_quotes(symbols, batch_size=BATCH_SIZE, workers=FETCH_WORKERS,
+                        on_batch=None):
     """Fetch quotes for multiple symbols using Yahoo Finance.
-    
+
+    Batches go out ``workers`` at a time over the shared keep-alive session.
+    A failed batch is retried on its own (up to ``BATCH_RETRIES`` times);
+    symbols that still have no quote are left out rather than zero-filled,
+    so the heatmap shows them as missing instead of flat. ``on_batch`` is
+    called with each batch's results as they arrive.
+
     Returns dict of symbol -> change_pct
     """
     results = {}
-    headers = {"User-Agent": "Mozilla/5.0"}
-    
-    for i in range(0, len(symbols), batch_size):
-        batch = symbols[i:i + batch_size]
-        syms_str = ",".join(batch)
-        
-        url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={syms_str}"
-        try:
-            resp = requests.get(url, timeout=15, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            for quote in data.get("quoteResponse", {}).get("result", []):
-                sym = quote.get("symbol", "")
-                change_pct = quote.get("regularMarketChangePercent", 0)
-                results[sym] = change_pct
-        except Exception as e:
-            logger.debug("Batch fetch failed for %s: %s", syms_str[:30], e)
-            # Fill with zeros for failed symbols
-            for sym in batch:
-                if sym not in results:
-                    results[sym] = 0
-        
-        # Rate limit: small delay between batches
-        time.sleep(0.2)
-    
+    batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+    def fetch(batch):
+        for attempt in range(BATCH_RETRIES + 1):
+            try:
+                return _fetch_batch(batch)
+            except Exception as e:
+                logger.debug("Batch fetch failed for %s (attempt %d): %s",
+                             ",".join(batch)[:30], attempt + 1, e)
+        return {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in as_completed([pool.submit(fetch, b) for b in batches]):
+            part = future.result()
+            results.update(part)
+            if on_batch is not None and part:
+                on_batch(part)
     return results
 
 
 def _load_cache():
-    """Load cached S&P 500 data."""
+    """Load cached S&P 500 data as ``(quotes, fetched_at)``, or None.
+
+    Any age is returned: last session's quotes beat a loading screen, and
+    the feed refreshes them once they are older than its interval.
+    """
     try:
         if os.path.exists(CACHE_PATH):
             mtime = os.path.getmtime(CACHE_PATH)
-            # Cache valid for 5 minutes
-            if time.time() - mtime < 300:
-                with open(CACHE_PATH, "r") as f:
-                    return json.load(f)
+            with open(CACHE_PATH, "r") as f:
+                return json.load(f), mtime
     except Exception:
         pass
     return None
@@ -155,8 +182,8 @@ def _render_heatmap_grid(quotes, symbols):
         if y >= HEIGHT:
             break
         
-        change = quotes.get(sym, 0)
-        color = _change_to_color(change)
+        change = quotes.get(sym)
+        color = NO_DATA_COLOR if change is None else _change_to_color(change)
         
         # Top 10 get 3x3, next 40 get 2x2, rest get 1x1
         if i < 10:
@@ -189,76 +216,54 @@ def _render_heatmap_grid(quotes, symbols):
     return image
 
 
-# Background data prefetcher
-import threading
+def _refresh_quotes():
+    """Feed fetch: fresh quotes for the whole index, saved to the cache.
 
-_bg_quotes = {}
-_bg_lock = threading.Lock()
-_bg_last_fetch = 0
-_bg_fetching = False
-_bg_started = False
+    Each batch is published to the feed as it lands, so the heatmap fills
+    in during the refresh. Symbols whose batch failed keep their previous
+    quote.
+    """
+    feed = _feeds.get_feed("sp500_heatmap")
+    quotes = dict((feed.snapshot()[0] if feed else None) or {})
 
+    def on_batch(part):
+        quotes.update(part)
+        if feed is not None:
+            feed.publish(dict(quotes))
 
-def _background_fetch():
-    """Fetch S&P 500 data in background thread."""
-    global _bg_quotes, _bg_last_fetch, _bg_fetching
-    with _bg_lock:
-        _bg_fetching = True
-    try:
-        # Try cache first
-        cached = _load_cache()
-        if cached:
-            with _bg_lock:
-                _bg_quotes = cached
-                _bg_last_fetch = time.time()
-            logger.info("BG: Loaded %d S&P 500 quotes from cache", len(cached))
-        
-        # Always fetch fresh data in background
-        logger.info("BG: Fetching S&P 500 data...")
-        fresh = _fetch_batch_quotes(SP500_SYMBOLS)
-        if fresh:
-            _save_cache(fresh)
-            with _bg_lock:
-                _bg_quotes = fresh
-                _bg_last_fetch = time.time()
-            logger.info("BG: Fetched %d S&P 500 quotes", len(fresh))
-    except Exception as e:
-        logger.error("BG: S&P 500 fetch error: %s", e)
-    finally:
-        with _bg_lock:
-            _bg_fetching = False
+    logger.info("Fetching S&P 500 data...")
+    fresh = _fetch_batch_quotes(SP500_SYMBOLS, on_batch=on_batch)
+    if not fresh:
+        return None
+    _save_cache(quotes)
+    logger.info("Fetched %d of %d S&P 500 quotes", len(fresh), len(SP500_SYMBOLS))
+    return quotes
 
 
-def _ensure_data():
-    """Ensure data is available, trigger background fetch if stale."""
-    now = time.time()
-    
-    # If data is stale (>5 min) and not already fetching, start background fetch
-    with _bg_lock:
-        stale = (now - _bg_last_fetch > 300 or not _bg_quotes) and not _bg_fetching
-    if stale:
-        t = threading.Thread(target=_background_fetch, daemon=True)
-        t.start()
-    
-    with _bg_lock:
-        return dict(_bg_quotes)
+def register_feeds():
+    """Register the quotes feed, seeded from the on-disk cache."""
+    feed = _feeds.register_feed("sp500_heatmap", _refresh_quotes,
+                                FETCH_INTERVAL, retry=RETRY_INTERVAL)
+    if feed.snapshot()[0] is None:
+        cached = _load_cache()
+        if cached:
+            feed.seed(*cached)
+            logger.info("Loaded %d S&P 500 quotes from cache", len(cached[0]))
+    return feed
 
 
 def run(matrix, duration=60):
     """Run the S&P 500 heat map for the specified duration."""
-    global _bg_started
-    if not _bg_started:
-        _bg_started = True
-        threading.Thread(target=_background_fetch, daemon=True).start()
-
+    feed = register_feeds()
+    _feeds.start_feeds()
     start_time = time.time()
     
     try:
         while time.time() - start_time < duration:
             if should_stop():
                 break
-            # Get latest data (non-blocking, triggers bg fetch if stale)
-            quotes = _ensure_data()
+            # Latest data from the feed (never blocks on the network)
+            quotes = feed.snapshot()[0]
             
             if quotes:
                 image = _render_heatmap_grid(quotes, SP500_SYMBOLS)
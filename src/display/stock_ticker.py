@@ -17,8 +17,8 @@ import json
 import os
 import logging
 import threading
-import requests
 from PIL import Image, ImageDraw
+from src.display import _feeds
 from src.display._fonts import _draw_text, _text_width
 from src.display._shared import should_stop, interruptible_sleep
 
@@ -96,7 +96,7 @@ def _fetch_top_market_cap(count=100, min_cap_billions=1):
         symbols_str = ",".join(batch)
         try:
             url = BATCH_QUOTE_URL.format(symbols=symbols_str)
-            resp = requests.get(url, headers=HEADERS, timeout=15)
+            resp = _feeds.http_get(url, headers=HEADERS, timeout=15)
             resp.raise_for_status()
             data = resp.json()
             results = data.get("quoteResponse", {}).get("result", [])
@@ -151,7 +151,7 @@ def _fetch_top_movers(count=5, min_cap_billions=1):
                 "scrIds": screener_type,
                 "count": 50,
             }
-            resp = requests.get(SCREENER_URL, params=params, headers=HEADERS, timeout=15)
+            resp = _feeds.http_get(SCREENER_URL, params=params, headers=HEADERS, timeout=15)
             resp.raise_for_status()
             data = resp.json()
 
@@ -193,7 +193,7 @@ def _fetch_movers_fallback(count, min_cap):
     try:
         # Try trending tickers endpoint
         url = "https://query1.finance.yahoo.com/v1/finance/trending/US"
-        resp = requests.get(url, headers=HEADERS, timeout=10)
+        resp = _feeds.http_get(url, headers=HEADERS, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         quotes = data.get("finance", {}).get("result", [{}])[0].get("quotes", [])
@@ -211,7 +211,7 @@ def _fetch_movers_fallback(count, min_cap):
         # Batch fetch quotes for all symbols
         symbols_str = ",".join(symbols)
         quote_url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={symbols_str}"
-        resp = requests.get(quote_url, headers=HEADERS, timeout=15)
+        resp = _feeds.http_get(quote_url, headers=HEADERS, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         results = data.get("quoteResponse", {}).get("result", [])
@@ -240,7 +240,7 @@ def _fetch_industry(symbol):
     """Fetch industry/sector for a given symbol from Yahoo Finance quoteSummary."""
     try:
         url = QUOTE_SUMMARY_URL.format(symbol=symbol)
-        resp = requests.get(url, headers=HEADERS, timeout=10)
+        resp = _feeds.http_get(url, headers=HEADERS, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         result = data.get("quoteSummary", {}).get("result", [{}])[0]
@@ -258,7 +258,7 @@ def _fetch_quote(symbol):
     """Fetch stock quote with intraday price history using Yahoo Finance."""
     url = QUOTE_URL.format(symbol=symbol)
     try:
-        resp = requests.get(url, timeout=10, headers=HEADERS)
+        resp = _feeds.http_get(url, timeout=10, headers=HEADERS)
         resp.raise_for_status()
         data = resp.json()
         result = data["chart"]["result"][0]
@@ -570,19 +570,121 @@ def _render_loading():
     return image
 
 
-def run(matrix, duration=60):
-    """Run the stock ticker showing top 5 movers of the day."""
-    start_time = time.time()
+# --- Background feeds -------------------------------------------------------
+# The symbol universe and the detailed quotes live at module level so they
+# outlive a single run(): the feed scheduler keeps both warm between turns.
+
+UNIVERSE_INTERVAL = 120     # seconds between universe (symbol list) refreshes
+QUOTE_MAX_AGE = 120         # a detailed quote is refetched after this long
+PREFETCH_INTERVAL = 5       # seconds between prefetch passes
+# How many stocks to keep loaded ahead of the current one. We only fetch
+# detailed quotes for the current stock plus this many upcoming stocks,
+# rather than loading all symbols up front.
+PREFETCH_WINDOW = 3
+
+_quotes = {}        # symbol -> detailed quote (price + sparkline)
+_industries = {}    # symbol -> industry label
+_cursor = 0         # index of the stock run() is showing
+_lock = threading.Lock()
+
+
+def _fetch_universe():
+    """Feed fetch: ``{"mode", "symbols"}`` for the configured mode."""
     config = _load_config()
     mode = config.get("mode", "top_movers")
-    top_count = config.get("top_movers_count", 5)
-    top_cap_count = config.get("top_market_cap_count", 100)
     min_cap_billions = config.get("min_market_cap_billions", 1)
+    ranked = []
+    if mode == "top_market_cap":
+        top_cap_count = config.get("top_market_cap_count", 100)
+        ranked = _fetch_top_market_cap(
+            count=top_cap_count, min_cap_billions=min_cap_billions
+        )
+        fallback = SP500_SYMBOLS[:top_cap_count]
+    elif mode == "top_movers":
+        ranked = _fetch_top_movers(count=config.get("top_movers_count", 5),
+                                   min_cap_billions=min_cap_billions)
+        fallback = config.get("symbols", ["AMZN", "AAPL", "GOOGL", "MSFT", "NVDA"])
+    else:
+        fallback = config.get("symbols", ["AMZN"])
+    if ranked:
+        with _lock:
+            for m in ranked:
+                _industries[m["symbol"]] = m.get("industry", "N/A")
+        symbols = [m["symbol"] for m in ranked]
+    else:
+        symbols = fallback
+    return {"mode": mode, "symbols": symbols} if symbols else None
+
+
+def _ensure_quote(sym):
+    """Lazily fetch a detailed quote (price + sparkline) for one symbol.
+
+    Skips work if we already have a fresh quote cached. Returns True if
+    a usable quote is available afterwards.
+    """
+    now = time.time()
+    with _lock:
+        cached = _quotes.get(sym)
+    if cached and (now - cached.get("_fetched_at", 0) <= QUOTE_MAX_AGE):
+        return True
+    q = _fetch_quote(sym)
+    if q:
+        with _lock:
+            industry = _industries.get(sym)
+        if not industry or industry == "N/A":
+            industry = _fetch_industry(sym)
+        q["industry"] = industry
+        q["_fetched_at"] = now
+        with _lock:
+            _industries[sym] = industry
+            _quotes[sym] = q
+        return True
+    with _lock:
+        return sym in _quotes
+
+
+def _prefetch_quotes():
+    """Feed fetch: make sure the stocks around the cursor have quotes."""
+    universe = _feeds.get_feed("stock_ticker")
+    data = universe.snapshot()[0] if universe is not None else None
+    symbols = data["symbols"] if data else []
+    if not symbols:
+        return None
+    with _lock:
+        cursor = _cursor
+    ready = 0
+    for offset in range(PREFETCH_WINDOW + 1):
+        if _ensure_quote(symbols[(cursor + offset) % len(symbols)]):
+            ready += 1
+    return ready or None
+
+
+def register_feeds():
+    """Register the universe and quote-prefetch feeds; returns the universe."""
+    universe = _feeds.register_feed("stock_ticker", _fetch_universe,
+                                    UNIVERSE_INTERVAL)
+    # Offline, a pass with nothing cached counts as a failure; retrying it
+    # no faster than the normal cadence keeps a dead network from being
+    # asked for quotes every second.
+    _feeds.register_feed("stock_ticker.quotes", _prefetch_quotes,
+                         PREFETCH_INTERVAL, retry=PREFETCH_INTERVAL)
+    return universe
+
+
+def _set_cursor(index):
+    """Point the prefetch window at the stock being shown."""
+    global _cursor
+    with _lock:
+        _cursor = index
+    _feeds.refresh_feed("stock_ticker.quotes")
+
+
+def run(matrix, duration=60):
+    """Run the stock ticker showing top 5 movers of the day."""
+    universe = register_feeds()
+    _feeds.start_feeds()
+    start_time = time.time()
 
-    quotes = {}
-    industries = {}
-    symbols = []
-    last_fetch = 0
     sym_idx = 0
     tick = 0
     display_start = 0
@@ -593,87 +695,7 @@ def run(matrix, duration=60):
     current_img = None
     next_img = None
 
-    # How many stocks to keep loaded ahead of the current one. We only
-    # fetch detailed quotes for the current stock plus this many upcoming
-    # stocks, rather than loading all symbols up front.
-    prefetch_window = 3
-
-    def _ensure_quote(sym):
-        """Lazily fetch a detailed quote (price + sparkline) for one symbol.
-
-        Skips work if we already have a fresh quote cached. Returns True if
-        a usable quote is available afterwards.
-        """
-        now = time.time()
-        cached = quotes.get(sym)
-        if cached and (now - cached.get("_fetched_at", 0) <= 120):
-            return True
-        q = _fetch_quote(sym)
-        if q:
-            if sym not in industries or industries[sym] == "N/A":
-                industries[sym] = _fetch_industry(sym)
-            q["industry"] = industries.get(sym, "N/A")
-            q["_fetched_at"] = now
-            quotes[sym] = q
-            return True
-        return sym in quotes
-
-    # --- Background fetch thread: universe refresh + quote prefetch ---
-    _fetch_lock = threading.Lock()
-    _fetch_due = threading.Event()
-    _fetch_due.set()  # trigger initial fetch immediately
-
-    def _bg_fetch_loop():
-        nonlocal symbols, last_fetch
-        while not should_stop() and time.time() - start_time < duration:
-            _fetch_due.wait(timeout=5)
-            _fetch_due.clear()
-            now = time.time()
-            if now - last_fetch > 120 or not symbols:
-                new_symbols = None
-                if mode == "top_market_cap":
-                    ranked = _fetch_top_market_cap(
-                        count=top_cap_count, min_cap_billions=min_cap_billions
-                    )
-                    if ranked:
-                        new_symbols = [m["symbol"] for m in ranked]
-                        with _fetch_lock:
-                            for m in ranked:
-                                industries[m["symbol"]] = m.get("industry", "N/A")
-                    else:
-                        new_symbols = SP500_SYMBOLS[:top_cap_count]
-                elif mode == "top_movers":
-                    movers = _fetch_top_movers(count=top_count, min_cap_billions=min_cap_billions)
-                    if movers:
-                        new_symbols = [m["symbol"] for m in movers]
-                        with _fetch_lock:
-                            for m in movers:
-                                industries[m["symbol"]] = m.get("industry", "N/A")
-                    else:
-                        new_symbols = config.get("symbols", ["AMZN", "AAPL", "GOOGL", "MSFT", "NVDA"])
-                else:
-                    new_symbols = config.get("symbols", ["AMZN"])
-                if new_symbols:
-                    with _fetch_lock:
-                        symbols = new_symbols
-                last_fetch = now
-            # Prefetch quotes for the current window
-            with _fetch_lock:
-                cur_syms = list(symbols) if symbols else []
-                cur_idx = sym_idx
-            for offset in range(prefetch_window + 1):
-                if should_stop():
-                    break
-                if cur_syms:
-                    _ensure_quote(cur_syms[(cur_idx + offset) % len(cur_syms)])
-
-    _bg_thread = threading.Thread(target=_bg_fetch_loop, daemon=True)
-    _bg_thread.start()
-
     try:
-        # Show loading screen while fetching
-        matrix.SetImage(_render_loading())
-
         while time.time() - start_time < duration:
             if should_stop():
                 break
@@ -681,11 +703,13 @@ def run(matrix, duration=60):
             tick += 1
             now = time.time()
 
-            # Signal background thread to check for refresh
-            if now - last_fetch > 120:
-                _fetch_due.set()
+            data = universe.snapshot()[0]
+            symbols = data["symbols"] if data else []
+            mode = data["mode"] if data else None
+            with _lock:
+                quotes = dict(_quotes)
 
-            if not quotes:
+            if not symbols or not any(s in quotes for s in symbols):
                 matrix.SetImage(_render_loading())
                 if not interruptible_sleep(1):
                     break
@@ -694,6 +718,7 @@ def run(matrix, duration=60):
             # Check if it's time to switch stocks
             if not transitioning and (now - display_start) >= display_seconds:
                 sym_idx = (sym_idx + 1) % len(symbols)
+                _set_cursor(sym_idx)
                 current_sym = symbols[sym_idx]
                 if current_sym in quotes:
                     rank = sym_idx + 1 if mode in ("top_movers", "top_market_cap") else None
@@ -12,7 +12,9 @@ was subject to constant breakage from YouTube's anti-bot measures.
 
 Architecture:
   - Videos are downloaded via simple HTTP GET to downloaded_videos/
-  - Main thread plays videos from local cache
+  - Main thread plays videos from local cache: a decoder thread fills a
+    ring of ready 64x64 frames, the render loop presents them on a
+    monotonic clock and drops late frames
   - Already-cached videos play immediately (no download wait)
   - Downloads persist across reboots (only downloaded once per URL)
   - Background pre-caching at boot downloads any uncached videos
@@ -28,12 +30,15 @@ import re
 import subprocess
 import hashlib
 import logging
+import mmap
+import struct
 import threading
 import queue
 import urllib.request
 import urllib.error
+import zlib
 from PIL import Image
-from src.display._shared import should_stop
+from src.display._shared import should_stop, FrameBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -44,10 +49,21 @@ np = None
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 CACHE_DIR = os.path.join(PROJECT_ROOT, "downloaded_videos")
 
-# Target frame rate for playback on 64x64 matrix.
+# Target frame rate for playback on 64x64 matrix. Sources above this rate
+# are decimated in the decoder thread; slower sources play at their own rate.
 TARGET_FPS = 15
 FRAME_INTERVAL = 1.0 / TARGET_FPS
 
+# Pre-scaled frame files (see transcode_video).
+FRAMES_EXT = ".v64"
+FRAMES_MAGIC = b"LEDV64"
+FRAMES_VERSION = 1
+
+# Decoded frames the decoder thread may run ahead of the panel.
+RING_FRAMES = 8
+# Lateness after which the presenter restarts its clock instead of dropping.
+_RESYNC_SECONDS = 0.5
+
 
 def _ensure_dependencies():
     """Lazy-import heavy dependencies. Returns True if all available."""
@@ -75,14 +91,39 @@ def _ensure_dependencies():
     return True
 
 
+def preload():
+    """Warm-import cv2/numpy before this feature's turn in the carousel."""
+    _ensure_dependencies()
+
+
 def _url_to_cache_path(url):
     """Generate a deterministic cache filename from a URL."""
     url_hash = hashlib.md5(url.encode()).hexdigest()[:12]
     return os.path.join(CACHE_DIR, f"{url_hash}.mp4")
 
 
+def _url_to_frames_path(url):
+    """Cache filename of the pre-scaled 64x64 frame file for a URL."""
+    return _url_to_cache_path(url)[:-4] + FRAMES_EXT
+
+
+def _is_transcoded(url):
+    """Check if a URL's pre-scaled frame file exists (no decode needed)."""
+    return os.path.exists(_url_to_frames_path(url))
+
+
+def _cached_video_path(url):
+    """Path to play for a cached URL: the frame file if present, else the MP4."""
+    frames_path = _url_to_frames_path(url)
+    if os.path.exists(frames_path):
+        return frames_path
+    return _url_to_cache_path(url)
+
+
 def _is_cached(url):
     """Check if a video is already downloaded and valid."""
+    if _is_transcoded(url):
+        return True
     path = _url_to_cache_path(url)
     if not os.path.exists(path):
         return False
@@ -269,13 +310,14 @@ def download_video(url, title="Unknown"):
         title: Video title for logging.
 
     Returns:
-        Path to the downloaded file, or None on failure.
+        Path to the cached file (the pre-scaled frame file when it could be
+        transcoded, else the MP4), or None on failure.
     """
     cache_path = _url_to_cache_path(url)
 
     if _is_cached(url):
         logger.info("Already cached: '%s'", title)
-        return cache_path
+        return _transcode_cached(url, title)
 
     os.makedirs(CACHE_DIR, exist_ok=True)
 
@@ -284,7 +326,9 @@ def download_video(url, title="Unknown"):
         return None
 
     if is_youtube_url(url):
-        return _download_youtube(url, title, cache_path)
+        if _download_youtube(url, title, cache_path) is None:
+            return None
+        return _transcode_cached(url, title)
 
     logger.info("Downloading '%s' from %s", title, url)
     start = time.time()
@@ -319,7 +363,7 @@ def download_video(url, title="Unknown"):
                     pass
                 return None
             logger.info("Downloaded '%s' (%.1f MB) in %.1fs", title, size_mb, elapsed)
-            return cache_path
+            return _transcode_cached(url, title)
 
         logger.error("Download completed but no file found for '%s'", title)
         return None
@@ -340,6 +384,171 @@ def download_video(url, title="Unknown"):
     return None
 
 
+# ---------------------------------------------------------------------------
+# Pre-scaled frame files
+# ---------------------------------------------------------------------------
+# Decoding a 480p MP4 only to shrink every frame to 64x64 is most of the
+# video player's CPU. Once a video is downloaded it is decoded a single time
+# into a frame file of ready 64x64 RGB frames (decimated to TARGET_FPS,
+# zlib-compressed, identical frames stored once) and the MP4 is deleted.
+# Playback memory-maps the file and inflates one 12 KB frame per tick.
+#
+# Layout (little-endian):
+#     header  b"LEDV64" <B version> <H width> <H height> <I frames> <Q index offset>
+#     data    zlib(RGB bytes) per distinct frame
+#     index   per frame: <Q data offset> <I data length> <f pts seconds>
+
+_FRAMES_HEADER = struct.Struct("<6sBHHIQ")
+_FRAMES_INDEX_SIZE = 16
+
+
+def _frames_index_dtype():
+    return np.dtype([("offset", "<u8"), ("length", "<u4"), ("pts", "<f4")])
+
+
+def _iter_scaled_frames(cap, out_fps, width, height):
+    """Yield ``(pts, frame)`` for ``cap``, resized to ``width x height`` (BGR).
+
+    Source frames beyond ``out_fps`` are skipped with ``cap.grab()`` so they
+    are never resized; ``pts`` is the source timestamp in seconds.
+    """
+    src_fps = cap.get(cv2.CAP_PROP_FPS)
+    if not 0 < src_fps < 1000:
+        src_fps = out_fps
+    step = max(1.0, src_fps / out_fps)
+    index = 0
+    next_kept = 0.0
+    while True:
+        if index + 0.5 < next_kept:
+            if not cap.grab():
+                return
+            index += 1
+            continue
+        ok, frame = cap.read()
+        if not ok:
+            return
+        yield index / src_fps, cv2.resize(frame, (width, height),
+                                          interpolation=cv2.INTER_AREA)
+        index += 1
+        next_kept += step
+
+
+def transcode_video(src_path, dst_path, fps=TARGET_FPS, size=64):
+    """Decode ``src_path`` once into a pre-scaled frame file at ``dst_path``.
+
+    Returns True on success. The file is written under a temporary name and
+    renamed into place, so a crash never leaves a truncated frame file.
+    """
+    cap = cv2.VideoCapture(src_path)
+    if not cap.isOpened():
+        logger.error("Cannot open video file for transcoding: %s", src_path)
+        cap.release()
+        return False
+
+    tmp_path = dst_path + ".tmp"
+    start = time.time()
+    index = []
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_FRAMES_HEADER.pack(FRAMES_MAGIC, FRAMES_VERSION, size, size, 0, 0))
+            rgb = np.empty((size, size, 3), dtype=np.uint8)
+            last = None
+            for pts, small in _iter_scaled_frames(cap, fps, size, size):
+                cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb)
+                raw = rgb.tobytes()
+                if raw == last:
+                    index.append((index[-1][0], index[-1][1], pts))
+                    continue
+                data = zlib.compress(raw, 6)
+                index.append((f.tell(), len(data), pts))
+                f.write(data)
+                last = raw
+            if not index:
+                raise ValueError("no decodable frames")
+            index_offset = f.tell()
+            f.write(np.array(index, dtype=_frames_index_dtype()).tobytes())
+            f.seek(0)
+            f.write(_FRAMES_HEADER.pack(FRAMES_MAGIC, FRAMES_VERSION, size, size,
+                                        len(index), index_offset))
+        os.replace(tmp_path, dst_path)
+    except Exception as e:
+        logger.error("Transcoding %s failed: %s", src_path, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    finally:
+        cap.release()
+
+    logger.info("Transcoded %s: %d frames, %.1f MB, in %.1fs",
+                os.path.basename(src_path), len(index),
+                os.path.getsize(dst_path) / (1024 * 1024), time.time() - start)
+    return True
+
+
+def _transcode_cached(url, title):
+    """Turn a URL's cached MP4 into its frame file; return the path to play.
+
+    The MP4 is deleted once the frame file is written. Without cv2, or if
+    transcoding fails, the MP4 is kept and played through the decoder.
+    """
+    frames_path = _url_to_frames_path(url)
+    if os.path.exists(frames_path):
+        return frames_path
+    mp4_path = _url_to_cache_path(url)
+    if not _ensure_dependencies() or not transcode_video(mp4_path, frames_path):
+        return mp4_path
+    try:
+        os.remove(mp4_path)
+    except OSError:
+        pass
+    logger.info("Cached '%s' as pre-scaled frames", title)
+    return frames_path
+
+
+class _FrameFile:
+    """Read-only, memory-mapped view of a pre-scaled frame file.
+
+    Raises:
+        ValueError: if the file is not a frame file of a supported version.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mm) < _FRAMES_HEADER.size:
+                raise ValueError("Truncated frame file: %s" % path)
+            (magic, version, self.width, self.height, count,
+             index_offset) = _FRAMES_HEADER.unpack_from(self._mm, 0)
+            if magic != FRAMES_MAGIC or version != FRAMES_VERSION:
+                raise ValueError("Not a v%d frame file: %s" % (FRAMES_VERSION, path))
+            end = index_offset + count * _FRAMES_INDEX_SIZE
+            if count == 0 or end > len(self._mm):
+                raise ValueError("Truncated frame file: %s" % path)
+            # Slicing the mmap copies the index, so no buffer export keeps
+            # the map from closing.
+            self._index = np.frombuffer(self._mm[index_offset:end],
+                                        dtype=_frames_index_dtype())
+        except Exception:
+            self._mm.close()
+            raise
+        self.pts = self._index["pts"].astype(np.float64)
+
+    def __len__(self):
+        return len(self._index)
+
+    def read_into(self, i, out):
+        """Inflate frame ``i`` into the ``height x width x 3`` array ``out``."""
+        offset, length = int(self._index["offset"][i]), int(self._index["length"][i])
+        raw = zlib.decompress(self._mm[offset:offset + length])
+        out[...] = np.frombuffer(raw, dtype=np.uint8).reshape(self.height, self.width, 3)
+
+    def close(self):
+        self._mm.close()
+
+
 # ---------------------------------------------------------------------------
 # Background downloader
 # ---------------------------------------------------------------------------
@@ -426,7 +635,7 @@ class _BackgroundDownloader:
 
             # Check cache first (instant)
             if _is_cached(url):
-                path = _url_to_cache_path(url)
+                path = _cached_video_path(url)
                 self._ready_queue.put((path, title, dur))
                 self._downloaded += 1
                 logger.info("BG: Cached hit for '%s' (%d/%d)",
@@ -453,9 +662,168 @@ class _BackgroundDownloader:
 # Playback
 # ---------------------------------------------------------------------------
 
+class _FrameRing:
+    """Bounded ring of decoded ``64x64x3`` RGB frames.
+
+    One decoder thread fills slots (:meth:`reserve` / :meth:`publish`) and
+    the render thread drains them (:meth:`next` / :meth:`release`). The
+    frames live in one preallocated array, so steady-state playback does no
+    per-frame allocation; a full ring blocks the decoder, which caps how far
+    it can run ahead.
+    """
+
+    def __init__(self, capacity=RING_FRAMES, width=64, height=64):
+        self.frames = np.zeros((capacity, height, width, 3), dtype=np.uint8)
+        self._pts = [0.0] * capacity
+        self._capacity = capacity
+        self._head = 0          # oldest ready slot
+        self._count = 0         # ready slots
+        self._closed = False    # decoder finished (EOF or error)
+        self._cancelled = False  # player stopped; decoder should exit
+        self._cond = threading.Condition()
+
+    @property
+    def ready(self):
+        return self._count
+
+    @property
+    def finished(self):
+        """True once the decoder is done and every frame has been taken."""
+        with self._cond:
+            return self._closed and self._count == 0
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def reserve(self):
+        """Wait for a free slot; return its index, or None if cancelled."""
+        with self._cond:
+            while self._count == self._capacity and not self._cancelled:
+                self._cond.wait()
+            if self._cancelled:
+                return None
+            return (self._head + self._count) % self._capacity
+
+    def publish(self, pts):
+        """Mark the reserved slot ready, presented at ``pts`` seconds."""
+        with self._cond:
+            self._pts[(self._head + self._count) % self._capacity] = pts
+            self._count += 1
+            self._cond.notify_all()
+
+    def next(self, timeout):
+        """Return ``(slot, pts)`` of the oldest ready frame, or None.
+
+        The slot stays owned by the caller until :meth:`release`.
+        """
+        with self._cond:
+            if self._count == 0 and not self._closed:
+                self._cond.wait(timeout)
+            if self._count == 0:
+                return None
+            return self._head, self._pts[self._head]
+
+    def release(self):
+        """Hand the oldest slot back to the decoder."""
+        with self._cond:
+            self._head = (self._head + 1) % self._capacity
+            self._count -= 1
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def cancel(self):
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+
+def _decode_into_ring(cap, ring, out_fps):
+    """Decoder thread body: downscale and colour-convert frames into ``ring``.
+
+    Each published frame carries its source timestamp so the presenter
+    plays at real speed. Owns ``cap`` and releases it on exit.
+    """
+    try:
+        height, width = ring.frames.shape[1:3]
+        for pts, small in _iter_scaled_frames(cap, out_fps, width, height):
+            slot = ring.reserve()
+            if slot is None:
+                break
+            cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=ring.frames[slot])
+            ring.publish(pts)
+    except Exception as e:
+        logger.error("Video decode failed: %s", e, exc_info=True)
+    finally:
+        ring.close()
+        cap.release()
+
+
+def _play_frame_file(matrix, path, title, max_duration=None, global_deadline=None):
+    """Play a pre-scaled frame file; see :func:`_play_local_video`.
+
+    Each tick shows the newest frame whose timestamp has passed, so a slow
+    panel skips frames instead of slowing the video down.
+    """
+    try:
+        frames = _FrameFile(path)
+    except (OSError, ValueError) as e:
+        logger.error("Cannot open frame file %s: %s", path, e)
+        return 0
+
+    frame = FrameBuffer(frames.width, frames.height)
+    vid_start = time.time()
+    clock_origin = time.monotonic()
+    count = len(frames)
+    shown = -1
+    frames_played = 0
+    frames_dropped = 0
+
+    try:
+        while shown < count - 1:
+            if should_stop():
+                break
+            if global_deadline and time.time() >= global_deadline:
+                break
+            if max_duration and time.time() - vid_start >= max_duration:
+                break
+
+            now = time.monotonic() - clock_origin
+            i = max(0, int(np.searchsorted(frames.pts, now, side="right")) - 1)
+            if i > shown:
+                frames_dropped += max(0, i - shown - 1)
+                frames.read_into(i, frame.pixels)
+                frame.show(matrix)
+                shown = i
+                frames_played += 1
+            if shown + 1 < count:
+                wait = frames.pts[shown + 1] - (time.monotonic() - clock_origin)
+                if wait > 0:
+                    time.sleep(wait)
+    finally:
+        frames.close()
+
+    vid_elapsed = time.time() - vid_start
+    logger.info("Played '%s': %d frames in %.1fs (%.1f FPS, %d dropped)",
+                title, frames_played, vid_elapsed,
+                frames_played / max(vid_elapsed, 0.1), frames_dropped)
+    return frames_played
+
+
 def _play_local_video(matrix, video_path, title, max_duration=None, global_deadline=None):
     """Play a local video file on the matrix.
 
+    A decoder thread keeps a small ring of ready 64x64 frames ahead of the
+    presenter, which shows each frame at its source timestamp on a monotonic
+    clock (capped at ``TARGET_FPS``). When the presenter falls behind and a
+    newer frame is already decoded, late frames are dropped rather than
+    played in slow motion; a slow decoder only delays frames, it never
+    stalls the render loop.
+
     Args:
         matrix: RGBMatrix instance.
         video_path: Path to local video file.
@@ -466,18 +834,30 @@ def _play_local_video(matrix, video_path, title, max_duration=None, global_deadl
     Returns:
         Number of frames played.
     """
+    if video_path.endswith(FRAMES_EXT):
+        return _play_frame_file(matrix, video_path, title,
+                                max_duration, global_deadline)
+
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         logger.error("Cannot open video file: %s", video_path)
+        cap.release()
         return 0
 
+    ring = _FrameRing()
+    decoder = threading.Thread(target=_decode_into_ring,
+                               args=(cap, ring, TARGET_FPS),
+                               name="video-decoder", daemon=True)
+    decoder.start()
+
+    frame = FrameBuffer(64, 64)
     vid_start = time.time()
+    clock_origin = None  # monotonic time of pts 0
     frames_played = 0
+    frames_dropped = 0
 
     try:
-        while cap.isOpened():
-            frame_start = time.time()
-
+        while True:
             if should_stop():
                 break
             if global_deadline and time.time() >= global_deadline:
@@ -485,28 +865,41 @@ def _play_local_video(matrix, video_path, title, max_duration=None, global_deadl
             if max_duration and time.time() - vid_start >= max_duration:
                 break
 
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            frame = cv2.resize(frame, (64, 64), interpolation=cv2.INTER_AREA)
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            image = Image.fromarray(frame)
-            matrix.SetImage(image)
+            item = ring.next(timeout=FRAME_INTERVAL)
+            if item is None:
+                if ring.finished:
+                    break
+                continue  # decoder behind; keep the last frame up
+
+            slot, pts = item
+            now = time.monotonic()
+            if clock_origin is None:
+                clock_origin = now - pts
+            due = clock_origin + pts
+            if now - due > FRAME_INTERVAL and ring.ready > 1:
+                ring.release()
+                frames_dropped += 1
+                continue
+            if due > now:
+                time.sleep(due - now)
+            elif now - due > _RESYNC_SECONDS:
+                # Stalled long enough that catching up would only drop a
+                # burst of frames; restart the clock from this frame.
+                clock_origin = now - pts
+
+            frame.pixels[...] = ring.frames[slot]
+            ring.release()
+            frame.show(matrix)
             frames_played += 1
 
-            elapsed = time.time() - frame_start
-            sleep_time = FRAME_INTERVAL - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-
     finally:
-        cap.release()
+        ring.cancel()
+        decoder.join(timeout=2.0)
 
     vid_elapsed = time.time() - vid_start
     fps_actual = frames_played / max(vid_elapsed, 0.1)
-    logger.info("Played '%s': %d frames in %.1fs (%.1f FPS)",
-                title, frames_played, vid_elapsed, fps_actual)
+    logger.info("Played '%s': %d frames in %.1fs (%.1f FPS, %d dropped)",
+                title, frames_played, vid_elapsed, fps_actual, frames_dropped)
     return frames_played
 
 
@@ -572,7 +965,7 @@ def run(matrix, duration=60):
         playlist = []
         for url, title, dur in urls:
             if _is_cached(url):
-                playlist.append((_url_to_cache_path(url), title, dur))
+                playlist.append((_cached_video_path(url), title, dur))
             else:
                 logger.info("Video not cached, skipping: '%s'", title)
 
@@ -681,7 +1074,7 @@ def cleanup_cache(max_age_days=7):
 
     for f in os.listdir(CACHE_DIR):
         fpath = os.path.join(CACHE_DIR, f)
-        if os.path.isfile(fpath) and f.endswith('.mp4'):
+        if os.path.isfile(fpath) and f.endswith(('.mp4', FRAMES_EXT)):
             if os.path.getmtime(fpath) < cutoff:
                 try:
                     os.remove(fpath)
@@ -12,14 +12,17 @@ import logging
 import json
 import os
 import random
-import requests
 from PIL import Image, ImageDraw
+from src.display import _feeds
 from src.display._fonts import _draw_text, _text_width
 from src.display._shared import should_stop
 
 logger = logging.getLogger(__name__)
 
 WIDTH, HEIGHT = 64, 64
+FETCH_INTERVAL = 300    # Open-Meteo updates ~15 min, no need to hammer it
+RETRY_INTERVAL = 60     # after a failed fetch
+STALE_SECONDS = 900     # dim indicator once the data is this old
 
 # Colors — high contrast for LED readability
 BG_COLOR = (0, 0, 8)
@@ -462,7 +465,7 @@ def _fetch_weather(lat=None, lon=None):
         f"&temperature_unit=fahrenheit&wind_speed_unit=mph"
     )
     try:
-        resp = requests.get(url, timeout=10)
+        resp = _feeds.http_get(url, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         current = data.get("current", {})
@@ -567,12 +570,17 @@ def _render_weather(weather, animator, stale=False):
     return image
 
 
+def register_feeds():
+    """Register the weather feed with the background feed scheduler."""
+    return _feeds.register_feed("weather", _fetch_weather, FETCH_INTERVAL,
+                                retry=RETRY_INTERVAL)
+
+
 def run(matrix, duration=60):
     """Run the weather display for the specified duration."""
+    feed = register_feeds()
+    _feeds.start_feeds()
     start_time = time.time()
-    last_fetch = 0
-    last_successful_fetch = 0
-    weather = None
     animator = None
 
     try:
@@ -581,23 +589,17 @@ def run(matrix, duration=60):
                 break
             now = time.time()
 
-            # Fetch weather every 5 minutes (API updates ~15min, no need to hammer)
-            if now - last_fetch > 300 or weather is None:
-                new_weather = _fetch_weather()
-                last_fetch = now
-                if new_weather is not None:
-                    weather = new_weather
-                    last_successful_fetch = now
-                    anim_type = _code_to_anim(weather.get("code", 0),
-                                              temp=weather.get("temp"))
-                    if animator is None or animator.anim_type != anim_type:
-                        animator = WeatherAnimator(anim_type)
-                else:
-                    logger.warning("Weather fetch failed, keeping last known data")
+            # Last-known data from the feed; never blocks on the network.
+            weather, updated, _online = feed.snapshot()
+            if weather is not None:
+                anim_type = _code_to_anim(weather.get("code", 0),
+                                          temp=weather.get("temp"))
+                if animator is None or animator.anim_type != anim_type:
+                    animator = WeatherAnimator(anim_type)
 
             if weather and animator:
                 # If data is stale (>15 min), show a dim indicator
-                stale = (now - last_successful_fetch > 900) if last_successful_fetch else False
+                stale = now - updated > STALE_SECONDS
                 image = _render_weather(weather, animator, stale=stale)
                 matrix.SetImage(image)
 
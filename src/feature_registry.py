@@ -71,3 +71,9 @@ FEATURE_MODULES = {
 # Imported by main.py and app_state.py.
 INTERNET_FEATURES = {"bitcoin_price", "weather", "stock_ticker", "sp500_heatmap",
                      "video_player", "github_stats"}
+
+# Features whose data comes from a background feed (src/display/_feeds.py).
+# Each module exposes register_feeds(); main.py registers the enabled ones
+# at boot so their data is warm before their first turn in the carousel.
+FEED_FEATURES = {"weather", "stock_ticker", "sp500_heatmap", "flight_radar",
+                 "rain_radar"}
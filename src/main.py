@@ -22,7 +22,11 @@ import time
 import signal
 import threading
 
-from src.display._shared import request_stop, should_stop
+# Installed before any project import so LED_STARTUP_PROFILE=1 can time them.
+from src import startup_profile
+startup_profile.install()
+
+from src.display._shared import request_stop, should_stop, warm_lazy_tables
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +49,7 @@ def _sd_notify(state):
     except Exception:
         pass
 
-from src.feature_registry import INTERNET_FEATURES
+from src.feature_registry import FEED_FEATURES, INTERNET_FEATURES
 
 
 def _check_internet(timeout=3):
@@ -180,12 +184,135 @@ _last_frame_ts = [0.0]  # single-element list: atomic-enough mutable holder
 _FRAME_HANG_TIMEOUT = 60
 
 
-def _mark_frame():
-    """Record that a frame reached the matrix (called by _SafeMatrixProxy)."""
-    _last_frame_ts[0] = time.monotonic()
+def _mark_frame(displayed=False):
+    """Record that a frame reached the matrix (called by _SafeMatrixProxy).
+
+    ``displayed`` frames are also timed into the running feature's frame
+    profile; the watchdog's own heartbeat reset passes ``False``.
+    """
+    now = time.monotonic()
+    _last_frame_ts[0] = now
+    if displayed:
+        profile = _frame_profile[0]
+        if profile is not None:
+            profile.frame(now)
     _sd_notify("WATCHDOG=1")
 
 
+# --- Per-feature frame-time profile -----------------------------------------
+# Every frame that goes through _SafeMatrixProxy is timed into a fixed-size
+# histogram for the feature that is running, and run_feature appends a
+# one-line summary (p50/p95/p99 frame time, achieved FPS, longest stall) to a
+# size-rotated JSON-lines file when the feature ends. That file is the only
+# way to see which features drop frames on the Pi without watching the panel.
+
+_FRAME_HIST_BUCKET_MS = 2   # histogram resolution
+_FRAME_HIST_BUCKETS = 128   # covers 0-256 ms; slower frames land in the last
+_FRAME_STATS_PATH = os.path.join(PROJECT_ROOT, "logs", "frame_stats.jsonl")
+_FRAME_STATS_MAX_BYTES = 256 * 1024
+_FRAME_STATS_BACKUPS = 3
+
+
+class _FrameProfile:
+    """Fixed-size frame-interval histogram for one feature run."""
+
+    def __init__(self, feature_name):
+        self.feature = feature_name
+        self.started = time.monotonic()
+        self.counts = [0] * _FRAME_HIST_BUCKETS
+        self.frames = 0
+        self.first = None
+        self.last = None
+        self.max_interval = 0.0
+
+    def frame(self, now):
+        if self.last is None:
+            self.first = now
+        else:
+            interval = now - self.last
+            bucket = int(interval * 1000.0 / _FRAME_HIST_BUCKET_MS)
+            self.counts[min(bucket, _FRAME_HIST_BUCKETS - 1)] += 1
+            if interval > self.max_interval:
+                self.max_interval = interval
+        self.last = now
+        self.frames += 1
+
+    def percentile_ms(self, q):
+        """Frame time (ms) at percentile ``q`` (0-100), to bucket resolution.
+
+        Reports the bucket's upper edge, so it never under-states a frame
+        time; the overflow bucket reports the longest stall seen.
+        """
+        total = sum(self.counts)
+        if total == 0:
+            return 0.0
+        rank = q / 100.0 * total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if i == _FRAME_HIST_BUCKETS - 1:
+                    return round(self.max_interval * 1000.0, 1)
+                return float((i + 1) * _FRAME_HIST_BUCKET_MS)
+        return round(self.max_interval * 1000.0, 1)
+
+    def summary(self):
+        span = (self.last - self.first) if self.frames > 1 else 0.0
+        return {
+            "feature": self.feature,
+            "time": round(time.time(), 1),
+            "frames": self.frames,
+            "first_frame_s": (round(self.first - self.started, 3)
+                              if self.first is not None else None),
+            "fps": round((self.frames - 1) / span, 1) if span > 0 else 0.0,
+            "p50_ms": self.percentile_ms(50),
+            "p95_ms": self.percentile_ms(95),
+            "p99_ms": self.percentile_ms(99),
+            "max_stall_ms": round(self.max_interval * 1000.0, 1),
+        }
+
+
+_frame_profile = [None]  # _FrameProfile of the running feature, or None
+
+
+def _begin_frame_profile(feature_name):
+    """Start timing frames for ``feature_name``."""
+    _frame_profile[0] = _FrameProfile(feature_name)
+
+
+def _flush_frame_profile():
+    """Append the running feature's frame summary to the rotating stats file."""
+    profile = _frame_profile[0]
+    _frame_profile[0] = None
+    if profile is None:
+        return None
+    summary = profile.summary()
+    logger.info("Frame stats %s: %d frames, %.1f fps, p95 %.0fms, max stall %.0fms",
+                profile.feature, summary["frames"], summary["fps"],
+                summary["p95_ms"], summary["max_stall_ms"])
+    try:
+        _append_frame_stats(summary)
+    except OSError as e:
+        logger.debug("Could not write frame stats: %s", e)
+    return summary
+
+
+def _append_frame_stats(record):
+    """Append one JSON line to the frame stats file, rotating it by size."""
+    path = _FRAME_STATS_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        if os.path.getsize(path) >= _FRAME_STATS_MAX_BYTES:
+            for i in range(_FRAME_STATS_BACKUPS - 1, 0, -1):
+                if os.path.exists("%s.%d" % (path, i)):
+                    os.replace("%s.%d" % (path, i), "%s.%d" % (path, i + 1))
+            os.replace(path, path + ".1")
+    except FileNotFoundError:
+        pass
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
 def _reap_zombies_or_die(next_feature_name, matrix=None):
     """Drop finished zombie threads; exit if any abandoned thread is still alive.
 
@@ -306,6 +433,33 @@ def _sync_sequence_with_registry(config, config_path):
         logger.warning("Could not sync sequence with registry", exc_info=True)
 
 
+def _simulator_settings():
+    """Return ``(backend, frame_log, clock)`` for the simulator.
+
+    ``backend`` is ``"window"`` (pygame window, the default) or ``"headless"``
+    (no window, no frame cap, per-feature frame stats -- for soak and
+    benchmark runs). ``clock`` is ``"real"`` (the default) or ``"virtual"``,
+    which makes the headless backend skip the features' sleeps so a soak
+    runs faster than real time. Read from config.json -> ``"simulator"``;
+    the ``LED_SIM_BACKEND`` / ``LED_SIM_FRAME_LOG`` / ``LED_SIM_CLOCK``
+    environment variables override it so a CI job can switch backends
+    without touching the config.
+    """
+    sim_cfg = {}
+    try:
+        config_path = os.path.join(PROJECT_ROOT, "config", "config.json")
+        with open(config_path, "r") as f:
+            sim_cfg = json.load(f).get("simulator", {}) or {}
+    except (OSError, ValueError, AttributeError):
+        pass
+    backend = os.environ.get("LED_SIM_BACKEND") or sim_cfg.get("backend", "window")
+    frame_log = os.environ.get("LED_SIM_FRAME_LOG") or sim_cfg.get("frame_log")
+    if frame_log and not os.path.isabs(frame_log):
+        frame_log = os.path.join(PROJECT_ROOT, frame_log)
+    clock = os.environ.get("LED_SIM_CLOCK") or sim_cfg.get("clock", "real")
+    return backend, frame_log, clock
+
+
 def _create_simulator_matrix(options=None):
     """Create a simulator matrix for development/testing."""
     from src.simulator import RGBMatrix as SimRGBMatrix
@@ -316,6 +470,22 @@ def _create_simulator_matrix(options=None):
         options.rows = 64
         options.cols = 64
 
+    backend, frame_log, clock = _simulator_settings()
+    if backend == "headless":
+        from src.simulator.headless import HeadlessRGBMatrix, VirtualClock
+        if clock not in ("real", "virtual"):
+            logger.warning("Unknown simulator clock %r, using the real one", clock)
+        virtual = VirtualClock() if clock == "virtual" else None
+        matrix = HeadlessRGBMatrix(options=options, frame_log=frame_log,
+                                   clock=virtual)
+        logger.info("Using LED Matrix Simulator (headless, uncapped%s)",
+                    ", virtual clock" if virtual else "")
+        return _SafeMatrixProxy(matrix)
+    if clock != "real":
+        logger.warning("The virtual clock needs the headless backend; ignoring it")
+    if backend != "window":
+        logger.warning("Unknown simulator backend %r, using the window", backend)
+
     matrix = SimRGBMatrix(options=options)
     logger.info("Using LED Matrix Simulator (pygame window)")
     # Wrap in the same proxy as the real matrix so the frame heartbeat
@@ -331,6 +501,9 @@ class _SafeMatrixProxy:
     This proxy intercepts SetImage, catches OverflowError, and retries with
     unsafe=False to use the safe tobytes() code path instead.
 
+    Every SetImage/SwapOnVSync also feeds the watchdog heartbeat and the
+    running feature's frame-time profile (see :class:`_FrameProfile`).
+
     All other attribute accesses are delegated transparently to the real matrix.
     """
 
@@ -338,14 +511,14 @@ class _SafeMatrixProxy:
         object.__setattr__(self, '_matrix', matrix)
 
     def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
-        _mark_frame()  # heartbeat for the watchdog hang detector
+        _mark_frame(displayed=True)  # watchdog heartbeat + frame profile
         try:
             self._matrix.SetImage(image, offset_x, offset_y, unsafe)
         except OverflowError:
             self._matrix.SetImage(image, offset_x, offset_y, unsafe=False)
 
     def SwapOnVSync(self, *args, **kwargs):
-        _mark_frame()  # heartbeat for the watchdog hang detector
+        _mark_frame(displayed=True)  # watchdog heartbeat + frame profile
         return self._matrix.SwapOnVSync(*args, **kwargs)
 
     def __getattr__(self, name):
@@ -474,6 +647,52 @@ def _register_simulator_modules():
 from src.feature_registry import FEATURE_MODULES
 
 
+# run() signature cache: module name -> whether run() takes ``controller``.
+_controller_param_cache = {}
+
+
+def _run_accepts_controller(module):
+    """Return True if ``module.run`` declares a ``controller`` parameter."""
+    accepts = _controller_param_cache.get(module.__name__)
+    if accepts is None:
+        try:
+            import inspect
+            accepts = "controller" in inspect.signature(module.run).parameters
+        except (TypeError, ValueError, AttributeError):
+            accepts = False
+        _controller_param_cache[module.__name__] = accepts
+    return accepts
+
+
+def preload_feature(feature_name):
+    """Import a feature's module ahead of its turn and warm its caches.
+
+    Called from a background thread by :class:`src.app_state.DemoCarousel`
+    while the previous feature is still on the panel, so heavy modules
+    (video_player's cv2/numpy, living_world, qr_code) do not stall the panel
+    on their first appearance. Also fills the ``run()`` signature cache and
+    calls the module's optional ``preload()`` hook and builds the module's
+    ``@lazy_table`` tables (see :mod:`src.display._shared`).
+
+    Never raises; returns True if the module is ready.
+    """
+    module_path = FEATURE_MODULES.get(feature_name)
+    if not module_path:
+        return False
+    try:
+        module = importlib.import_module(module_path)
+        if hasattr(module, "run"):
+            _run_accepts_controller(module)
+        hook = getattr(module, "preload", None)
+        if callable(hook):
+            hook()
+        warm_lazy_tables(module)
+        return True
+    except Exception as e:  # noqa: BLE001 - run_feature reports real failures
+        logger.debug("Preloading %s failed: %s", feature_name, e)
+        return False
+
+
 def run_feature(feature_name, matrix, duration, controller=None):
     """
     Run a single display feature.
@@ -500,21 +719,25 @@ def run_feature(feature_name, matrix, duration, controller=None):
     # Refuse to start on top of a live abandoned thread (see _reap_zombies_or_die)
     _reap_zombies_or_die(feature_name, matrix)
 
+    # The headless simulator attributes frame counts/timings per feature.
+    begin_feature = getattr(matrix, "begin_feature", None)
+    if callable(begin_feature):
+        begin_feature(feature_name)
+
     try:
         logger.info("Starting feature: %s (duration: %ds)", feature_name, duration)
         module = importlib.import_module(module_path)
+        # Headless soak runs may swap the features' clock for a virtual one.
+        install_clock = getattr(matrix, "install_clock", None)
+        if callable(install_clock):
+            install_clock()
 
         # Forward the controller only when one was supplied AND the module's
-        # run() advertises a 'controller' parameter (introspected to stay
-        # backward compatible with the run(matrix, duration) contract).
-        pass_controller = False
-        if controller is not None and hasattr(module, "run"):
-            try:
-                import inspect
-                params = inspect.signature(module.run).parameters
-                pass_controller = "controller" in params
-            except (TypeError, ValueError):
-                pass_controller = False
+        # run() advertises a 'controller' parameter (introspected once per
+        # module and cached, to stay backward compatible with the
+        # run(matrix, duration) contract).
+        pass_controller = (controller is not None and hasattr(module, "run")
+                           and _run_accepts_controller(module))
 
         # Each display module should have a run(matrix, duration) function
         if hasattr(module, "run"):
@@ -532,7 +755,11 @@ def run_feature(feature_name, matrix, duration, controller=None):
             return False
 
         # Use watchdog timer to kill hung features (timeout = 2x duration, min 60s)
-        completed = _run_feature_with_watchdog(feature_callable, duration, feature_name)
+        _begin_frame_profile(feature_name)
+        try:
+            completed = _run_feature_with_watchdog(feature_callable, duration, feature_name)
+        finally:
+            _flush_frame_profile()
         if completed:
             logger.info("Feature '%s' completed", feature_name)
         return completed
@@ -615,6 +842,29 @@ def _check_schedule():
     return None
 
 
+def _start_data_feeds(enabled_features):
+    """Register the enabled network features' feeds and start the scheduler.
+
+    The feed scheduler (src/display/_feeds.py) lives for the whole process
+    and refreshes each feed on its own cadence, so weather, tickers and
+    radars have data on their first frame instead of a loading screen.
+    Never raises; a feature whose feed fails to register still fetches
+    on its own first run.
+    """
+    names = [f["name"] for f in enabled_features if f.get("name") in FEED_FEATURES]
+    if not names:
+        return
+    from src.display import _feeds
+    for name in names:
+        try:
+            module = importlib.import_module(FEATURE_MODULES[name])
+            module.register_feeds()
+        except Exception as e:  # noqa: BLE001 - never let a feed break boot
+            logger.warning("Registering the %s feed failed: %s", name, e)
+    _feeds.start_feeds()
+    logger.info("Background data feeds started: %s", names)
+
+
 # Maximum time (seconds) the video precache can run at boot.
 # Prevents the Pi from being saturated by downloads forever.
 _PRECACHE_TIMEOUT = 180
@@ -640,7 +890,7 @@ def _precache_videos(matrix, enabled_features):
     try:
         from src.display.video_player import (
             _ensure_dependencies, read_urls_from_csv,
-            download_video, _is_cached, _get_csv_path
+            download_video, _is_transcoded, _get_csv_path
         )
     except ImportError as e:
         logger.warning("Cannot import video_player for precaching: %s", e)
@@ -656,8 +906,10 @@ def _precache_videos(matrix, enabled_features):
         logger.info("No video URLs to precache")
         return
 
-    # Check how many are already cached (instant, no downloads)
-    already_cached = sum(1 for url, _, _ in urls if _is_cached(url))
+    # Check how many are already cached as pre-scaled frame files (instant).
+    # MP4s cached before frame files existed are transcoded below without
+    # re-downloading (download_video converts an existing MP4 in place).
+    already_cached = sum(1 for url, _, _ in urls if _is_transcoded(url))
     if already_cached == len(urls):
         logger.info("All %d videos already cached, skipping precache", already_cached)
         return
@@ -687,7 +939,7 @@ def _precache_videos(matrix, enabled_features):
 
             status["current"] = title
 
-            if _is_cached(url):
+            if _is_transcoded(url):
                 # Already counted above, skip
                 continue
 
@@ -736,6 +988,22 @@ def _precache_videos(matrix, enabled_features):
         logger.info("Video precache complete: %d/%d cached, %d failed", d, t, f)
 
 
+def _write_headless_stats(matrix):
+    """Dump the headless simulator's per-feature frame stats, if it has any."""
+    close = getattr(matrix, "close", None)
+    write_stats = getattr(matrix, "write_stats", None)
+    if not callable(write_stats):
+        return
+    try:
+        if callable(close):
+            close()
+        stats_path = os.path.join(PROJECT_ROOT, "logs", "headless_stats.json")
+        write_stats(stats_path)
+        logger.info("Headless frame stats written to %s", stats_path)
+    except Exception as e:  # noqa: BLE001 - stats must never block shutdown
+        logger.warning("Could not write headless frame stats: %s", e)
+
+
 def ensure_wifi():
     """
     Ensure WiFi connectivity before starting display loop.
@@ -777,22 +1045,13 @@ def main():
     logger.info("=" * 60)
     logger.info("LED Matrix Project starting up")
     logger.info("=" * 60)
+    startup_profile.mark("logging_ready")
 
     # Register simulator as rgbmatrix if real hardware library is unavailable.
     # Must happen before any display modules are imported, since they do
     # 'from rgbmatrix import ...' at the top level.
     _register_simulator_modules()
 
-    # Validate configuration
-    from src.config_validator import validate_all
-    validation_results = validate_all()
-    for config_name, errors in validation_results.items():
-        for err in errors:
-            if err.severity == "error":
-                logger.error("Config validation: %s -> %s", config_name, err)
-            else:
-                logger.warning("Config validation: %s -> %s", config_name, err)
-
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
@@ -801,16 +1060,30 @@ def main():
 
     # Initialize matrix and show boot screen FIRST for immediate visual feedback.
     # WiFi and config loading happen after, so the user sees something right away.
+    # Config validation only logs, so it waits until the boot screen is up.
     matrix = init_matrix()
+    startup_profile.mark("matrix_ready")
 
     try:
         from src.display.boot_screen import show as show_boot_screen
+        # The first boot-screen frame is pushed right after this mark.
+        startup_profile.mark("boot_screen")
         show_boot_screen(matrix)
     except Exception as e:
         logger.warning("Boot screen failed (non-fatal): %s", e)
 
     _sd_notify("READY=1")
 
+    # Validate configuration
+    from src.config_validator import validate_all
+    validation_results = validate_all()
+    for config_name, errors in validation_results.items():
+        for err in errors:
+            if err.severity == "error":
+                logger.error("Config validation: %s -> %s", config_name, err)
+            else:
+                logger.warning("Config validation: %s -> %s", config_name, err)
+
     # Now do the slower startup tasks (WiFi, config)
     logger.info("Checking WiFi connectivity...")
     if ensure_wifi():
@@ -831,6 +1104,9 @@ def main():
 
     logger.info("Enabled features: %s", [f["name"] for f in enabled_features])
 
+    # Warm the network features' data in the background from now on.
+    _start_data_feeds(enabled_features)
+
     # Pre-cache videos at boot if video_player is enabled.
     # Downloads happen in a background thread while a loading ring
     # animates on the matrix. If no internet, this gracefully skips.
@@ -858,6 +1134,9 @@ def main():
         logger.warning("Controller init failed (%s); continuing without input", e)
         controller = None
 
+    startup_profile.mark("controller_ready")
+    startup_profile.report()
+
     if controller is not None:
         # Delegate the whole run loop to the state machine. It owns the matrix,
         # cycles demos in IDLE, opens the menu on START, launches games, and
@@ -887,6 +1166,7 @@ def main():
         matrix.Clear()
     except Exception:
         pass
+    _write_headless_stats(matrix)
     logger.info("LED Matrix Project stopped")
 
 
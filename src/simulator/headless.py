@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Headless simulator backend for soak and benchmark runs.
+
+:class:`HeadlessRGBMatrix` is the simulator's RGBMatrix with no pygame window
+and no ``FPS_CAP`` pacing: every frame is accepted as fast as the feature can
+produce it. It keeps per-feature frame counts and frame-interval timings, and
+can optionally record every displayed frame to a compact frame log so a soak
+run can be replayed or diffed later.
+
+Selected in ``src/main.py`` via ``LED_SIM_BACKEND=headless`` (or
+``"simulator": {"backend": "headless"}`` in config.json).
+
+Frame log format (little-endian)::
+
+    header   b"LEDFLOG1" <H width> <H height>
+    feature  b"N" <d t> <H len> <utf-8 name>
+    frame    b"F" <d t> <I len> <zlib(RGB bytes)>   (len 0 = same as previous)
+
+``t`` is seconds since the log was opened. Unchanged frames cost 13 bytes,
+so a mostly static clock face records almost nothing.
+
+Features pace themselves with ``time.sleep`` and time their runs with
+``time.time()``, so dropping the frame cap alone does not shorten a soak.
+With ``LED_SIM_CLOCK=virtual`` (or ``"clock": "virtual"``) a
+:class:`VirtualClock` is installed into the display modules: their sleeps
+return at once and move their clock forward instead, so an hour of
+carousel runs as fast as the features can render it.
+"""
+
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from .matrix import RGBMatrix
+
+logger = logging.getLogger(__name__)
+
+FRAME_LOG_MAGIC = b"LEDFLOG1"
+_HEADER = struct.Struct("<HH")
+_FEATURE = struct.Struct("<cdH")
+_FRAME = struct.Struct("<cdI")
+
+# Name used for frames pushed before the first begin_feature() call
+# (boot screen, loading ring).
+BOOT_FEATURE = "(boot)"
+
+
+# Modules that keep the real clock under a VirtualClock. The feed scheduler
+# waits on real Event timeouts; measured in virtual time its feeds would fall
+# due many times a real second and hammer the upstream APIs.
+REAL_CLOCK_MODULES = frozenset({"src.display._feeds"})
+
+
+class VirtualClock:
+    """A clock that skips sleeps instead of waiting them out.
+
+    Reads as the real clock plus every second slept so far, so code that
+    sleeps to pace itself sees exactly the time it asked to wait, and code
+    that measures real work still sees that work take time. ``sleep`` only
+    yields the GIL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._skipped = 0.0
+        self._installed = []
+
+    @property
+    def skipped(self):
+        """Seconds of sleep skipped so far."""
+        with self._lock:
+            return self._skipped
+
+    def sleep(self, seconds):
+        time.sleep(0)
+        if seconds > 0:
+            with self._lock:
+                self._skipped += seconds
+
+    def time(self):
+        return time.time() + self.skipped
+
+    def monotonic(self):
+        return time.monotonic() + self.skipped
+
+    def perf_counter(self):
+        return time.perf_counter() + self.skipped
+
+    def install(self, prefix="src.display"):
+        """Swap the ``time`` module of every loaded module under ``prefix``.
+
+        Only modules that did ``import time`` are touched, and each once, so
+        this is cheap to call again after more features have been imported.
+        :data:`REAL_CLOCK_MODULES` are left alone.
+        """
+        shim = _ClockModule(self)
+        for name, module in list(sys.modules.items()):
+            if (module is not None and (name == prefix or name.startswith(prefix + "."))
+                    and name not in REAL_CLOCK_MODULES
+                    and getattr(module, "time", None) is time):
+                module.time = shim
+                self._installed.append(module)
+
+    def uninstall(self):
+        """Give every module :meth:`install` touched its real clock back."""
+        for module in self._installed:
+            module.time = time
+        self._installed = []
+
+
+class _ClockModule:
+    """Stand-in for the ``time`` module backed by a :class:`VirtualClock`."""
+
+    def __init__(self, clock):
+        self.sleep = clock.sleep
+        self.time = clock.time
+        self.monotonic = clock.monotonic
+        self.perf_counter = clock.perf_counter
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class _NullWindow:
+    """Render target that draws nothing and never sleeps."""
+
+    def render(self, pixel_buffer, brightness=100):
+        pass
+
+
+class FrameLog:
+    """Append-only compact recording of displayed frames."""
+
+    def __init__(self, path, width, height):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._f = open(path, "wb")
+        self._f.write(FRAME_LOG_MAGIC + _HEADER.pack(width, height))
+        self._t0 = time.monotonic()
+        self._last = None
+
+    def write_feature(self, name):
+        data = name.encode("utf-8")
+        self._f.write(_FEATURE.pack(b"N", time.monotonic() - self._t0,
+                                    len(data)) + data)
+
+    def write_frame(self, pixels):
+        raw = pixels.tobytes()
+        t = time.monotonic() - self._t0
+        if raw == self._last:
+            self._f.write(_FRAME.pack(b"F", t, 0))
+            return
+        self._last = raw
+        data = zlib.compress(raw, 1)
+        self._f.write(_FRAME.pack(b"F", t, len(data)) + data)
+
+    def close(self):
+        try:
+            self._f.close()
+        except Exception:
+            pass
+
+
+def read_frame_log(path):
+    """Yield the records of a frame log.
+
+    Yields ``("feature", t, name)`` and ``("frame", t, pixels)`` tuples, where
+    ``pixels`` is an ``(height, width, 3)`` uint8 array (repeat records yield
+    the previous frame again).
+
+    Raises:
+        ValueError: if the file is not a frame log.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(FRAME_LOG_MAGIC)) != FRAME_LOG_MAGIC:
+            raise ValueError("Not a frame log: %s" % path)
+        width, height = _HEADER.unpack(f.read(_HEADER.size))
+        last = np.zeros((height, width, 3), dtype=np.uint8)
+        while True:
+            tag = f.read(1)
+            if not tag:
+                return
+            if tag == b"N":
+                t, length = struct.unpack("<dH", f.read(10))
+                yield ("feature", t, f.read(length).decode("utf-8"))
+            elif tag == b"F":
+                t, length = struct.unpack("<dI", f.read(12))
+                if length:
+                    raw = zlib.decompress(f.read(length))
+                    last = np.frombuffer(raw, dtype=np.uint8).reshape(
+                        height, width, 3)
+                yield ("frame", t, last)
+            else:
+                raise ValueError("Corrupt frame log record %r in %s" % (tag, path))
+
+
+class _FeatureTiming:
+    """Frame count and frame-interval accumulators for one feature run."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.monotonic()
+        self.frames = 0
+        self.last_frame = None
+        self.total_interval = 0.0
+        self.max_interval = 0.0
+
+    def frame(self, now):
+        if self.last_frame is not None:
+            interval = now - self.last_frame
+            self.total_interval += interval
+            if interval > self.max_interval:
+                self.max_interval = interval
+        self.last_frame = now
+        self.frames += 1
+
+    def as_dict(self, now):
+        elapsed = now - self.started
+        intervals = self.frames - 1
+        return {
+            "frames": self.frames,
+            "elapsed_s": round(elapsed, 3),
+            "fps": round(self.frames / elapsed, 1) if elapsed > 0 else 0.0,
+            "mean_frame_ms": (round(self.total_interval / intervals * 1000, 2)
+                              if intervals > 0 else 0.0),
+            "max_frame_ms": round(self.max_interval * 1000, 2),
+        }
+
+
+def _merge_runs(prev, stats):
+    """Fold one run's stats into the accumulated stats for that feature."""
+    if prev is None:
+        return dict(stats, runs=1)
+    frames = prev["frames"] + stats["frames"]
+    elapsed = prev["elapsed_s"] + stats["elapsed_s"]
+    prev_n = max(0, prev["frames"] - 1)
+    run_n = max(0, stats["frames"] - 1)
+    total_ms = prev["mean_frame_ms"] * prev_n + stats["mean_frame_ms"] * run_n
+    return {
+        "frames": frames,
+        "elapsed_s": round(elapsed, 3),
+        "fps": round(frames / elapsed, 1) if elapsed > 0 else 0.0,
+        "mean_frame_ms": round(total_ms / (prev_n + run_n), 2) if prev_n + run_n else 0.0,
+        "max_frame_ms": max(prev["max_frame_ms"], stats["max_frame_ms"]),
+        "runs": prev["runs"] + 1,
+    }
+
+
+class HeadlessRGBMatrix(RGBMatrix):
+    """Simulated RGBMatrix with no window, no frame cap and frame statistics.
+
+    ``SetImage``, ``SetPixelsPillow`` and ``SwapOnVSync`` count as displayed
+    frames; ``Fill``/``Clear`` do not (features call them on exit).
+    """
+
+    def __init__(self, rows=0, chains=0, parallel=0, options=None,
+                 frame_log=None, clock=None):
+        self.clock = clock
+        self._stats_lock = threading.Lock()
+        self._timings = {}
+        self._current = _FeatureTiming(BOOT_FEATURE)
+        self._frame_log = None
+        super().__init__(rows, chains, parallel, options)
+        if frame_log:
+            self._frame_log = FrameLog(frame_log, self._cols, self._rows)
+            logger.info("Recording frames to %s", frame_log)
+
+    def _open_window(self):
+        return _NullWindow()
+
+    # --- frame accounting --------------------------------------------------
+
+    def begin_feature(self, name):
+        """Start attributing frames to ``name`` (called by ``run_feature``)."""
+        with self._stats_lock:
+            self._retire_current()
+            self._current = _FeatureTiming(name)
+            if self._frame_log is not None:
+                self._frame_log.write_feature(name)
+
+    def install_clock(self):
+        """Put the virtual clock (if any) into every loaded display module.
+
+        ``run_feature`` calls this once the feature module is imported.
+        """
+        if self.clock is not None:
+            self.clock.install()
+
+    def _retire_current(self):
+        current = self._current
+        if current.frames == 0 and current.name == BOOT_FEATURE:
+            return
+        self._timings[current.name] = _merge_runs(
+            self._timings.get(current.name), current.as_dict(time.monotonic()))
+
+    def _record_frame(self):
+        with self._stats_lock:
+            self._current.frame(time.monotonic())
+            if self._frame_log is not None:
+                self._frame_log.write_frame(self._buffer.get_array())
+
+    def feature_stats(self):
+        """Return ``{feature: {frames, elapsed_s, fps, mean_frame_ms, ...}}``.
+
+        Runs of the same feature are merged; the feature currently running is
+        included.
+        """
+        with self._stats_lock:
+            stats = dict(self._timings)
+            current = self._current
+            if current.frames or current.name != BOOT_FEATURE:
+                stats[current.name] = _merge_runs(
+                    stats.get(current.name), current.as_dict(time.monotonic()))
+            return stats
+
+    def write_stats(self, path):
+        """Write :meth:`feature_stats` to ``path`` as JSON."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.feature_stats(), f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def close(self):
+        """Flush stats, close the frame log and restore the real clock."""
+        with self._stats_lock:
+            self._retire_current()
+            self._current = _FeatureTiming(BOOT_FEATURE)
+            if self._frame_log is not None:
+                self._frame_log.close()
+                self._frame_log = None
+        if self.clock is not None:
+            self.clock.uninstall()
+
+    # --- displayed-frame entry points --------------------------------------
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True):
+        super().SetImage(image, offset_x, offset_y, unsafe)
+        self._record_frame()
+
+    def SetPixelsPillow(self, xstart, ystart, width, height, image):
+        super().SetPixelsPillow(xstart, ystart, width, height, image)
+        self._record_frame()
+
+    def SwapOnVSync(self, canvas, framerate_fraction=1):
+        canvas = super().SwapOnVSync(canvas, framerate_fraction)
+        self._record_frame()
+        return canvas
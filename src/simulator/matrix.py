@@ -10,6 +10,8 @@ import sys
 import threading
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Pygame is optional - only needed when simulator is actually used
@@ -31,51 +33,86 @@ FPS_CAP = 60         # Max frames per second for the display window
 
 
 class _PixelBuffer:
-    """Thread-safe pixel buffer for the simulated matrix."""
+    """Thread-safe pixel buffer for the simulated matrix.
+
+    Pixels live in one ``height x width x 3`` uint8 array, so images, fills
+    and canvas swaps are block copies rather than per-pixel tuple writes.
+    """
 
     def __init__(self, width=MATRIX_SIZE, height=MATRIX_SIZE):
         self.width = width
         self.height = height
-        self._pixels = [[(0, 0, 0)] * width for _ in range(height)]
+        self._pixels = np.zeros((height, width, 3), dtype=np.uint8)
         self._lock = threading.Lock()
 
     def set_pixel(self, x, y, r, g, b):
         if 0 <= x < self.width and 0 <= y < self.height:
             with self._lock:
-                self._pixels[y][x] = (r, g, b)
+                self._pixels[y, x] = (_clamp_channel(r), _clamp_channel(g),
+                                      _clamp_channel(b))
 
     def fill(self, r, g, b):
         with self._lock:
-            for y in range(self.height):
-                for x in range(self.width):
-                    self._pixels[y][x] = (r, g, b)
+            self._pixels[...] = (_clamp_channel(r), _clamp_channel(g),
+                                 _clamp_channel(b))
 
     def clear(self):
-        self.fill(0, 0, 0)
+        with self._lock:
+            self._pixels.fill(0)
 
-    def get_snapshot(self):
-        """Return a copy of the current pixel state."""
+    def get_array(self):
+        """Return a copy of the current pixels as a ``(h, w, 3)`` array."""
         with self._lock:
-            return [row[:] for row in self._pixels]
+            return self._pixels.copy()
+
+    def get_snapshot(self):
+        """Return a copy of the current pixel state as rows of RGB tuples."""
+        return [[tuple(px) for px in row] for row in self.get_array().tolist()]
 
     def set_from_image(self, image, offset_x=0, offset_y=0):
-        """Set pixels from a PIL Image."""
+        """Set pixels from a PIL Image (clipped to the buffer)."""
         try:
-            if image.mode != "RGB":
+            if image.mode not in ("RGB", "RGBX", "RGBA"):
                 image = image.convert("RGB")
-            pixels = image.load()
-            img_w, img_h = image.size
+            src = np.asarray(image)[..., :3]
+            img_h, img_w = src.shape[:2]
+            x0, y0 = max(0, offset_x), max(0, offset_y)
+            x1 = min(self.width, offset_x + img_w)
+            y1 = min(self.height, offset_y + img_h)
+            if x0 >= x1 or y0 >= y1:
+                return
             with self._lock:
-                for y in range(min(img_h, self.height - offset_y)):
-                    for x in range(min(img_w, self.width - offset_x)):
-                        tx, ty = x + offset_x, y + offset_y
-                        if 0 <= tx < self.width and 0 <= ty < self.height:
-                            r, g, b = pixels[x, y]
-                            self._pixels[ty][tx] = (r, g, b)
+                self._pixels[y0:y1, x0:x1] = src[y0 - offset_y:y1 - offset_y,
+                                                 x0 - offset_x:x1 - offset_x]
         except Exception as e:
             logger.error("Failed to set image on pixel buffer: %s", e)
 
 
+def _clamp_channel(value):
+    """Clamp a colour channel to 0..255 as the hardware's uint8 would hold it."""
+    return max(0, min(255, int(value)))
+
+
+_GAMMA_LUTS = {}
+
+
+def _gamma_lut(brightness):
+    """Return the 256-entry gamma + brightness table for ``brightness``.
+
+    Gamma ~2.2 approximates hardware PWM (linear was too bright in darks).
+    Tables are cached per brightness level, so a frame is one lookup instead
+    of a float power per channel per pixel.
+    """
+    brightness = max(0, min(100, int(brightness)))
+    lut = _GAMMA_LUTS.get(brightness)
+    if lut is None:
+        bright_factor = brightness / 100.0
+        levels = np.arange(256, dtype=np.float64) / 255.0
+        lut = ((levels ** 2.2 * bright_factor) * 255).astype(np.uint8)
+        _GAMMA_LUTS[brightness] = lut
+    return lut
+
+
 class _SimulatorWindow:
     """Manages the pygame window for rendering the LED matrix.
 
@@ -119,6 +156,11 @@ class _SimulatorWindow:
         # Controller.poll_events() (background thread) drains them.
         self._event_buffer = []
         self._event_lock = threading.Lock()
+        # Render targets, allocated once: the panel scaled up to LED cells
+        # (on first render, to match the frame's pixel format), and the gap
+        # grid drawn over it (colour-keyed so the LEDs show through).
+        self._scaled = None
+        self._grid = None
 
     def _ensure_init(self):
         """Initialize pygame if not already done."""
@@ -133,6 +175,7 @@ class _SimulatorWindow:
             self._screen = pygame.display.set_mode((win_w, win_h))
             pygame.display.set_caption(WINDOW_TITLE)
             self._clock = pygame.time.Clock()
+            self._build_render_targets(win_w, win_h)
             self._initialized = True
             self._running = True
             logger.info("Simulator window opened (%dx%d px)", win_w, win_h)
@@ -140,6 +183,19 @@ class _SimulatorWindow:
             logger.error("Failed to initialize pygame: %s", e)
             self._initialized = False
 
+    def _build_render_targets(self, win_w, win_h):
+        """Pre-build the gap-grid overlay drawn over the scaled panel."""
+        cell = PIXEL_SIZE + PIXEL_GAP
+        key = (255, 0, 255)
+        grid = pygame.Surface((win_w, win_h))
+        grid.fill(key)
+        grid.set_colorkey(key)
+        for i in range(MATRIX_SIZE + 1):
+            offset = i * cell
+            grid.fill(BG_COLOR, pygame.Rect(offset, 0, PIXEL_GAP, win_h))
+            grid.fill(BG_COLOR, pygame.Rect(0, offset, win_w, PIXEL_GAP))
+        self._grid = grid.convert()
+
     def pump_events(self) -> None:
         """Pump pygame events into the buffer without rendering.
 
@@ -218,28 +274,24 @@ class _SimulatorWindow:
         if not self._running:
             return
 
-        snapshot = pixel_buffer.get_snapshot()
-        cell = PIXEL_SIZE + PIXEL_GAP
-        bright_factor = max(0, min(100, brightness)) / 100.0
-
-        self._screen.fill(BG_COLOR)
-
-        for y in range(MATRIX_SIZE):
-            for x in range(MATRIX_SIZE):
-                r, g, b = snapshot[y][x]
-                # Gamma ~2.2 approximates hardware PWM (linear was too bright in darks)
-                color = (
-                    int(((r / 255.0) ** 2.2 * bright_factor) * 255),
-                    int(((g / 255.0) ** 2.2 * bright_factor) * 255),
-                    int(((b / 255.0) ** 2.2 * bright_factor) * 255),
-                )
-                rect = pygame.Rect(
-                    PIXEL_GAP + x * cell,
-                    PIXEL_GAP + y * cell,
-                    PIXEL_SIZE,
-                    PIXEL_SIZE
-                )
-                self._screen.fill(color, rect)
+        # One LUT pass for gamma + brightness, then a single nearest-neighbour
+        # scale of the whole panel and the pre-drawn gap grid on top.
+        frame = _gamma_lut(brightness)[pixel_buffer.get_array()]
+        height, width = frame.shape[:2]
+        panel = pygame.image.frombuffer(frame, (width, height), "RGB")
+        if (width, height) == (MATRIX_SIZE, MATRIX_SIZE):
+            if self._scaled is None:
+                cell = PIXEL_SIZE + PIXEL_GAP
+                self._scaled = pygame.Surface(
+                    (MATRIX_SIZE * cell, MATRIX_SIZE * cell), 0, panel)
+            pygame.transform.scale(panel, self._scaled.get_size(), self._scaled)
+            self._screen.blit(self._scaled, (PIXEL_GAP, PIXEL_GAP))
+        else:
+            cell = PIXEL_SIZE + PIXEL_GAP
+            self._screen.fill(BG_COLOR)
+            self._screen.blit(pygame.transform.scale(
+                panel, (width * cell, height * cell)), (PIXEL_GAP, PIXEL_GAP))
+        self._screen.blit(self._grid, (0, 0))
 
         pygame.display.flip()
         self._clock.tick(FPS_CAP)
@@ -308,6 +360,12 @@ class FrameCanvas:
         self._buffer.set_from_image(image, xstart, ystart)
 
 
+def _image_from_array(pixels):
+    """Wrap an ``(h, w, 3)`` uint8 array as a PIL RGB image."""
+    from PIL import Image as PILImage
+    return PILImage.fromarray(pixels)
+
+
 class RGBMatrixOptions:
     """Simulated RGBMatrixOptions matching the rgbmatrix.RGBMatrixOptions API."""
 
@@ -355,14 +413,19 @@ class RGBMatrix:
             self._brightness = 100
 
         self._buffer = _PixelBuffer(self._cols, self._rows)
-        self._window = _SimulatorWindow.get_instance()
-        self._window._ensure_init()
+        self._window = self._open_window()
 
         # Render initial blank state
         self._window.render(self._buffer)
 
         logger.info("LED Matrix Simulator initialized (%dx%d)", self._cols, self._rows)
 
+    def _open_window(self):
+        """Return the render target (the shared pygame window)."""
+        window = _SimulatorWindow.get_instance()
+        window._ensure_init()
+        return window
+
     @property
     def width(self):
         return self._cols
@@ -419,17 +482,20 @@ class RGBMatrix:
         return canvas
 
     def SwapOnVSync(self, canvas, framerate_fraction=1):
-        """Swap the frame canvas to display. In simulator, copy canvas buffer to display."""
-        # Copy canvas pixels to main buffer
-        snapshot = canvas._buffer.get_snapshot()
-        with self._buffer._lock:
-            for y in range(self._rows):
-                for x in range(self._cols):
-                    self._buffer._pixels[y][x] = snapshot[y][x]
+        """Display ``canvas`` and hand back the previous front buffer.
+
+        Like the hardware, this is a pointer swap: the canvas's buffer becomes
+        the displayed one and the canvas is returned holding the old frame for
+        the caller to draw the next one into. Nothing is allocated or copied.
+        """
+        front = self._buffer
+        back = canvas._buffer
+        if (back.width, back.height) == (front.width, front.height):
+            self._buffer, canvas._buffer = back, front
+        else:
+            front.set_from_image(_image_from_array(back.get_array()))
         self._window.render(self._buffer, self._brightness)
-        # Return a new canvas for the next frame (simulates double buffering)
-        new_canvas = FrameCanvas(self._cols, self._rows)
-        return new_canvas
+        return canvas
 
     def get_frame_base64(self):
         """Export current frame as base64-encoded PNG for web preview."""
@@ -442,13 +508,8 @@ class RGBMatrix:
         except AttributeError:
             _NEAREST = PILImage.NEAREST  # Pillow < 10
         
-        snapshot = self._buffer.get_snapshot()
-        img = PILImage.new("RGB", (self._cols, self._rows))
-        pixels = img.load()
-        for y in range(self._rows):
-            for x in range(self._cols):
-                pixels[x, y] = snapshot[y][x]
-        
+        img = _image_from_array(self._buffer.get_array())
+
         # Scale up for visibility (64x64 -> 256x256)
         img = img.resize((256, 256), _NEAREST)
         
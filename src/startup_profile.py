@@ -0,0 +1,209 @@
+"""Measured startup mode: per-module import times and boot milestones.
+
+Enabled with ``LED_STARTUP_PROFILE=1`` in the service environment (or the
+shell for ``python src/main.py``). When enabled, every import that happens
+after :func:`install` is timed (self and cumulative, like
+``python -X importtime``), ``main()`` records milestones such as
+``matrix_ready`` and ``boot_screen``, and :func:`report` logs the slowest
+modules and writes ``logs/startup_profile.json``.
+
+All times are seconds since the Python process started (read from
+``/proc/self/stat`` on Linux), so interpreter start-up and the
+``src/main.py`` module imports are included -- that is the delay between
+``systemctl restart`` and the first lit pixel. When disabled, every function
+here is a no-op and nothing is installed.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILE_PATH = os.path.join(PROJECT_ROOT, "logs", "startup_profile.json")
+ENV_VAR = "LED_STARTUP_PROFILE"
+
+# Number of modules listed in the log summary (the JSON file has them all).
+REPORT_TOP_N = 15
+
+_lock = threading.Lock()
+_enabled = [False]
+_origin = [time.monotonic()]     # monotonic time at process start
+_imports = {}                    # module -> [self_s, cumulative_s, thread]
+_marks = []                      # [(label, seconds since process start)]
+_stack = threading.local()
+
+
+def _process_age():
+    """Seconds since this process was exec'd, or None if unknown."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime, clock ticks since boot) comes after the
+            # parenthesised command name, which may itself contain spaces.
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def enabled():
+    return _enabled[0]
+
+
+def _timed_exec(exec_module):
+    """Wrap a loader's ``exec_module`` so each module body is timed."""
+    def exec_timed(module):
+        frames = getattr(_stack, "frames", None)
+        if frames is None:
+            frames = _stack.frames = []
+        frames.append(0.0)  # time spent in nested imports
+        start = time.perf_counter()
+        try:
+            return exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            nested = frames.pop()
+            if frames:
+                frames[-1] += total
+            with _lock:
+                _imports[module.__name__] = [
+                    total - nested, total, threading.current_thread().name]
+
+    exec_timed._startup_timed = True
+    return exec_timed
+
+
+class _ImportTimer:
+    """Meta path finder that times the loaders the real finders return.
+
+    It finds nothing itself: it asks the finders after it for a spec and
+    swaps the loader's bound ``exec_module`` for a timed one. Class-level
+    loaders (builtins, frozen modules) are left alone; they are fast.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        try:
+            finders = sys.meta_path[sys.meta_path.index(self) + 1:]
+        except ValueError:
+            return None
+        for finder in finders:
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            if (loader is not None and not isinstance(loader, type)
+                    and hasattr(loader, "exec_module")
+                    and not getattr(loader.exec_module, "_startup_timed", False)):
+                try:
+                    loader.exec_module = _timed_exec(loader.exec_module)
+                except AttributeError:
+                    pass  # loader with __slots__; leave it untimed
+            return spec
+        return None
+
+    def invalidate_caches(self):
+        pass
+
+
+_finder = _ImportTimer()
+
+
+def install(force=False):
+    """Start profiling if ``LED_STARTUP_PROFILE`` is set (or ``force``).
+
+    Call as early as possible; imports that already happened are only
+    visible through the milestones' process-relative timestamps.
+    """
+    if not force and os.environ.get(ENV_VAR, "").lower() not in ("1", "true", "yes", "on"):
+        return False
+    with _lock:
+        if _enabled[0]:
+            return True
+        age = _process_age()
+        _origin[0] = time.monotonic() - (age if age is not None else 0.0)
+        _enabled[0] = True
+    sys.meta_path.insert(0, _finder)
+    mark("profiler_installed")
+    return True
+
+
+def uninstall():
+    """Stop timing imports (recorded data is kept for :func:`report`)."""
+    with _lock:
+        _enabled[0] = False
+    try:
+        sys.meta_path.remove(_finder)
+    except ValueError:
+        pass
+
+
+def reset():
+    """Drop all recorded data (used by tests)."""
+    with _lock:
+        _imports.clear()
+        del _marks[:]
+
+
+def mark(label):
+    """Record a boot milestone at the current time."""
+    if not _enabled[0]:
+        return
+    with _lock:
+        _marks.append((label, time.monotonic() - _origin[0]))
+
+
+def summary():
+    """Return the profile as a JSON-serialisable dict."""
+    with _lock:
+        imports = sorted(_imports.items(), key=lambda kv: kv[1][0], reverse=True)
+        marks = list(_marks)
+    return {
+        "milestones": [{"label": label, "t_s": round(t, 4)} for label, t in marks],
+        "imports": [
+            {"module": name, "self_ms": round(s * 1000, 2),
+             "cumulative_ms": round(c * 1000, 2), "thread": thread}
+            for name, (s, c, thread) in imports
+        ],
+        "import_total_ms": round(sum(v[0] for _, v in imports) * 1000, 2),
+    }
+
+
+def report(path=None):
+    """Log the slowest imports and milestones and write the JSON profile.
+
+    Stops import timing. Safe to call when profiling is disabled (no-op).
+    """
+    if not _enabled[0]:
+        return None
+    mark("report")
+    uninstall()
+    data = summary()
+    for m in data["milestones"]:
+        logger.info("Startup: %-24s %7.3fs", m["label"], m["t_s"])
+    logger.info("Startup: %d modules imported, %.1f ms total; slowest:",
+                len(data["imports"]), data["import_total_ms"])
+    for entry in data["imports"][:REPORT_TOP_N]:
+        logger.info("Startup:   %8.1f ms self %8.1f ms cum  %s",
+                    entry["self_ms"], entry["cumulative_ms"], entry["module"])
+    path = path or PROFILE_PATH
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write startup profile: %s", e)
+    return data
@@ -65,6 +65,66 @@ def _never_run_real_updater(monkeypatch):
                                            "called from a test")))
 
 
+@pytest.fixture(autouse=True)
+def _fresh_feed_scheduler(monkeypatch):
+    """Give every test its own background feed scheduler.
+
+    Network features register long-lived feeds with a process-wide
+    scheduler (src/display/_feeds.py); without this, feeds and their data
+    would leak from one test into the next.
+    """
+    from src.display import _feeds
+
+    scheduler = _feeds.FeedScheduler()
+    monkeypatch.setattr(_feeds, "_scheduler", scheduler)
+    yield
+    scheduler.stop()
+
+
+@pytest.fixture(autouse=True)
+def _frame_stats_in_tmp(monkeypatch, tmp_path):
+    """Send run_feature's per-run frame stats to a temp file.
+
+    Every test that drives src.main.run_feature would otherwise append to
+    the real logs/frame_stats.jsonl.
+    """
+    import src.main as main
+
+    monkeypatch.setattr(main, "_FRAME_STATS_PATH",
+                        str(tmp_path / "frame_stats.jsonl"))
+
+
+@pytest.fixture(autouse=True)
+def _living_world_save_in_tmp(monkeypatch, tmp_path):
+    """Keep living_world's save file out of config/.
+
+    The binary ``.lwb`` save is not one of the files
+    ``preserve_config_files`` cleans up, so a save written by one test
+    would be resumed by the next one that starts the simulation.
+    """
+    from src.display.living_world import persistence, world_api
+
+    save_path = str(tmp_path / "living_world_save.lwb")
+    monkeypatch.setattr(persistence, "_SAVE_PATH", save_path)
+    monkeypatch.setattr(world_api, "_SAVE_PATH", save_path)
+
+
+@pytest.fixture(autouse=True)
+def _live_snapshot_in_tmp(monkeypatch, tmp_path):
+    """Keep living_world's live snapshot (and its delta log) out of logs/.
+
+    The delta log's path derives from the live path, so redirecting the one
+    covers both. The module-level publisher and throttle are reset too, so
+    keyframe state never carries from one test into the next.
+    """
+    from src.display.living_world import world_api
+
+    monkeypatch.setattr(world_api, "_LIVE_SNAPSHOT_PATH",
+                        str(tmp_path / "living_world_snapshot.json"))
+    monkeypatch.setattr(world_api, "_publisher", world_api.SnapshotPublisher())
+    monkeypatch.setattr(world_api, "_last_snapshot_time", 0.0)
+
+
 @pytest.fixture(autouse=True)
 def preserve_config_files():
     """Backup and restore config files to prevent tests from polluting the repo.
@@ -411,6 +411,40 @@ class TestDemoCarousel:
         assert "fire" in ran
         assert "weather" not in ran  # skipped: no internet
 
+    def test_preloads_next_feature_while_current_runs(self, config, monkeypatch):
+        """Each feature's successor is preloaded before the feature starts."""
+        events = []
+
+        def fake_run_feature(name, matrix, duration, controller=None):
+            carousel._preload_thread.join(timeout=5)
+            events.append(("run", name))
+            return True
+
+        def fake_preload(name):
+            events.append(("preload", name))
+            return True
+
+        monkeypatch.setattr(main_module, "run_feature", fake_run_feature)
+        monkeypatch.setattr(main_module, "preload_feature", fake_preload)
+        monkeypatch.setattr(main_module, "_check_internet", lambda *a, **k: True)
+        monkeypatch.setattr(main_module, "_check_schedule", lambda *a, **k: None)
+        monkeypatch.setattr(main_module, "load_config", lambda: config)
+        monkeypatch.setattr(time, "sleep", lambda s: None)
+
+        carousel = DemoCarousel(FakeMatrix(), config, threading.Event())
+        carousel.run_cycle()
+
+        # fire runs while snake preloads; snake runs while the next cycle's
+        # first feature (fire again) preloads.
+        assert events == [("preload", "snake"), ("run", "fire"),
+                          ("preload", "fire"), ("run", "snake")]
+
+    def test_next_runnable_skips_offline_internet_features(self):
+        features = [{"name": "fire"}, {"name": "weather"}, {"name": "snake"}]
+        assert DemoCarousel._next_runnable(features, 0, False) == "snake"
+        assert DemoCarousel._next_runnable(features, 0, True) == "weather"
+        assert DemoCarousel._next_runnable(features, 2, False) == "fire"
+
     def test_menu_request_interrupts_carousel(self, config, monkeypatch):
         """A START press (menu_requested -> True) breaks the carousel mid-cycle.
 
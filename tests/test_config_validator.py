@@ -88,6 +88,49 @@ class TestConfigValidation:
         finally:
             os.unlink(path)
 
+    def test_invalid_simulator_backend(self):
+        config = {
+            "simulator": {"backend": "vulkan"},
+            "sequence": [
+                {"name": "snake", "type": "game", "enabled": True}
+            ]
+        }
+        path = self._write_temp_config(config)
+        try:
+            errors = validate_config(path)
+            assert any(e.field == "simulator.backend" for e in errors)
+        finally:
+            os.unlink(path)
+
+    def test_invalid_simulator_clock(self):
+        config = {
+            "simulator": {"backend": "headless", "clock": "virtul"},
+            "sequence": [
+                {"name": "snake", "type": "game", "enabled": True}
+            ]
+        }
+        path = self._write_temp_config(config)
+        try:
+            errors = validate_config(path)
+            assert any(e.field == "simulator.clock" for e in errors)
+        finally:
+            os.unlink(path)
+
+    def test_headless_simulator_backend_valid(self):
+        config = {
+            "simulator": {"backend": "headless", "frame_log": "logs/frames.flog",
+                          "clock": "virtual"},
+            "sequence": [
+                {"name": "snake", "type": "game", "enabled": True}
+            ]
+        }
+        path = self._write_temp_config(config)
+        try:
+            errors = validate_config(path)
+            assert not any(e.field.startswith("simulator") for e in errors)
+        finally:
+            os.unlink(path)
+
     def test_negative_duration(self):
         config = {
             "display_duration": -10,
@@ -321,7 +321,7 @@ class TestDisplayModuleInterface:
     def test_weather_runs_briefly(self, matrix):
         """Weather display should run briefly without crashing (network mocked)."""
         tracker = _PixelTracker(matrix).start()
-        with patch("src.display.weather.requests.get",
+        with patch("src.display._feeds.http_get",
                    side_effect=Exception("mocked network")):
             mod = importlib.import_module("src.display.weather")
             mod.run(matrix, duration=2)
@@ -342,7 +342,7 @@ class TestDisplayModuleInterface:
     def test_stock_ticker_runs_briefly(self, matrix):
         """Stock ticker should run briefly without crashing (network mocked)."""
         tracker = _PixelTracker(matrix).start()
-        with patch("src.display.stock_ticker.requests.get",
+        with patch("src.display._feeds.http_get",
                    side_effect=Exception("mocked network")):
             mod = importlib.import_module("src.display.stock_ticker")
             mod.run(matrix, duration=2)
@@ -352,7 +352,7 @@ class TestDisplayModuleInterface:
     def test_sp500_heatmap_runs_briefly(self, matrix):
         """S&P 500 heatmap should run briefly and produce output (network mocked)."""
         tracker = _PixelTracker(matrix).start()
-        with patch("src.display.sp500_heatmap.requests.get",
+        with patch("src.display._feeds.http_get",
                    side_effect=Exception("mocked network")):
             mod = importlib.import_module("src.display.sp500_heatmap")
             mod.run(matrix, duration=2)
@@ -362,7 +362,7 @@ class TestDisplayModuleInterface:
     def test_rain_radar_runs_briefly(self, matrix):
         """Rain radar should draw its basemap even with the network down."""
         tracker = _PixelTracker(matrix).start()
-        with patch("src.display.rain_radar.requests.get",
+        with patch("src.display._feeds.http_get",
                    side_effect=Exception("mocked network")):
             mod = importlib.import_module("src.display.rain_radar")
             mod.run(matrix, duration=2)
@@ -428,3 +428,37 @@ class TestMainModule:
         for name, path in FEATURE_MODULES.items():
             mod = importlib.import_module(path)
             assert hasattr(mod, "run"), f"{name} ({path}) missing run()"
+
+    def test_preload_feature_imports_and_caches_signature(self):
+        """Preloading fills the run() signature cache run_feature consults."""
+        from src import main
+        main._controller_param_cache.pop("src.display.snake", None)
+        assert main.preload_feature("snake") is True
+        assert main._controller_param_cache["src.display.snake"] is True
+        assert main.preload_feature("fire") is True
+        assert main._controller_param_cache["src.display.fire"] is False
+
+    def test_preload_feature_calls_module_hook(self, monkeypatch):
+        from src import main
+        mod = importlib.import_module("src.display.qr_code")
+        called = []
+        monkeypatch.setattr(mod, "preload", lambda: called.append(True))
+        assert main.preload_feature("qr_code") is True
+        assert called == [True]
+
+    def test_preload_feature_warms_lazy_tables(self, monkeypatch):
+        from src import main
+        from src.display._shared import lazy_table
+        mod = importlib.import_module("src.display.plasma")
+        table = lazy_table(lambda: [0] * 4)
+        monkeypatch.setattr(mod, "_test_table", table, raising=False)
+        assert main.preload_feature("plasma") is True
+        assert table.built
+        assert mod._palette_lut.built
+
+    def test_preload_feature_never_raises(self, monkeypatch):
+        from src import main
+        assert main.preload_feature("no_such_feature") is False
+        mod = importlib.import_module("src.display.qr_code")
+        monkeypatch.setattr(mod, "preload", lambda: 1 / 0)
+        assert main.preload_feature("qr_code") is False
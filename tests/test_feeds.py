@@ -0,0 +1,142 @@
+"""Tests for the background data-feed service (src/display/_feeds.py)."""
+
+import threading
+import time
+
+import pytest
+
+from src.display import _feeds
+from src.display._feeds import Feed, FeedScheduler
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestFeed:
+    def test_starts_empty_and_acquiring(self):
+        feed = Feed("x", lambda: 1, interval=10)
+        assert feed.snapshot() == (None, 0.0, None)
+        assert feed.due(time.time())
+
+    def test_a_feed_needs_a_fetch_function(self):
+        with pytest.raises(TypeError):
+            Feed("x")
+
+        class Counter(Feed):
+            def fetch(self):
+                return 1
+
+        assert Counter("x").poll()
+
+    def test_failure_keeps_last_good_data(self):
+        results = iter([{"t": 70}, None])
+        feed = Feed("x", lambda: next(results), interval=300, retry=60)
+        assert feed.poll()
+        data, updated, online = feed.snapshot()
+        assert data == {"t": 70} and online is True and updated > 0
+        assert not feed.poll()
+        assert feed.snapshot() == ({"t": 70}, updated, False)
+
+    def test_exceptions_count_as_failures(self):
+        def boom():
+            raise RuntimeError("network down")
+        feed = Feed("x", boom, interval=300)
+        assert not feed.poll()
+        assert feed.online is False
+
+    def test_failed_feed_retries_sooner(self):
+        feed = Feed("x", lambda: None, interval=300, retry=60)
+        feed.poll()
+        now = feed.last_attempt
+        assert not feed.due(now + 59)
+        assert feed.due(now + 61)
+        feed.fetch = lambda: 1
+        feed.poll()
+        assert not feed.due(feed.last_attempt + 61)
+
+    def test_published_partial_data_is_visible_but_not_an_update(self):
+        feed = Feed("x", lambda: None, interval=300)
+        feed.publish({"half": 1})
+        assert feed.snapshot() == ({"half": 1}, 0.0, None)
+        assert feed.due(time.time())
+
+    def test_seed_sets_the_cadence_from_the_data_age(self):
+        feed = Feed("x", lambda: 1, interval=300)
+        feed.seed({"a": 1}, time.time() - 100)
+        assert feed.snapshot()[0] == {"a": 1}
+        assert not feed.due(time.time())
+        assert feed.due(time.time() + 201)
+        # An older cache never overwrites newer data.
+        feed.seed({"a": 0}, time.time() - 1000)
+        assert feed.snapshot()[0] == {"a": 1}
+
+
+class TestScheduler:
+    def test_polls_registered_feeds_in_the_background(self):
+        scheduler = FeedScheduler(tick=0.01)
+        feed = scheduler.register(Feed("x", lambda: "hello", interval=300))
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: feed.snapshot()[0] == "hello")
+        finally:
+            scheduler.stop()
+        assert not scheduler.running
+
+    def test_register_is_idempotent_by_key(self):
+        scheduler = FeedScheduler()
+        first = scheduler.register(Feed("x", lambda: 1, interval=10))
+        assert scheduler.register(Feed("x", lambda: 2, interval=10)) is first
+        moved = Feed("x", lambda: 3, interval=10)
+        moved.key = ("x", "elsewhere")
+        assert scheduler.register(moved) is moved
+        assert scheduler.get("x") is moved
+
+    def test_refresh_polls_ahead_of_the_cadence(self):
+        calls = []
+        scheduler = FeedScheduler(tick=0.01)
+        scheduler.register(Feed("x", lambda: calls.append(1) or len(calls),
+                                interval=300))
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: len(calls) == 1)
+            scheduler.refresh("x")
+            assert _wait_for(lambda: len(calls) == 2)
+        finally:
+            scheduler.stop()
+
+    def test_a_slow_feed_is_never_fetched_twice_at_once(self):
+        release = threading.Event()
+        active, peak = [0], [0]
+
+        def slow():
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            release.wait(1.0)
+            active[0] -= 1
+            return 1
+
+        scheduler = FeedScheduler(tick=0.01)
+        scheduler.register(Feed("slow", slow, interval=0))
+        fast = scheduler.register(Feed("fast", lambda: "ok", interval=300))
+        scheduler.start()
+        try:
+            assert _wait_for(lambda: fast.snapshot()[0] == "ok")
+            time.sleep(0.1)
+            release.set()
+        finally:
+            scheduler.stop()
+        assert peak[0] == 1
+
+    def test_module_level_helpers_share_one_scheduler(self):
+        feed = _feeds.register_feed("shared", lambda: 5, 300)
+        assert _feeds.register_feed("shared", lambda: 6, 300) is feed
+        assert _feeds.get_feed("shared") is feed
+        _feeds.start_feeds()
+        _feeds.start_feeds()        # idempotent
+        assert _wait_for(lambda: feed.snapshot()[0] == 5)
@@ -69,7 +69,7 @@ def _no_network(monkeypatch):
     """Nothing in this file may make a real HTTP request."""
     def boom(*a, **k):
         raise AssertionError("test made a real network call")
-    monkeypatch.setattr(fr.requests, "get", boom)
+    monkeypatch.setattr(fr._feeds, "http_get", boom)
 
 
 def _contact(east=0.0, north=10.0, alt=10000, on_ground=False, speed=400.0,
@@ -353,6 +353,37 @@ def test_beam_trail_is_uniform_not_a_comb():
             assert near >= far * 0.33, f"comb artefact: {samples}"
 
 
+def test_beam_ray_table_stays_inside_the_disc():
+    """Every precomputed ray reaches from the centre to the rim, clipped."""
+    for i, ray in enumerate(fr._beam_rays()):
+        ys, xs = divmod(ray, fr.WIDTH)
+        dist = ((xs - fr.CX) ** 2 + (ys - fr.CY) ** 2) ** 0.5
+        assert dist.max() <= fr.SCOPE_R + 1.5, f"ray {i} spills"
+        assert dist.min() < 2 and dist.max() > fr.SCOPE_R - 2, f"ray {i} short"
+
+
+def test_phosphor_decays_in_place_and_compose_reuses_its_buffer():
+    """The per-frame path works on persistent arrays, not fresh images."""
+    scope = Scope(30.0)
+    scope.draw_beam()
+    glow = scope._glow
+    peak = glow.max()
+    scope.decay()
+    assert scope._glow is glow
+    assert glow.max() == pytest.approx(peak * fr.BEAM_DECAY)
+    # Two half-steps fade exactly as far as one full step.
+    scope.decay(fr.DECAY_STEP / 2)
+    scope.decay(fr.DECAY_STEP / 2)
+    assert glow.max() == pytest.approx(peak * fr.BEAM_DECAY ** 2)
+    first = scope.compose()
+    scope.paint(first, _contact(east=0.0, north=15.0))
+    second = scope.compose()
+    # paint() draws on a copy, never into the reused buffer.
+    assert first.tobytes() != second.tobytes()
+    assert second.getpixel((int(fr.CX), int(fr.CY - 15))) != \
+        first.getpixel((int(fr.CX), int(fr.CY - 15)))
+
+
 def test_contacts_are_drawn_live_at_full_colour():
     """Contacts are repainted crisp every frame, not left to decay.
 
@@ -619,7 +650,7 @@ def test_feed_requests_the_radius_in_nautical_miles(monkeypatch):
         seen["headers"] = kwargs.get("headers", {})
         return Resp()
 
-    monkeypatch.setattr(fr.requests, "get", fake_get)
+    monkeypatch.setattr(fr._feeds, "http_get", fake_get)
     feed = AircraftFeed(30.27, -97.74, 30.0, 12.0)
     assert feed._poll_once() == []
     assert seen["url"].endswith("/26")      # 30 statute miles = 26 nm
@@ -641,7 +672,7 @@ def test_feed_falls_back_to_the_second_endpoint(monkeypatch):
         calls.append(url)
         return Resp(500 if len(calls) == 1 else 200)
 
-    monkeypatch.setattr(fr.requests, "get", fake_get)
+    monkeypatch.setattr(fr._feeds, "http_get", fake_get)
     feed = AircraftFeed(30.27, -97.74, 30.0, 12.0)
     contacts = feed._poll_once()
     assert len(calls) == 2
@@ -652,7 +683,7 @@ def test_feed_returns_none_when_every_endpoint_fails(monkeypatch):
     def fake_get(url, **kwargs):
         raise fr.requests.RequestException("down")
 
-    monkeypatch.setattr(fr.requests, "get", fake_get)
+    monkeypatch.setattr(fr._feeds, "http_get", fake_get)
     feed = AircraftFeed(30.27, -97.74, 30.0, 12.0)
     assert feed._poll_once() is None
 
@@ -665,7 +696,7 @@ def test_feed_survives_a_non_json_body(monkeypatch):
         def json():
             raise ValueError("not json")
 
-    monkeypatch.setattr(fr.requests, "get", lambda url, **k: Resp())
+    monkeypatch.setattr(fr._feeds, "http_get", lambda url, **k: Resp())
     feed = AircraftFeed(30.27, -97.74, 30.0, 12.0)
     assert feed._poll_once() is None
 
@@ -752,14 +783,22 @@ def test_run_survives_a_broken_matrix(monkeypatch):
 
 
 def test_run_leaves_no_thread_behind(monkeypatch):
+    """Polling belongs to the shared feed scheduler, not to the demo."""
     import threading
+    from src.display import _feeds
     monkeypatch.setattr(AircraftFeed, "_poll_once", lambda self: [])
-    before = threading.active_count()
+    _feeds.start_feeds()
+
+    def extra():
+        return [t for t in threading.enumerate()
+                if t not in before and not t.name.startswith("feed")]
+
+    before = set(threading.enumerate())
     fr.run(_Recorder(), duration=0.3)
     deadline = time.time() + 2.0
-    while time.time() < deadline and threading.active_count() > before:
+    while time.time() < deadline and extra():
         time.sleep(0.02)
-    assert threading.active_count() <= before, "poll thread outlived the demo"
+    assert not extra(), "poll thread outlived the demo"
 
 
 def test_frame_interval_is_a_sane_frame_rate():
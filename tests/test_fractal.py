@@ -33,7 +33,7 @@ class _Recorder:
 
     def SetImage(self, image, *args, **kwargs):
         self.frames += 1
-        self.last = image.copy()
+        self.last = image.convert("RGB")
 
     def Clear(self):
         pass
@@ -253,3 +253,21 @@ class TestRun:
         start = time.time()
         fractal.run(_Recorder(), duration=60)
         assert time.time() - start < 5.0
+
+
+class TestMandelbrotVectorized:
+    @pytest.mark.parametrize("t", [0.0, 0.4, 0.9])
+    def test_array_iterations_match_scalar(self, t):
+        """The whole-frame path must colour exactly what the per-pixel one did."""
+        import numpy as np
+        scale, cx, cy, max_iter = fractal._mandelbrot_view(t)
+        real, imag = np.broadcast_arrays(
+            cx + fractal._MANDEL_DX[np.newaxis, :] * scale,
+            cy + fractal._MANDEL_DY[:, np.newaxis] * scale)
+        iters = fractal._mandelbrot_iters(real, imag, max_iter)
+        for py in range(0, 64, 3):
+            for px in range(0, 64, 3):
+                want = fractal._mandelbrot_iter(
+                    cx + (px - 32) * scale / 64, cy + (py - 32) * scale / 64,
+                    max_iter)
+                assert iters[py, px] == want
@@ -0,0 +1,225 @@
+"""Tests for the shared numpy FrameBuffer and the effects rendered through it.
+
+The FrameBuffer's whole point is that :attr:`pixels` and :attr:`image` share
+memory, so these tests pin that a write to the array is what the matrix sees
+without any per-frame conversion, and that the effects converted onto it
+still produce the colours their original per-pixel loops did.
+"""
+
+import numpy as np
+import pytest
+
+from src.display._shared import FrameBuffer
+from src.display._utils import _hsv_to_rgb
+
+
+class _Recorder:
+    """Matrix stand-in that keeps an RGB copy of the last frame."""
+
+    def __init__(self):
+        self.frames = 0
+        self.last = None
+
+    def SetImage(self, image, *args, **kwargs):
+        self.frames += 1
+        self.last = image.convert("RGB")
+
+    def SwapOnVSync(self, canvas, *args, **kwargs):
+        self.frames += 1
+        return canvas
+
+    def Clear(self):
+        pass
+
+
+class TestFrameBuffer:
+    def test_shape_and_dtype(self):
+        fb = FrameBuffer(64, 32)
+        assert fb.pixels.shape == (32, 64, 3)
+        assert fb.pixels.dtype == np.uint8
+        assert fb.image.size == (64, 32)
+
+    def test_starts_black(self):
+        fb = FrameBuffer()
+        assert not fb.pixels.any()
+
+    def test_array_writes_are_visible_to_the_image(self):
+        """No copy between the array and the Image handed to SetImage."""
+        fb = FrameBuffer()
+        image = fb.image
+        fb.pixels[5, 7] = (10, 20, 30)
+        assert image.convert("RGB").getpixel((7, 5)) == (10, 20, 30)
+        assert fb.image is image  # same object every frame, no reallocation
+
+    def test_clear_fills_colour(self):
+        fb = FrameBuffer()
+        fb.clear((1, 2, 3))
+        assert (fb.pixels == (1, 2, 3)).all()
+
+    def test_show_pushes_to_matrix(self):
+        fb = FrameBuffer()
+        fb.pixels[0, 0] = (255, 0, 0)
+        rec = _Recorder()
+        fb.show(rec)
+        assert rec.frames == 1
+        assert rec.last.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_swap_draws_on_canvas(self):
+        fb = FrameBuffer()
+        fb.pixels[3, 4] = (0, 255, 0)
+        canvas = _Recorder()
+        matrix = _Recorder()
+        assert fb.swap(matrix, canvas) is canvas
+        assert canvas.last.getpixel((4, 3)) == (0, 255, 0)
+        assert matrix.frames == 1
+
+    def test_simulator_accepts_frame(self, matrix):
+        fb = FrameBuffer(matrix.width, matrix.height)
+        fb.clear((40, 50, 60))
+        fb.show(matrix)
+        assert matrix._buffer.get_snapshot()[10][10] == (40, 50, 60)
+
+
+class TestRainbowWaves:
+    @pytest.mark.parametrize("pattern_idx", range(4))
+    def test_vectorized_render_matches_scalar_pattern(self, pattern_idx):
+        from src.display import rainbow_waves
+        pattern = rainbow_waves.PATTERNS[pattern_idx]
+        fb = FrameBuffer()
+        rainbow_waves._render_pattern(pattern, 1.3, fb.pixels)
+        for y in range(0, 64, 7):
+            for x in range(0, 64, 5):
+                want = _hsv_to_rgb(float(pattern(x, y, 1.3)) % 1.0, 1.0, 1.0)
+                got = tuple(int(c) for c in fb.pixels[y, x])
+                assert max(abs(a - b) for a, b in zip(want, got)) <= 2
+
+
+class _FixedRng:
+    """Deterministic stand-in for ``numpy.random.Generator`` in fire tests."""
+
+    def random(self, n):
+        return np.ones(n)
+
+    def integers(self, low, high, n):
+        return np.full(n, 200)
+
+    def uniform(self, low, high, shape):
+        return np.full(shape, 1.0)
+
+
+class TestFire:
+    def test_step_matches_reference_loop(self):
+        """The array step must reproduce the original per-pixel propagation."""
+        from src.display import fire
+        heat = fire._new_heat()
+        rng = np.random.default_rng(7)
+        for _ in range(20):
+            fire._step_heat(heat, rng)
+
+        ref = [[int(v) for v in row] for row in heat]
+        ref[fire.HEIGHT] = [200] * fire.WIDTH
+        want = [row[:] for row in ref]
+        w, h = fire.WIDTH, fire.HEIGHT
+        for y in range(h):
+            for x in range(w):
+                avg = (ref[y + 1][(x - 1) % w] + ref[y + 1][x]
+                       + ref[y + 1][(x + 1) % w] + ref[min(y + 2, h)][x]) * 0.25
+                want[y][x] = max(0, min(255, int(avg - 1.0)))
+
+        fire._step_heat(heat, _FixedRng())
+        assert heat[:h].tolist() == want[:h]
+
+    def test_heat_stays_in_palette_range(self):
+        from src.display import fire
+        heat = fire._new_heat()
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            fire._step_heat(heat, rng)
+        assert heat.min() >= 0 and heat.max() <= 255
+        assert heat[: fire.HEIGHT].any(), "fire never rose off the seed row"
+
+    def test_palette_array_matches_palette(self):
+        from src.display import fire
+        assert fire._palette_array().tolist() == [list(c) for c in fire._build_palette()]
+
+
+class TestPlasma:
+    def test_field_matches_direct_sine_sum(self):
+        """Phase-only update must equal summing the four waves per pixel."""
+        import math
+        from src.display import plasma
+        t = 3.7
+        field = plasma._plasma_field(t)
+        for y in range(0, 64, 9):
+            for x in range(0, 64, 7):
+                v = (math.sin(x * 0.1 + t) + math.sin(y * 0.1 + t * 0.7)
+                     + math.sin((x + y) * 0.1 + t * 0.5)
+                     + math.sin(plasma._dist_table()[y, x] + t * 1.2)) / 4.0
+                assert field[y, x] == pytest.approx((v + 1) / 2.0, abs=1e-9)
+
+    def test_field_stays_in_unit_range(self):
+        from src.display import plasma
+        for t in (0.0, 1.0, 12.5, 100.0):
+            field = plasma._plasma_field(t)
+            assert field.min() >= 0.0 and field.max() <= 1.0
+
+    def test_palette_lut_matches_colour_function(self):
+        from src.display import plasma
+        for i in (0, 64, 128, 200, 255):
+            assert tuple(plasma._palette_lut()[i]) == plasma._plasma_color(i / 255.0)
+
+
+class TestLazyTable:
+    def test_builds_once_on_first_call(self):
+        from src.display._shared import lazy_table
+        calls = []
+
+        @lazy_table
+        def table():
+            calls.append(1)
+            return [1, 2, 3]
+
+        assert not table.built and calls == []
+        assert table() is table()
+        assert table.built and calls == [1]
+
+    def test_concurrent_first_calls_build_once(self):
+        import threading
+        from src.display._shared import lazy_table
+        calls = []
+        gate = threading.Event()
+
+        @lazy_table
+        def table():
+            gate.wait(1)
+            calls.append(1)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(table()))
+                   for _ in range(4)]
+        for th in threads:
+            th.start()
+        gate.set()
+        for th in threads:
+            th.join()
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_warm_lazy_tables_builds_module_tables(self):
+        import types
+        from src.display._shared import lazy_table, warm_lazy_tables
+        module = types.ModuleType("fake_feature")
+        module.a = lazy_table(lambda: 1)
+        module.b = lazy_table(lambda: 2)
+        module.c = 3
+        assert warm_lazy_tables(module) == 2
+        assert module.a.built and module.b.built
+        assert warm_lazy_tables(module) == 0
+
+    def test_effect_tables_are_not_built_at_import(self):
+        import importlib
+        from src.display import plasma
+        plasma = importlib.reload(plasma)
+        assert not plasma._waves.built
+        assert not plasma._palette_lut.built
@@ -0,0 +1,114 @@
+"""Tests for the per-feature frame-time profile in ``src/main.py``.
+
+_SafeMatrixProxy times every frame into a fixed-size histogram for the
+running feature, and run_feature flushes a p50/p95/p99 / FPS / longest-stall
+summary to a rotating JSON-lines file when the feature ends.
+"""
+
+import json
+
+import pytest
+
+from src import main
+
+
+@pytest.fixture
+def stats_path(tmp_path, monkeypatch):
+    path = tmp_path / "frame_stats.jsonl"
+    monkeypatch.setattr(main, "_FRAME_STATS_PATH", str(path))
+    monkeypatch.setattr(main, "_frame_profile", [None])
+    return path
+
+
+def _feed(profile, intervals_ms, start=100.0):
+    now = start
+    profile.frame(now)
+    for ms in intervals_ms:
+        now += ms / 1000.0
+        profile.frame(now)
+    return now
+
+
+class TestFrameProfile:
+    def test_percentiles_from_histogram(self):
+        profile = main._FrameProfile("fire")
+        _feed(profile, [33.0] * 98 + [101.0, 500.0])
+        summary = profile.summary()
+        assert summary["frames"] == 101
+        # 33 ms falls in the 32-34 ms bucket; upper edge reported.
+        assert summary["p50_ms"] == 34.0
+        assert summary["p95_ms"] == 34.0
+        assert summary["p99_ms"] == 102.0
+        assert summary["max_stall_ms"] == pytest.approx(500.0, abs=0.1)
+
+    def test_overflow_bucket_reports_longest_stall(self):
+        profile = main._FrameProfile("qr_code")
+        _feed(profile, [2000.0, 3000.0])
+        assert profile.percentile_ms(99) == pytest.approx(3000.0, abs=0.1)
+
+    def test_fps_is_achieved_rate(self):
+        profile = main._FrameProfile("plasma")
+        _feed(profile, [50.0] * 20)  # 20 intervals over one second
+        assert profile.summary()["fps"] == pytest.approx(20.0, abs=0.1)
+
+    def test_histogram_is_fixed_size(self):
+        profile = main._FrameProfile("clock")
+        _feed(profile, [16.0] * 5000)
+        assert len(profile.counts) == main._FRAME_HIST_BUCKETS
+
+    def test_empty_profile(self):
+        summary = main._FrameProfile("idle").summary()
+        assert summary["frames"] == 0
+        assert summary["p99_ms"] == 0.0
+        assert summary["first_frame_s"] is None
+
+
+class TestProxyAndFlush:
+    def test_proxy_frames_reach_profile(self, stats_path):
+        class _Matrix:
+            def SetImage(self, *args, **kwargs):
+                pass
+
+            def SwapOnVSync(self, canvas, *args, **kwargs):
+                return canvas
+
+        proxy = main._SafeMatrixProxy(_Matrix())
+        main._begin_frame_profile("fire")
+        proxy.SetImage(None)
+        proxy.SwapOnVSync(None)
+        main._mark_frame()  # watchdog heartbeat reset: not a displayed frame
+        summary = main._flush_frame_profile()
+        assert summary["feature"] == "fire"
+        assert summary["frames"] == 2
+
+    def test_flush_appends_json_line(self, stats_path):
+        main._begin_frame_profile("fire")
+        main._mark_frame(displayed=True)
+        main._flush_frame_profile()
+        main._begin_frame_profile("plasma")
+        main._flush_frame_profile()
+        lines = stats_path.read_text().splitlines()
+        assert [json.loads(line)["feature"] for line in lines] == ["fire", "plasma"]
+        assert main._frame_profile[0] is None
+
+    def test_flush_without_profile_is_noop(self, stats_path):
+        assert main._flush_frame_profile() is None
+        assert not stats_path.exists()
+
+    def test_stats_file_rotates(self, stats_path, monkeypatch):
+        monkeypatch.setattr(main, "_FRAME_STATS_MAX_BYTES", 200)
+        for _ in range(12):
+            main._begin_frame_profile("fire")
+            main._flush_frame_profile()
+        rotated = stats_path.parent / (stats_path.name + ".1")
+        assert rotated.exists()
+        assert stats_path.stat().st_size < 400
+        backups = list(stats_path.parent.glob(stats_path.name + ".*"))
+        assert len(backups) <= main._FRAME_STATS_BACKUPS
+
+    def test_run_feature_flushes_on_completion(self, stats_path, monkeypatch):
+        monkeypatch.setattr(main, "_run_feature_with_watchdog",
+                            lambda fn, duration, name: True)
+        main.run_feature("fire", object(), 1)
+        record = json.loads(stats_path.read_text().splitlines()[-1])
+        assert record["feature"] == "fire"
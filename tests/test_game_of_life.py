@@ -0,0 +1,147 @@
+"""Tests for the array-based Game of Life engine (src/display/game_of_life.py).
+
+The engine replaced per-cell Python loops; these tests pin it against a
+straightforward reference implementation of the rules on a torus, plus the
+age colouring and the wrapped view window the panel pans with, and the
+cycle detector and pattern library that drive reseeding.
+"""
+
+import numpy as np
+
+from src.display import game_of_life as gol
+
+
+def _reference_step(grid):
+    h, w = grid.shape
+    out = np.zeros_like(grid)
+    for y in range(h):
+        for x in range(w):
+            n = sum(grid[(y + dy) % h, (x + dx) % w]
+                    for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                    if dx or dy)
+            out[y, x] = 1 if n == 3 or (grid[y, x] and n == 2) else 0
+    return out
+
+
+class TestEngine:
+    def test_matches_reference_rules_on_torus(self):
+        rng = np.random.default_rng(7)
+        grid = gol._random_grid(0.35, shape=(24, 40), rng=rng)
+        for _ in range(5):
+            expected = _reference_step(grid)
+            grid = gol._next_generation(grid)
+            assert np.array_equal(grid, expected)
+
+    def test_blinker_oscillates(self):
+        grid = np.zeros((8, 8), dtype=np.uint8)
+        grid[4, 3:6] = 1
+        step = gol._next_generation(grid)
+        assert step[3:6, 4].tolist() == [1, 1, 1] and step.sum() == 3
+        assert np.array_equal(gol._next_generation(step), grid)
+
+    def test_glider_wraps_around_edges(self):
+        grid = np.zeros((10, 10), dtype=np.uint8)
+        for y, x in ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2)):
+            grid[y, x] = 1
+        start = grid.copy()
+        buf = np.empty_like(grid)
+        for _ in range(40):  # 4 generations per diagonal cell, 10 cells
+            grid, buf = gol._next_generation(grid, buf), grid
+        assert np.array_equal(grid, start)
+
+    def test_ages_count_up_cap_and_reset(self):
+        ages = np.array([[0, 3, gol._AGE_CAP]], dtype=np.uint8)
+        gol._update_ages(ages, np.array([[1, 0, 1]], dtype=np.uint8))
+        assert ages.tolist() == [[1, 0, gol._AGE_CAP]]
+
+
+class TestRendering:
+    def test_age_palette_bands(self):
+        palette = gol._age_palette()
+        assert tuple(palette[0]) == (0, 0, 0)
+        assert tuple(palette[0 + 1]) == (0, 200, 255)
+        assert tuple(palette[10 + 1]) == (0, 255, 100)
+        assert tuple(palette[20 + 1]) == (200, 255, 0)
+        assert tuple(palette[gol._AGE_CAP + 1]) == (255, 200, 0)
+
+    def test_view_wraps_around_world(self):
+        grid = np.zeros((100, 100), dtype=np.uint8)
+        ages = np.zeros_like(grid)
+        grid[99, 99] = 1
+        grid[0, 0] = 1
+        ages[0, 0] = 40
+        rows = gol._view_indices(99, gol.HEIGHT, 100)
+        cols = gol._view_indices(99.7, gol.WIDTH, 100)
+        out = np.zeros((gol.HEIGHT, gol.WIDTH, 3), dtype=np.uint8)
+        gol._render_view(grid, ages, rows, cols, out)
+        assert tuple(out[0, 0]) == (0, 200, 255)    # world (99, 99), newborn
+        assert tuple(out[1, 1]) == (255, 200, 0)    # world (0, 0), old
+        assert out.any(axis=2).sum() == 2
+
+
+def _settle_generations(grid, limit=400):
+    """Generations until the cycle detector fires, or None within ``limit``."""
+    detector = gol._CycleDetector()
+    for gen in range(limit):
+        grid = gol._next_generation(grid)
+        if detector.observe(gol._board_signature(grid)):
+            return gen
+    return None
+
+
+class TestCycleDetection:
+    def test_still_life_and_oscillators_are_detected(self):
+        block = np.zeros((32, 32), dtype=np.uint8)
+        block[5:7, 5:7] = 1
+        assert _settle_generations(block) is not None
+        blinker = np.zeros((32, 32), dtype=np.uint8)
+        blinker[10, 9:12] = 1
+        assert _settle_generations(blinker) is not None
+
+    def test_glider_on_torus_is_detected_before_a_full_lap(self):
+        grid = np.zeros((128, 128), dtype=np.uint8)
+        gol._stamp(grid, gol._parse_rle("bo$2bo$3o!"), 10, 10)
+        gens = _settle_generations(grid)
+        assert gens is not None and gens < 4 * 128
+
+    def test_evolving_methuselah_is_not_a_cycle(self):
+        grid = np.zeros((128, 128), dtype=np.uint8)
+        gol._stamp(grid, gol._parse_rle(gol.PATTERNS["acorn"]), 60, 60)
+        assert _settle_generations(grid, limit=300) is None
+
+    def test_ring_forgets_signatures_older_than_max_period(self):
+        detector = gol._CycleDetector(max_period=4, confirm=1)
+        for sig in (1, 2, 3, 4, 5):
+            assert not detector.observe(sig)
+        assert not detector.observe(1)  # evicted, period 5 > 4
+        assert detector.observe(4)
+        assert len(detector._counts) <= 4
+
+
+class TestPatternLibrary:
+    def test_rle_parsing(self):
+        assert gol._parse_rle("b2o$2o$bo!").tolist() == [[0, 1, 1], [1, 1, 0], [0, 1, 0]]
+        assert gol._parse_rle("o2$o!").tolist() == [[1], [0], [1]]
+
+    def test_gosper_gun_emits_a_glider_every_30_generations(self):
+        grid = np.zeros((128, 128), dtype=np.uint8)
+        gol._stamp(grid, gol._parse_rle(gol.PATTERNS["gosper_glider_gun"]), 10, 10)
+        assert grid.sum() == 36
+        for _ in range(30):
+            grid = gol._next_generation(grid)
+        assert grid.sum() == 36 + 5
+
+    def test_library_has_all_orientations(self):
+        library = gol._pattern_library()
+        assert len(library) == len(gol.PATTERNS)
+        assert all(1 <= len(variants) <= 8 for variants in library)
+        assert max(len(v) for v in library) == 8
+
+    def test_reseed_clears_world_and_places_pattern_at_focus(self):
+        rng = np.random.default_rng(3)
+        grid = gol._random_grid(0.5, shape=(200, 200), rng=rng)
+        ages = np.full(grid.shape, 9, dtype=np.uint8)
+        gol._reseed(grid, ages, rng, focus=(100, 100))
+        assert not ages.any()
+        assert 0 < grid.sum() < 500
+        assert grid[90:111, 90:111].any()
@@ -4381,7 +4381,7 @@ class TestMatureSaveStillRuns:
         from unittest.mock import MagicMock, patch
         from src.display.living_world import persistence, simulation
 
-        save_path = str(tmp_path / "living_world_save.json")
+        save_path = str(tmp_path / "living_world_save.lwb")
         monkeypatch.setattr(persistence, "_SAVE_PATH", save_path)
 
         # Build a real save by running once from scratch, then age it.
@@ -4389,12 +4389,9 @@ class TestMatureSaveStillRuns:
         with patch("src.display.living_world.simulation.should_stop",
                    return_value=False):
             simulation.run(matrix, duration=0.5)
-        import json
-        with open(save_path) as fp:
-            data = json.load(fp)
+        data = persistence.load_world()
         data["elapsed"] = elapsed
-        with open(save_path, "w") as fp:
-            json.dump(data, fp)
+        persistence._write_save(data, save_path)
 
         matrix = MagicMock()
         with patch("src.display.living_world.simulation.should_stop",
@@ -4412,3 +4409,674 @@ class TestMatureSaveStillRuns:
         matrix = self._run_with_saved_elapsed(tmp_path, monkeypatch,
                                               elapsed=0.0)
         assert matrix.SetImage.call_count >= 2
+
+
+# --- Active-cell water simulation ---
+
+from src.display.living_world.terrain import WaterSim, _settle_water
+
+
+def _water_count(world):
+    return sum(row.count(WATER) for row in world)
+
+
+def _make_basin(surface_y=42, left=60, right=70, depth=3):
+    """Flat world with a walled pit dug into the surface, filled with water."""
+    heights, world = _make_flat_world(surface_y)
+    for x in range(left, right + 1):
+        for y in range(surface_y, surface_y + depth):
+            world[y][x] = WATER
+    return heights, world
+
+
+class TestWaterSim:
+    """WaterSim visits only unsettled water and wakes on external edits."""
+
+    def test_settled_basin_goes_idle(self):
+        heights, world = _make_basin()
+        water = WaterSim(world)
+        assert not water.settled
+        before = [row[:] for row in world]
+        water.step()
+        assert water.settled
+        assert world == before
+        assert water.step() == 0
+
+    def test_falling_water_is_conserved_and_lands(self):
+        heights, world = _make_flat_world(42)
+        for x in range(80, 85):
+            world[10][x] = WATER
+        water = WaterSim(world)
+        for _ in range(200):
+            water.step()
+        # Lone drops on open ground keep wandering, but all land on it.
+        assert _water_count(world) == 5
+        assert world[41].count(WATER) == 5
+
+    def test_external_edit_wakes_water(self):
+        heights, world = _make_basin(left=60, right=70)
+        water = WaterSim(world)
+        water.step()
+        assert water.settled
+        # Dig a shaft under the pond, as mining or terrain edits do.
+        for y in range(45, 50):
+            world[y][65] = AIR
+        water.step()
+        assert not water.settled
+        for _ in range(50):
+            water.step()
+        assert _water_count(world) == 33
+        assert all(world[y][65] == WATER for y in range(45, 50))
+
+    def test_rain_drop_added_by_caller_falls(self):
+        heights, world = _make_flat_world(42)
+        water = WaterSim(world)
+        assert water.settled
+        world[5][100] = WATER
+        for _ in range(60):
+            water.step()
+        assert WATER in world[41]
+        assert _water_count(world) == 1
+
+    def test_settle_water_stops_once_at_rest(self):
+        heights, world = _make_flat_world(42)
+        for y in range(42, 47):
+            world[y][100] = AIR  # one-wide shaft
+        world[42][100] = WATER
+        water = _settle_water(world, ticks=20)
+        assert isinstance(water, WaterSim)
+        assert water.settled
+        assert world[46][100] == WATER
+        assert _water_count(world) == 1
+
+
+# --- Spatial column index ---
+
+from src.display.living_world.spatial import ColumnIndex, column_index, BUCKET_WIDTH
+from src.display.living_world.structures import _find_build_site, STRUCTURE_REACH
+
+
+def _structure(stype, x, width=1):
+    return Structure(stype, x, 40, width, 2)
+
+
+class TestColumnIndex:
+    """ColumnIndex answers range/kind queries exactly like a list scan."""
+
+    def test_range_query_matches_scan_in_list_order(self):
+        rng = random.Random(4)
+        structures = [_structure(rng.choice(["campfire", "mine", "well"]), rng.randint(0, WORLD_WIDTH - 1))
+                      for _ in range(60)]
+        index = ColumnIndex(structures)
+        for lo in range(-10, WORLD_WIDTH, 7):
+            hi = lo + rng.randint(0, 40)
+            assert index.in_range(lo, hi) == [s for s in structures if lo <= s.x <= hi]
+
+    def test_counts_by_kind(self):
+        structures = [_structure("campfire", 10), _structure("mine", 20), _structure("campfire", 150)]
+        index = column_index(structures)
+        assert index.count("campfire") == 2
+        assert index.count("bank") == 0
+        assert index.of_kind("mine") == [structures[1]]
+
+    def test_appends_and_filters_are_picked_up(self):
+        structures = [_structure("campfire", 10)]
+        index = column_index(structures)
+        structures.append(_structure("campfire", 100))
+        assert column_index(structures) is index
+        assert index.count("campfire") == 2
+        assert index.near(100, 2) == [structures[1]]
+        structures[:] = [s for s in structures if s.x != 10]
+        assert index.count("campfire") == 1
+        assert index.near(10, 2) == []
+
+    def test_in_place_replacement_is_reindexed(self):
+        trees = [Tree(10, 40, 0.5, 6, 3, 0), Tree(50, 40, 0.5, 6, 3, 0)]
+        index = column_index(trees)
+        index.replace(0, Tree(100, 40, 0.0, 6, 3, 0))
+        assert column_index(trees) is index
+        assert index.near(10, 5) == []
+        assert index.near(100, 5) == [trees[0]]
+        assert index.near(50, 5) == [trees[1]]
+
+    def test_regrown_tree_is_found_near_its_new_column(self):
+        heights, world = _make_flat_world()
+        trees = [Tree(10, 40, 1.0, 6, 3, 0), Tree(30, 40, 1.0, 6, 3, 0)]
+        trees[0].alive, trees[0].dead_timer = False, 200
+        index = column_index(trees)
+        random.seed(3)
+        _grow_trees(trees, heights, world, 0)
+        regrown = trees[0]
+        assert regrown.alive and regrown.growth == 0.0
+        assert regrown in index.near(regrown.x, 0)
+        assert all(t.alive for t in index.near(10, 0))
+
+    def test_move_rebuckets_entity(self):
+        animals = [Animal(10, 40, "deer", 1)]
+        index = column_index(animals, "animal_type")
+        animals[0].x = float(10 + 3 * BUCKET_WIDTH)
+        index.move(animals[0])
+        assert index.near(10, 2) == []
+        assert index.near(animals[0].x, 0) == [animals[0]]
+        assert index.count("deer") == 1
+
+    def test_out_of_world_positions_are_still_found(self):
+        trees = [Tree(-2, 40, 0.5, 6, 3, 0), Tree(WORLD_WIDTH + 1, 40, 0.5, 6, 3, 0)]
+        index = ColumnIndex(trees)
+        assert index.near(0, 2) == [trees[0]]
+        assert index.near(WORLD_WIDTH, 1) == [trees[1]]
+
+
+class TestSpatialIndexCallers:
+    """Callers that switched from list scans keep their results."""
+
+    def test_build_site_avoids_wide_structures(self):
+        heights, world = _make_flat_world()
+        structures = [_structure("bridge", 20, width=STRUCTURE_REACH - 2)]
+        random.seed(11)
+        for _ in range(30):
+            x, _ = _find_build_site(structures, [], heights, world, 3, 4)
+            assert not abs(structures[0].x - x) < structures[0].width + 2
+
+    def test_upgraded_house_is_rebucketed(self, monkeypatch):
+        from src.display.living_world import villager_ai
+        # Widen level 2 so the upgrade shifts the house left across a bucket edge.
+        monkeypatch.setitem(villager_ai.HOUSE_DIMENSIONS, 2, (6, 6))
+        house = Structure("house_small", BUCKET_WIDTH, 40, 3, 4)
+        structures = [_structure("campfire", 100), house]
+        index = column_index(structures)
+        v = Villager(BUCKET_WIDTH, 40)
+        v.state, v.upgrade_target, v.task_timer = "upgrading", house, 1
+        villager_ai._handle_upgrading(v, structures)
+        assert house.level == 2 and house.x == BUCKET_WIDTH - 1
+        assert index.in_range(0, BUCKET_WIDTH - 1) == [house]
+
+    def test_campfire_light_uses_visible_structures_only(self):
+        from PIL import Image
+        img = Image.new("RGB", (64, 64), (40, 40, 40))
+        fire = _structure("campfire", 30)
+        fire.fuel = 100
+        far = _structure("campfire", 150)
+        far.fuel = 100
+        _apply_campfire_light(img.load(), [far, fire], ambient=0.1, camera_x=0)
+        assert img.getpixel((30, 40)) != (40, 40, 40)
+
+
+# --- Cached terrain layer ---
+
+from src.display.living_world.rendering import (
+    TerrainLayer, TERRAIN_AMBIENT_STEP, _render_terrain_and_water,
+)
+from src.display.living_world.constants import LEAF
+
+
+def _terrain_frames(world, path_wear, ambient, camera_x, sim_tick, layer=None, season_info=None):
+    """Render the uncached pass and a TerrainLayer over the same sky."""
+    sky = (10, 20, 30)
+    ref = Image.new("RGB", (64, 64), sky)
+    random.seed(5)
+    _render_terrain_and_water(ref.load(), world, None, ambient, camera_x, path_wear, 0.3, sim_tick, season_info=season_info)
+    layer = layer or TerrainLayer(world)
+    out = Image.new("RGB", (64, 64), sky)
+    random.seed(5)
+    layer.render(out, ambient, camera_x, path_wear, 0.3, sim_tick, season_info=season_info)
+    return ref, out, layer
+
+
+class TestTerrainLayer:
+    """TerrainLayer blits the same pixels as the per-pixel terrain pass."""
+
+    def _world(self):
+        heights, world = _make_basin(surface_y=42, left=70, right=80)
+        world[20][90] = LEAF
+        return world, [0] * WORLD_WIDTH
+
+    def test_matches_uncached_pass(self):
+        world, wear = self._world()
+        for ambient in (1.0, 32 * TERRAIN_AMBIENT_STEP):
+            for camera_x in (0, 50, WORLD_WIDTH - 40):
+                ref, out, _ = _terrain_frames(world, wear, ambient, camera_x, sim_tick=7,
+                                              season_info=("autumn", "winter", 0.5))
+                assert ref.tobytes() == out.tobytes()
+
+    def test_world_edits_and_wear_repaint_columns(self):
+        world, wear = self._world()
+        _, _, layer = _terrain_frames(world, wear, 1.0, 50, sim_tick=1)
+        world[42][60] = AIR          # dug out
+        world[30][61] = STONE        # built up
+        wear[62] = 60                # path worn in
+        ref, out, _ = _terrain_frames(world, wear, 1.0, 50, sim_tick=2, layer=layer)
+        assert ref.tobytes() == out.tobytes()
+        assert out.getpixel((10, 42)) == (10, 20, 30)
+
+    def test_ambient_change_repaints_everything(self):
+        world, wear = self._world()
+        _, _, layer = _terrain_frames(world, wear, 1.0, 0, sim_tick=1)
+        ref, out, _ = _terrain_frames(world, wear, 0.5, 0, sim_tick=1, layer=layer)
+        assert ref.tobytes() == out.tobytes()
+
+    def test_unchanged_frame_redraws_nothing(self, monkeypatch):
+        world, wear = self._world()
+        _, _, layer = _terrain_frames(world, wear, 1.0, 0, sim_tick=1)
+        calls = []
+        monkeypatch.setattr(layer, "_redraw_column", lambda *a: calls.append(a))
+        layer.render(Image.new("RGB", (64, 64)), 1.0 + TERRAIN_AMBIENT_STEP / 4, 0, wear, 0.3, 2)
+        assert calls == []
+
+
+# --- Accumulated light map ---
+
+import numpy as np
+from src.display.living_world.lighting import LightMap, _apply_night_lights
+from src.display.living_world.constants import LIGHT_MASK
+
+
+def _reference_campfire_light(pixels, fx, fy, ambient):
+    """The original per-pixel campfire pass, for a single fire."""
+    nf = max(0.0, (0.6 - ambient) / 0.45)
+    for dx, dy, intensity in LIGHT_MASK:
+        px, py = fx + dx, fy + dy
+        if 0 <= px < LW_DISPLAY_WIDTH and 0 <= py < LW_DISPLAY_HEIGHT:
+            att = (intensity / 255.0) * nf
+            boost = (intensity / 255.0) * 0.85 * nf
+            r, g, b = pixels[px, py]
+            pixels[px, py] = (max(0, min(MAX_LIGHT_LEVEL, int(r + r * boost + 40 * att))),
+                              max(0, min(MAX_LIGHT_LEVEL, int(g + g * boost * 0.6 + 20 * att))),
+                              max(0, min(MAX_LIGHT_LEVEL, int(b + b * boost * 0.2))))
+
+
+class TestLightMap:
+    """Light is accumulated into one buffer and applied once."""
+
+    def _gradient(self):
+        img = Image.new("RGB", (LW_DISPLAY_WIDTH, LW_DISPLAY_HEIGHT))
+        img.putdata([((x * 4) % 256, (y * 4) % 256, 60) for y in range(LW_DISPLAY_HEIGHT)
+                     for x in range(LW_DISPLAY_WIDTH)])
+        return img
+
+    def test_single_light_matches_per_pixel_pass(self):
+        ref = self._gradient()
+        _reference_campfire_light(ref.load(), 3, 40, ambient=0.2)
+        fire = _make_structure(stype="campfire", x=3, y=40, width=1, height=1)
+        fire.fuel = 5000
+        out = self._gradient()
+        _apply_night_lights(out, [fire], [], ambient=0.2, camera_x=0)
+        diff = np.abs(np.asarray(ref, dtype=int) - np.asarray(out, dtype=int))
+        assert diff.max() <= 1
+
+    def test_image_and_accessor_paths_agree(self):
+        fires = []
+        for cx in (20, 24, 60):
+            c = _make_structure(stype="campfire", x=cx, y=30, width=1, height=1)
+            c.fuel = 5000
+            fires.append(c)
+        a = self._gradient()
+        _apply_night_lights(a, fires, [(22, 35)], ambient=0.1, camera_x=0)
+        b = self._gradient()
+        random.seed(0)
+        lights = LightMap()
+        from src.display.living_world.lighting import _add_campfire_light, _add_torch_post_light
+        _add_campfire_light(lights, fires, 0.1, 0)
+        _add_torch_post_light(lights, [(22, 35)], 0.1, 0)
+        lights.apply(b.load())
+        assert a.tobytes() == b.tobytes()
+
+    def test_untouched_pixels_keep_their_colour(self):
+        img = Image.new("RGB", (LW_DISPLAY_WIDTH, LW_DISPLAY_HEIGHT), (250, 250, 250))
+        _apply_night_lights(img, [], [(10, 20)], ambient=0.1, camera_x=0)
+        assert img.getpixel((40, 50)) == (250, 250, 250)
+        assert max(img.getpixel((10, 19))) <= MAX_LIGHT_LEVEL
+
+    def test_off_screen_emitters_are_clipped(self):
+        lights = LightMap()
+        lights.splat("campfire", -3, 2, 1.0, 0.85, (1.0, 0.6, 0.2), (40, 20, 0))
+        lights.splat("campfire", 500, 2, 1.0, 0.85, (1.0, 0.6, 0.2), (40, 20, 0))
+        assert lights.covered[:, :5].any()
+        assert not lights.covered[:, 10:].any()
+
+
+# --- Headless step and offline catch-up ---
+
+import threading
+import time
+
+from src.display.living_world.step import _simulate_tick, _world_clock
+from src.display.living_world.catch_up import CatchUp, _catch_up_ticks
+from src.display.living_world.constants import (
+    FRAME_INTERVAL as LW_FRAME_INTERVAL, CATCH_UP_FRACTION, CATCH_UP_MAX_TICKS,
+)
+
+
+def _headless_state():
+    from src.display.living_world.terrain import (
+        _generate_height_profile, _fill_terrain, _flood_valleys,
+        _guarantee_pond, _place_sand, _place_trees,
+    )
+    random.seed(11)
+    heights = _generate_height_profile(11)
+    world = [[AIR] * WORLD_WIDTH for _ in range(DISPLAY_HEIGHT)]
+    _fill_terrain(world, heights)
+    _flood_valleys(world, heights)
+    _guarantee_pond(heights, world)
+    water = _settle_water(world, ticks=20)
+    _place_sand(world)
+    trees = _place_trees(heights, world)
+    villagers = [Villager(x, heights[x]) for x in (90, 100) if world[heights[x]][x] == GRASS]
+    return dict(
+        villagers=villagers, structures=[], trees=trees, farms=[], animals=[],
+        flowers=[], lumber_items=[], weather=Weather(), heights=heights,
+        world=world, path_wear=[0] * WORLD_WIDTH, torch_posts=[],
+        grass_fires=[], caravans=[], water=water,
+    )
+
+
+class TestHeadlessStep:
+    def test_simulate_tick_advances_world_without_rendering(self):
+        state = _headless_state()
+        ages = [v.age for v in state["villagers"]]
+        for tick in range(300):
+            day_phase, _ambient, season_info = _world_clock(tick * LW_FRAME_INTERVAL)
+            _simulate_tick(state, tick, day_phase, season_info[0], 64)
+        assert state["villagers"]
+        assert all(v.age > a for v, a in zip(state["villagers"], ages))
+
+    def test_world_clock_matches_day_night(self):
+        from src.display.living_world.day_night import _compute_day_phase
+        day_phase, ambient, season_info = _world_clock(123.0)
+        assert day_phase == _compute_day_phase(123.0)
+        assert 0.0 <= ambient <= 1.0
+        assert season_info[0] in ("spring", "summer", "autumn", "winter")
+
+
+class TestCatchUp:
+    def test_ticks_scale_with_time_away_and_cap(self):
+        now = 10000.0
+        assert _catch_up_ticks({"saved_at": now - 100}, now=now) == \
+            int(100 * CATCH_UP_FRACTION / LW_FRAME_INTERVAL)
+        assert _catch_up_ticks({"saved_at": now - 10 ** 7}, now=now) == CATCH_UP_MAX_TICKS
+        assert _catch_up_ticks({"saved_at": now + 50}, now=now) == 0
+
+    def test_old_saves_without_timestamp_do_not_catch_up(self):
+        assert _catch_up_ticks({"sim_tick": 5}) == 0
+        assert _catch_up_ticks(None) == 0
+
+    def test_save_records_timestamp(self, tmp_path, monkeypatch):
+        from src.display.living_world import persistence
+        monkeypatch.setattr(persistence, "_SAVE_PATH", str(tmp_path / "save.json"))
+        state = _headless_state()
+        save_world(
+            villagers=state["villagers"], structures=[], trees=state["trees"],
+            farms=[], heights=state["heights"], world=state["world"],
+            weather=state["weather"], clouds=[], birds=[], animals=[],
+            shooting_stars=[], fireflies=[], smoke_particles=[], fish_jumps=[],
+            flowers=[], rain_drops=[], grass_fires=[], path_wear=state["path_wear"],
+            torch_posts=[], lumber_items=[], stars=[], camera_x=0, sim_tick=7,
+            start_time=None,
+        )
+        saved = load_world()
+        assert abs(saved["saved_at"] - time.time()) < 60
+
+    def test_thread_advances_tick_and_clock(self):
+        state = _headless_state()
+        job = CatchUp(state, threading.Lock(), 100, 50.0, 200, 64, cpu_budget=1.0).start()
+        job._thread.join(30)
+        assert not job.running
+        assert job.done == 200 and job.sim_tick == 300
+        assert abs(job.elapsed - (50.0 + 200 * LW_FRAME_INTERVAL)) < 1e-6
+
+    def test_stop_keeps_partial_progress(self):
+        state = _headless_state()
+        job = CatchUp(state, threading.Lock(), 0, 0.0, 10 ** 6, 64, chunk=5).start()
+        time.sleep(0.05)
+        job.stop()
+        assert not job.running
+        assert 0 < job.done < 10 ** 6 and job.sim_tick == job.done
+
+    def test_waits_for_world_lock(self):
+        state = _headless_state()
+        lock = threading.Lock()
+        lock.acquire()
+        job = CatchUp(state, lock, 0, 0.0, 50, 64, cpu_budget=1.0).start()
+        time.sleep(0.2)
+        assert job.done == 0
+        lock.release()
+        job._thread.join(30)
+        assert job.done == 50
+
+    def test_resumed_run_catches_up(self, tmp_path, monkeypatch):
+        from unittest.mock import MagicMock, patch
+        from src.display.living_world import persistence, simulation
+
+        save_path = str(tmp_path / "living_world_save.lwb")
+        monkeypatch.setattr(persistence, "_SAVE_PATH", save_path)
+        with patch("src.display.living_world.simulation.should_stop", return_value=False):
+            simulation.run(MagicMock(), duration=0.3)
+        data = persistence.load_world()
+        first_tick = data["sim_tick"]
+        data["saved_at"] -= 60  # a minute away -> 270 catch-up ticks
+        persistence._write_save(data, save_path)
+        matrix = MagicMock()
+        with patch("src.display.living_world.simulation.should_stop", return_value=False):
+            simulation.run(matrix, duration=0.5)
+        resumed = persistence.load_world()
+        assert matrix.SetImage.call_count >= 2
+        assert resumed["sim_tick"] >= first_tick + 270
+
+
+# --- Binary save format ---
+
+from src.display.living_world import persistence as lw_persistence
+
+
+def _save_headless(state, sim_tick=7, **kw):
+    return save_world(
+        villagers=state["villagers"], structures=state["structures"],
+        trees=state["trees"], farms=state["farms"], heights=state["heights"],
+        world=state["world"], weather=state["weather"], clouds=[], birds=[],
+        animals=state["animals"], shooting_stars=[], fireflies=[],
+        smoke_particles=[], fish_jumps=[], flowers=state["flowers"],
+        rain_drops=[], grass_fires=[], path_wear=state["path_wear"],
+        torch_posts=[(10, 40)], lumber_items=[], stars=[(1, 2)], camera_x=0,
+        sim_tick=sim_tick, start_time=None, **kw,
+    )
+
+
+class TestBinarySave:
+    @pytest.fixture(autouse=True)
+    def _save_path(self, tmp_path, monkeypatch):
+        self.json_path = str(tmp_path / "living_world_save.json")
+        self.bin_path = str(tmp_path / "living_world_save.lwb")
+        monkeypatch.setattr(lw_persistence, "_SAVE_PATH", self.bin_path)
+
+    def _state(self):
+        state = _headless_state()
+        for tick in range(400):
+            day_phase, _ambient, season_info = _world_clock(tick * LW_FRAME_INTERVAL)
+            _simulate_tick(state, tick, day_phase, season_info[0], 64)
+        return state
+
+    def test_round_trip_matches_json_shape(self):
+        state = self._state()
+        assert _save_headless(state)
+        assert os.path.exists(self.bin_path)
+        data = load_world()
+        assert data["version"] == lw_persistence.SAVE_VERSION
+        assert data["world"] == state["world"]
+        assert data["heights"] == state["heights"]
+        assert data["path_wear"] == state["path_wear"]
+        assert data["torch_posts"] == [[10, 40]] and data["sim_tick"] == 7
+        assert data["villagers"][0] == json.loads(json.dumps(
+            {**_entity_to_dict(state["villagers"][0]), "_home_idx": -1, "_farm_idx": -1}))
+        restored = restore_entities(data)
+        assert [t.x for t in restored["trees"]] == [t.x for t in state["trees"]]
+        assert [v.name for v in restored["villagers"]] == [v.name for v in state["villagers"]]
+
+    def test_speech_bubble_colour_restores_as_a_tuple(self):
+        state = self._state()
+        state["villagers"][0].bubble_timer = 10
+        state["villagers"][0].bubble_color = (220, 50, 50)
+        _save_headless(state)
+        restored = restore_entities(load_world())
+        assert restored["villagers"][0].bubble_color == (220, 50, 50)
+        img = Image.new("RGB", (4, 4))
+        img.load()[0, 0] = restored["villagers"][0].bubble_color
+
+    def test_binary_is_smaller_than_json(self):
+        state = self._state()
+        _save_headless(state)
+        data = load_world()
+        assert os.path.getsize(self.bin_path) < len(json.dumps(data, separators=(",", ":"))) / 4
+
+    def test_uncompressed_round_trip(self):
+        state = self._state()
+        _save_headless(state, compress=False)
+        assert load_world()["world"] == state["world"]
+
+    def test_v1_json_save_migrates(self):
+        state = self._state()
+        _save_headless(state)
+        data = load_world()
+        data["version"] = 1
+        os.remove(self.bin_path)
+        with open(self.json_path, "w") as fp:
+            json.dump(data, fp)
+        legacy = load_world()
+        assert legacy["version"] == 1 and legacy["world"] == state["world"]
+        assert restore_entities(legacy) is not None
+        delete_save()
+        assert not os.path.exists(self.json_path)
+        _save_headless(state)
+        assert load_world()["version"] == lw_persistence.SAVE_VERSION
+
+    def test_unknown_versions_are_ignored(self):
+        with open(self.json_path, "w") as fp:
+            json.dump({"version": 9}, fp)
+        assert load_world() is None
+        _save_headless(self._state())
+        with open(self.bin_path, "r+b") as fp:
+            fp.seek(4)
+            fp.write((99).to_bytes(2, "little"))
+        assert load_world() is None
+
+    def test_column_kinds_and_missing_keys(self):
+        records = [
+            {"a": 1, "b": 0.5, "c": True, "d": "x", "e": None, "big": 2 ** 40},
+            {"a": -3, "b": 1.5, "c": False, "d": "y", "e": [1, 2], "big": 1},
+            {"a": 7, "b": 2.0, "c": True, "e": None, "big": 0},
+        ]
+        data = {"version": 2, "world": [[0, 1], [2, 3]], "heights": [1, 2],
+                "trees": records}
+        decoded = lw_persistence._decode_save(lw_persistence._encode_save(data))
+        assert decoded["trees"] == records
+        assert decoded["world"] == [[0, 1], [2, 3]]
+        kinds = {c["name"]: c["kind"] for c in
+                 lw_persistence._encode_table("t", records, lw_persistence._BlobWriter(False))["columns"]}
+        assert kinds == {"a": "i32", "b": "f64", "c": "bool", "d": "json",
+                         "e": "json", "big": "i64"}
+
+    def test_unchanged_sections_reuse_compressed_bytes(self):
+        state = self._state()
+        data = {"version": 2, "world": state["world"], "heights": state["heights"]}
+        lw_persistence._encode_save(data)
+        first = lw_persistence._compressed_sections["world"][1]
+        lw_persistence._encode_save(data)
+        assert lw_persistence._compressed_sections["world"][1] is first
+
+    def test_world_api_reads_binary_save(self, tmp_path, monkeypatch):
+        from src.display.living_world import world_api
+        monkeypatch.setattr(world_api, "_SAVE_PATH", self.bin_path)
+        monkeypatch.setattr(world_api, "_LIVE_SNAPSHOT_PATH", str(tmp_path / "none.json"))
+        state = self._state()
+        _save_headless(state)
+        snap = get_world_snapshot()
+        assert snap["sim_tick"] == 7
+        assert len(snap["villagers"]) == len(state["villagers"])
+
+
+# --- Live snapshot keyframes and delta log ---
+
+from src.display.living_world import world_api as lw_world_api
+
+
+class TestSnapshotPublisher:
+    @pytest.fixture(autouse=True)
+    def _live_path(self, tmp_path, monkeypatch):
+        self.live_path = str(tmp_path / "living_world_snapshot.json")
+        self.delta_path = str(tmp_path / "living_world_snapshot.delta.jsonl")
+        monkeypatch.setattr(lw_world_api, "_LIVE_SNAPSHOT_PATH", self.live_path)
+        monkeypatch.setattr(lw_world_api, "_last_snapshot_time", 0.0)
+        self.publisher = lw_world_api.SnapshotPublisher()
+
+    def _snapshot(self, tick, xs=(10, 20, 30), heights=None):
+        return {
+            "sim_tick": tick, "camera_x": 64, "heights": list(heights or [40] * 8),
+            "villagers": [{"name": f"v{i}", "x": x} for i, x in enumerate(xs)],
+            "weather": {"state": "clear"}, "population": len(xs), "timestamp": 1000.0 + tick,
+        }
+
+    def _delta_lines(self):
+        with open(self.delta_path) as fp:
+            return [json.loads(line) for line in fp]
+
+    def test_first_publish_is_a_keyframe(self):
+        assert self.publisher.publish(self._snapshot(0), 1000.0) == "keyframe"
+        assert lw_world_api._read_live_snapshot(self.live_path) == self._snapshot(0)
+        assert os.path.getsize(self.delta_path) == 0
+
+    def test_unchanged_world_is_not_written_until_heartbeat(self):
+        self.publisher.publish(self._snapshot(0), 1000.0)
+        assert self.publisher.publish(self._snapshot(54), 1003.0) is None
+        assert os.path.getsize(self.delta_path) == 0
+        assert self.publisher.publish(self._snapshot(300), 1000.0 + lw_world_api._HEARTBEAT_INTERVAL) == "delta"
+        (record,) = self._delta_lines()
+        assert "set" not in record and "patch" not in record and record["sim_tick"] == 300
+
+    def test_delta_carries_only_changed_items(self):
+        self.publisher.publish(self._snapshot(0), 1000.0)
+        assert self.publisher.publish(self._snapshot(54, xs=(10, 21, 30)), 1003.0) == "delta"
+        assert self.publisher.publish(self._snapshot(108, xs=(10, 21)), 1006.0) == "delta"
+        first, second = self._delta_lines()
+        assert first["patch"] == {"villagers": {"1": {"name": "v1", "x": 21}}}
+        assert "heights" not in first.get("set", {})
+        assert second["set"]["villagers"] == [{"name": "v0", "x": 10}, {"name": "v1", "x": 21}]
+        assert second["set"]["population"] == 2
+        expected = dict(self._snapshot(108, xs=(10, 21)), timestamp=1006.0)
+        assert lw_world_api._read_live_snapshot(self.live_path) == expected
+
+    def test_keyframe_after_max_deltas_truncates_log(self, monkeypatch):
+        monkeypatch.setattr(lw_world_api, "_KEYFRAME_MAX_DELTAS", 3)
+        self.publisher.publish(self._snapshot(0), 1000.0)
+        results = [self.publisher.publish(self._snapshot(t, xs=(t, 20, 30)), 1000.0 + t)
+                   for t in range(1, 6)]
+        assert results == ["delta", "delta", "delta", "keyframe", "delta"]
+        assert len(self._delta_lines()) == 1
+        assert lw_world_api._read_live_snapshot(self.live_path) == self._snapshot(5, xs=(5, 20, 30))
+
+    def test_reader_skips_stale_and_torn_records(self):
+        self.publisher.publish(self._snapshot(0), 1000.0)
+        with open(self.delta_path, "a") as fp:
+            fp.write(json.dumps({"base": 1.0, "set": {"camera_x": 5}}) + "\n")
+            fp.write('{"base": 1000.0, "set": {"camera_')
+        assert lw_world_api._read_live_snapshot(self.live_path)["camera_x"] == 64
+
+    def test_sim_heights_are_copied_not_aliased(self):
+        heights = [40] * 8
+        self.publisher.publish(self._snapshot(0, heights=heights), 1000.0)
+        heights[3] = 38
+        assert self.publisher.publish(self._snapshot(54, heights=heights), 1003.0) == "delta"
+        assert self._delta_lines()[0]["patch"] == {"heights": {"3": 38}}
+
+    def test_world_snapshot_reads_live_deltas(self, monkeypatch):
+        monkeypatch.setattr(lw_world_api, "_publisher", self.publisher)
+        state = _headless_state()
+        kwargs = dict(villagers=state["villagers"], structures=[], trees=state["trees"],
+                      farms=[], animals=[], heights=state["heights"],
+                      weather=state["weather"], camera_x=10, sim_tick=1)
+        lw_world_api.write_live_snapshot(**kwargs)
+        state["villagers"][0].x += 3
+        lw_world_api._last_snapshot_time = 0.0
+        lw_world_api.write_live_snapshot(**dict(kwargs, sim_tick=55))
+        snap = get_world_snapshot()
+        assert snap["sim_tick"] == 55
+        assert snap["villagers"][0]["x"] == int(state["villagers"][0].x)
+        assert "keyframe_id" not in snap
@@ -1,7 +1,7 @@
 """Tests for the precipitation radar demo.
 
 Everything runs offline: RainViewer traffic is either mocked at the
-``requests.get`` level (feed tests) or bypassed entirely by exercising
+``_feeds.http_get`` level (feed tests) or bypassed entirely by exercising
 the pure helpers (geometry, colour ramp, resampling, frame cycling).
 """
 
@@ -19,6 +19,7 @@ from src.display.rain_radar import (
     ECHO_MIN_ALPHA,
     HEIGHT,
     RAIN_BANDS,
+    OverlayCache,
     RainFeed,
     TILE_SIZE,
     WIDTH,
@@ -42,6 +43,12 @@ def _clear_stop():
     _shared.clear_stop()
 
 
+@pytest.fixture(autouse=True)
+def _overlay_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk overlay cache out of the repo and per-test."""
+    monkeypatch.setattr(rain_radar, "OVERLAY_CACHE_DIR", str(tmp_path / "overlays"))
+
+
 class _Recorder:
     def __init__(self):
         self.frames = 0
@@ -107,6 +114,19 @@ def test_intensity_ranks_the_rainviewer_palette_in_order():
         assert 0.0 <= v <= 1.0
 
 
+def test_vectorised_hsv_matches_colorsys():
+    import colorsys
+    import numpy as np
+    rng = np.random.default_rng(3)
+    colors = np.concatenate([rng.integers(0, 256, (2000, 3)),
+                             [[0, 0, 0], [255, 255, 255], [80, 80, 80],
+                              [255, 0, 0], [0, 255, 0], [0, 0, 255]]])
+    h, s, v = rain_radar._hsv(colors)
+    for i, (r, g, b) in enumerate(colors):
+        ref = colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
+        assert (h[i], s[i], v[i]) == pytest.approx(ref, abs=1e-12)
+
+
 def test_colorize_maps_echo_and_keeps_silence_transparent():
     rgb = Image.new("RGB", (8, 8), (0, 0, 0))
     alpha = Image.new("L", (8, 8), 0)
@@ -227,7 +247,7 @@ def _fake_get(url, **kwargs):
 
 def test_feed_poll_builds_frames_with_nowcast_flags():
     feed = RainFeed(30.27, -97.75, 30.0)
-    with patch("src.display.rain_radar.requests.get", side_effect=_fake_get):
+    with patch("src.display._feeds.http_get", side_effect=_fake_get):
         frames = feed._poll_once()
     assert frames is not None
     past = [f for f in frames if not f["nowcast"]]
@@ -247,7 +267,7 @@ def test_feed_reuses_cached_overlays_between_polls():
         calls.append(url)
         return _fake_get(url, **kwargs)
 
-    with patch("src.display.rain_radar.requests.get",
+    with patch("src.display._feeds.http_get",
                side_effect=counting_get):
         feed._poll_once()
         first = len(calls)
@@ -258,9 +278,81 @@ def test_feed_reuses_cached_overlays_between_polls():
     assert second <= 2
 
 
+def test_overlays_survive_a_restart_without_refetching_tiles():
+    with patch("src.display._feeds.http_get", side_effect=_fake_get):
+        RainFeed(30.27, -97.75, 30.0)._poll_once()
+    calls = []
+
+    def counting_get(url, **kwargs):
+        calls.append(url)
+        return _fake_get(url, **kwargs)
+
+    fresh = RainFeed(30.27, -97.75, 30.0)       # a new process, same disk
+    with patch("src.display._feeds.http_get", side_effect=counting_get):
+        frames = fresh._poll_once()
+    assert len(frames) == rain_radar.PAST_FRAMES + rain_radar.NOWCAST_FRAMES
+    assert calls == [rain_radar.INDEX_URL]
+
+
+def test_overlay_cache_key_includes_the_box():
+    calls = []
+
+    def counting_get(url, **kwargs):
+        calls.append(url)
+        return _fake_get(url, **kwargs)
+
+    with patch("src.display._feeds.http_get", side_effect=counting_get):
+        RainFeed(30.27, -97.75, 30.0)._poll_once()
+        first = len(calls)
+        RainFeed(30.27, -97.75, 20.0)._poll_once()
+    assert len(calls) - first > 1, "a different box must not reuse overlays"
+
+
+def test_frame_tiles_are_fetched_concurrently():
+    import threading
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def slow_get(url, **kwargs):
+        if "weather-maps.json" not in url:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+        return _fake_get(url, **kwargs)
+
+    # 60 miles around 30N spans a 2x2 block of zoom-7 tiles here.
+    feed = RainFeed(30.27, -97.75, 60.0)
+    x0, y0, x1, y1 = _box_px(feed.lat, feed.lon, feed.radius_miles, feed.zoom)
+    assert int(x1 // TILE_SIZE) > int(x0 // TILE_SIZE) or \
+        int(y1 // TILE_SIZE) > int(y0 // TILE_SIZE)
+    with patch("src.display._feeds.http_get", side_effect=slow_get):
+        assert feed._build_overlay("https://tiles.example", "/v2/radar/p0")
+    assert peak[0] >= 2
+
+
+def test_overlay_cache_evicts_least_recently_used(tmp_path):
+    import os
+    img = Image.new("RGBA", (WIDTH, HEIGHT), (0, 0, 0, 0))
+    cache = OverlayCache(str(tmp_path), memory_entries=1)
+    cache.put("a", img)
+    size = os.path.getsize(cache._file("a"))
+    cache.max_bytes = 2 * size          # room for two overlays
+    cache.put("b", img)
+    os.utime(cache._file("a"), (1, 1))
+    os.utime(cache._file("b"), (2, 2))
+    assert cache.get("a") is not None   # from disk: now the most recent
+    cache.put("c", img)
+    assert os.path.exists(cache._file("a"))
+    assert not os.path.exists(cache._file("b"))
+    assert OverlayCache(str(tmp_path)).get("b") is None
+
+
 def test_feed_offline_returns_none():
     feed = RainFeed(30.27, -97.75, 30.0)
-    with patch("src.display.rain_radar.requests.get",
+    with patch("src.display._feeds.http_get",
                side_effect=Exception("no network")):
         assert feed._poll_once() is None
 
@@ -273,7 +365,7 @@ def test_feed_malformed_index_returns_none():
         return resp
 
     feed = RainFeed(30.27, -97.75, 30.0)
-    with patch("src.display.rain_radar.requests.get", side_effect=bad_get):
+    with patch("src.display._feeds.http_get", side_effect=bad_get):
         assert feed._poll_once() is None
 
 
@@ -293,7 +385,7 @@ def test_basemap_far_from_cache_falls_back_to_rings():
 
 def test_run_pushes_frames_offline():
     m = _Recorder()
-    with patch("src.display.rain_radar.requests.get",
+    with patch("src.display._feeds.http_get",
                side_effect=Exception("no network")):
         rain_radar.run(m, duration=0.4)
     assert m.frames > 0
@@ -303,7 +395,7 @@ def test_run_pushes_frames_offline():
 
 def test_run_renders_rain_overlay_online():
     m = _Recorder()
-    with patch("src.display.rain_radar.requests.get", side_effect=_fake_get):
+    with patch("src.display._feeds.http_get", side_effect=_fake_get):
         rain_radar.run(m, duration=0.6)
     assert m.frames > 0
     # The synthetic blob must actually reach the panel in some frame.
@@ -315,7 +407,7 @@ def test_run_stops_on_request():
     from src.display import _shared
     m = _Recorder()
     _shared.request_stop()
-    with patch("src.display.rain_radar.requests.get",
+    with patch("src.display._feeds.http_get",
                side_effect=Exception("no network")):
         rain_radar.run(m, duration=30)
     assert m.frames == 0
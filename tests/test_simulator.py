@@ -55,6 +55,51 @@ class TestPixelBuffer:
         # Outside image area should still be black
         assert snapshot[0][0] == (0, 0, 0)
 
+    def test_set_from_image_clips_negative_offset(self):
+        from PIL import Image
+        img = Image.new("RGB", (8, 8), color=(1, 2, 3))
+        buf = _PixelBuffer(64, 64)
+        buf.set_from_image(img, offset_x=-4, offset_y=60)
+        arr = buf.get_array()
+        assert arr[60:64, 0:4].tolist() == [[[1, 2, 3]] * 4] * 4
+        assert not arr[60:64, 4:].any()
+        assert not arr[:60].any()
+
+    def test_set_from_rgbx_image(self):
+        """FrameBuffer hands over RGBX images; only the RGB bytes land."""
+        from PIL import Image
+        img = Image.new("RGBX", (64, 64), color=(9, 8, 7, 255))
+        buf = _PixelBuffer(64, 64)
+        buf.set_from_image(img)
+        assert buf.get_snapshot()[5][5] == (9, 8, 7)
+
+    def test_get_array_is_a_copy(self):
+        buf = _PixelBuffer(64, 64)
+        arr = buf.get_array()
+        arr[0, 0] = (255, 255, 255)
+        assert buf.get_snapshot()[0][0] == (0, 0, 0)
+
+    def test_channels_clamped(self):
+        buf = _PixelBuffer(64, 64)
+        buf.set_pixel(0, 0, 300, -5, 128.7)
+        assert buf.get_snapshot()[0][0] == (255, 0, 128)
+
+
+class TestGammaLut:
+    """The precomputed table must match the old per-channel ``** 2.2``."""
+
+    @pytest.mark.parametrize("brightness", [0, 37, 80, 100])
+    def test_matches_power_curve(self, brightness):
+        from src.simulator.matrix import _gamma_lut
+        lut = _gamma_lut(brightness)
+        factor = brightness / 100.0
+        for v in (0, 1, 64, 128, 200, 255):
+            assert lut[v] == int(((v / 255.0) ** 2.2 * factor) * 255)
+
+    def test_cached_per_brightness(self):
+        from src.simulator.matrix import _gamma_lut
+        assert _gamma_lut(50) is _gamma_lut(50)
+
 
 class TestRGBMatrix:
     """Tests for the simulated RGBMatrix."""
@@ -110,6 +155,16 @@ class TestRGBMatrix:
         new_canvas = matrix.SwapOnVSync(canvas)
         assert isinstance(new_canvas, FrameCanvas)
 
+    def test_swap_on_vsync_swaps_buffers(self, matrix):
+        """The canvas is displayed and comes back holding the old front frame."""
+        matrix.Fill(0, 0, 255)
+        canvas = matrix.CreateFrameCanvas()
+        canvas.Fill(255, 0, 0)
+        returned = matrix.SwapOnVSync(canvas)
+        assert returned is canvas
+        assert matrix._buffer.get_snapshot()[5][5] == (255, 0, 0)
+        assert returned._buffer.get_snapshot()[5][5] == (0, 0, 255)
+
     def test_properties(self, matrix):
         assert matrix.brightness == 100
         matrix.brightness = 50  # No-op but should not raise
@@ -214,3 +269,157 @@ class TestGraphics:
         # Also check a mid-point pixel
         assert snapshot[32][32] == (0, 255, 0), \
             "DrawLine did not set mid-point pixel"
+
+
+class TestHeadlessMatrix:
+    """Tests for the windowless, uncapped soak/benchmark backend."""
+
+    def test_no_window_is_opened(self):
+        from src.simulator.headless import HeadlessRGBMatrix, _NullWindow
+        m = HeadlessRGBMatrix(rows=64)
+        assert isinstance(m._window, _NullWindow)
+
+    def test_frames_attributed_per_feature(self):
+        from PIL import Image
+        from src.simulator.headless import HeadlessRGBMatrix
+        m = HeadlessRGBMatrix(rows=64)
+        img = Image.new("RGB", (64, 64), (1, 2, 3))
+        m.begin_feature("fire")
+        for _ in range(5):
+            m.SetImage(img)
+        m.Clear()  # not a displayed frame
+        m.begin_feature("plasma")
+        canvas = m.CreateFrameCanvas()
+        for _ in range(3):
+            canvas = m.SwapOnVSync(canvas)
+        m.begin_feature("fire")
+        m.SetImage(img)
+        stats = m.feature_stats()
+        assert stats["fire"]["frames"] == 6
+        assert stats["fire"]["runs"] == 2
+        assert stats["plasma"]["frames"] == 3
+        assert stats["plasma"]["max_frame_ms"] >= 0.0
+
+    def test_write_stats(self, tmp_path):
+        import json
+        from PIL import Image
+        from src.simulator.headless import HeadlessRGBMatrix
+        m = HeadlessRGBMatrix(rows=64)
+        m.begin_feature("clock")
+        m.SetImage(Image.new("RGB", (64, 64)))
+        path = tmp_path / "stats.json"
+        m.close()
+        m.write_stats(str(path))
+        assert json.loads(path.read_text())["clock"]["frames"] == 1
+
+    def test_frame_log_round_trip(self, tmp_path):
+        from PIL import Image
+        from src.simulator.headless import HeadlessRGBMatrix, read_frame_log
+        path = tmp_path / "frames.flog"
+        m = HeadlessRGBMatrix(rows=64, frame_log=str(path))
+        m.begin_feature("demo")
+        red = Image.new("RGB", (64, 64), (255, 0, 0))
+        m.SetImage(red)
+        m.SetImage(red)  # unchanged: stored as a repeat record
+        m.SetImage(Image.new("RGB", (64, 64), (0, 0, 255)))
+        m.close()
+        records = list(read_frame_log(str(path)))
+        assert records[0][0] == "feature" and records[0][2] == "demo"
+        frames = [r[2] for r in records if r[0] == "frame"]
+        assert len(frames) == 3
+        assert tuple(frames[0][0, 0]) == (255, 0, 0)
+        assert tuple(frames[1][10, 10]) == (255, 0, 0)
+        assert tuple(frames[2][63, 63]) == (0, 0, 255)
+        # Two distinct 12 KB frames compress to a tiny file.
+        assert path.stat().st_size < 2000
+
+    def test_rejects_non_frame_log(self, tmp_path):
+        from src.simulator.headless import read_frame_log
+        path = tmp_path / "junk.bin"
+        path.write_bytes(b"not a log")
+        with pytest.raises(ValueError):
+            list(read_frame_log(str(path)))
+
+    def test_virtual_clock_skips_sleeps(self):
+        import time
+        from src.simulator.headless import VirtualClock
+        clock = VirtualClock()
+        t0, real0 = clock.time(), time.time()
+        clock.sleep(600)
+        clock.sleep(-1)  # ignored, like a negative frame-pacing remainder
+        assert time.time() - real0 < 1.0
+        assert clock.skipped == 600
+        assert clock.time() - t0 >= 600
+        assert clock.monotonic() - time.monotonic() == pytest.approx(600, abs=1)
+
+    def test_virtual_clock_installs_and_uninstalls(self, monkeypatch):
+        import sys
+        import time
+        import types
+        from src.simulator.headless import VirtualClock
+        feature = types.ModuleType("src.display._clock_probe")
+        feature.time = time
+        other = types.ModuleType("src.other_probe")
+        other.time = time
+        monkeypatch.setitem(sys.modules, feature.__name__, feature)
+        monkeypatch.setitem(sys.modules, other.__name__, other)
+        clock = VirtualClock()
+        clock.install()
+        assert feature.time is not time and other.time is time
+        start = time.time()
+        feature.time.sleep(30)
+        assert feature.time.time() - start >= 30
+        assert feature.time.localtime is time.localtime
+        clock.uninstall()
+        assert feature.time is time
+
+    def test_virtual_clock_leaves_the_feed_scheduler_on_real_time(self):
+        import time
+        from src.display import _feeds
+        from src.simulator.headless import VirtualClock
+        clock = VirtualClock()
+        clock.install()
+        try:
+            assert _feeds.time is time
+            feed = _feeds.Feed("x", lambda: 1, interval=300)
+            feed.poll()
+            clock.sleep(300)
+            assert not feed.due(time.time())
+        finally:
+            clock.uninstall()
+
+    def test_run_feature_with_virtual_clock_skips_frame_pacing(self):
+        import time
+        from src import main
+        from src.display import plasma
+        from src.simulator.headless import HeadlessRGBMatrix, VirtualClock
+        clock = VirtualClock()
+        m = HeadlessRGBMatrix(rows=64, clock=clock)
+        try:
+            assert main.run_feature("plasma", m, 20)
+        finally:
+            m.close()
+        # Nearly all of the run's 20 s was frame pacing, skipped not slept.
+        frames = m.feature_stats()["plasma"]["frames"]
+        assert clock.skipped > 10
+        assert frames * plasma.FRAME_INTERVAL >= clock.skipped * 0.9
+        assert plasma.time is time
+
+    def test_main_selects_headless_from_env(self, monkeypatch):
+        from src import main
+        from src.simulator.headless import HeadlessRGBMatrix
+        monkeypatch.setenv("LED_SIM_BACKEND", "headless")
+        monkeypatch.delenv("LED_SIM_FRAME_LOG", raising=False)
+        monkeypatch.delenv("LED_SIM_CLOCK", raising=False)
+        matrix = main._create_simulator_matrix()
+        assert isinstance(matrix._matrix, HeadlessRGBMatrix)
+        assert matrix._matrix.clock is None
+
+    def test_main_selects_the_virtual_clock_from_env(self, monkeypatch):
+        from src import main
+        from src.simulator.headless import VirtualClock
+        monkeypatch.setenv("LED_SIM_BACKEND", "headless")
+        monkeypatch.setenv("LED_SIM_CLOCK", "virtual")
+        monkeypatch.delenv("LED_SIM_FRAME_LOG", raising=False)
+        matrix = main._create_simulator_matrix()
+        assert isinstance(matrix._matrix.clock, VirtualClock)
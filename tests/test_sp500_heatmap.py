@@ -0,0 +1,102 @@
+"""Tests for the S&P 500 heatmap quote fetching and rendering.
+
+HTTP is mocked at the shared ``_feeds.http_get`` level.
+"""
+
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.display import sp500_heatmap as sp
+
+
+class _Resp:
+    def __init__(self, symbols):
+        self._symbols = symbols
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"quoteResponse": {"result": [
+            {"symbol": s, "regularMarketChangePercent": 1.5} for s in self._symbols]}}
+
+
+def _symbols_of(url):
+    return parse_qs(urlparse(url).query)["symbols"][0].split(",")
+
+
+@pytest.fixture
+def symbols():
+    return ["S%03d" % i for i in range(230)]
+
+
+def test_fetch_batches_concurrently(monkeypatch, symbols):
+    lock = threading.Lock()
+    active, peak, calls = [0], [0], []
+    barrier = threading.Barrier(2, timeout=2.0)
+
+    def fake_get(url, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            calls.append(_symbols_of(url))
+        try:
+            barrier.wait()      # two requests must be in flight together
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            active[0] -= 1
+        return _Resp(_symbols_of(url))
+
+    monkeypatch.setattr(sp._feeds, "http_get", fake_get)
+    quotes = sp._fetch_batch_quotes(symbols, batch_size=50, workers=4)
+    assert quotes == {s: 1.5 for s in symbols}
+    assert len(calls) == 5 and max(len(c) for c in calls) == 50
+    assert peak[0] >= 2
+
+
+def test_failed_batch_is_retried_on_its_own(monkeypatch, symbols):
+    attempts = {}
+
+    def flaky_get(url, **kwargs):
+        batch = _symbols_of(url)
+        attempts[batch[0]] = attempts.get(batch[0], 0) + 1
+        if batch[0] == "S050" and attempts[batch[0]] == 1:
+            raise sp._feeds.requests.ConnectionError("reset")
+        return _Resp(batch)
+
+    monkeypatch.setattr(sp._feeds, "http_get", flaky_get)
+    quotes = sp._fetch_batch_quotes(symbols, batch_size=50)
+    assert len(quotes) == len(symbols)
+    assert attempts["S050"] == 2
+    assert all(n == 1 for first, n in attempts.items() if first != "S050")
+
+
+def test_a_dead_batch_is_left_out_not_zero_filled(monkeypatch, symbols):
+    def dead_get(url, **kwargs):
+        batch = _symbols_of(url)
+        if batch[0] == "S100":
+            raise sp._feeds.requests.ConnectionError("down")
+        return _Resp(batch)
+
+    monkeypatch.setattr(sp._feeds, "http_get", dead_get)
+    quotes = sp._fetch_batch_quotes(symbols, batch_size=50)
+    assert len(quotes) == len(symbols) - 50
+    assert not any(s in quotes for s in symbols[100:150])
+
+
+def test_partial_results_stream_in_as_batches_land(monkeypatch, symbols):
+    monkeypatch.setattr(sp._feeds, "http_get", lambda url, **k: _Resp(_symbols_of(url)))
+    parts = []
+    sp._fetch_batch_quotes(symbols, batch_size=50, on_batch=parts.append)
+    assert len(parts) == 5
+    assert sum(len(p) for p in parts) == len(symbols)
+
+
+def test_missing_quotes_render_as_no_data_not_flat():
+    img = sp._render_heatmap_grid({"AAPL": 0.0}, ["AAPL", "MSFT"])
+    assert img.getpixel((0, 0)) == sp._change_to_color(0.0)
+    assert img.getpixel((3, 0)) == sp.NO_DATA_COLOR
+    assert sp.NO_DATA_COLOR != sp._change_to_color(0.0)
@@ -0,0 +1,73 @@
+"""Tests for the measured startup mode (src/startup_profile.py)."""
+
+import json
+import sys
+
+import pytest
+
+from src import startup_profile
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    startup_profile.uninstall()
+    startup_profile.reset()
+    yield startup_profile
+    startup_profile.uninstall()
+    startup_profile.reset()
+
+
+def _write_module(directory, name, body=""):
+    (directory / (name + ".py")).write_text(body)
+
+
+class TestStartupProfile:
+    def test_disabled_without_env(self, profiler, monkeypatch):
+        monkeypatch.delenv(startup_profile.ENV_VAR, raising=False)
+        assert profiler.install() is False
+        assert not profiler.enabled()
+        profiler.mark("ignored")
+        assert profiler.summary()["milestones"] == []
+        assert profiler.report() is None
+
+    def test_env_enables(self, profiler, monkeypatch):
+        monkeypatch.setenv(startup_profile.ENV_VAR, "1")
+        assert profiler.install() is True
+        assert profiler.enabled()
+        assert startup_profile._finder in sys.meta_path
+
+    def test_times_imports_with_nesting(self, profiler, tmp_path, monkeypatch):
+        _write_module(tmp_path, "sp_child", "import time\ntime.sleep(0.02)\n")
+        _write_module(tmp_path, "sp_parent", "import sp_child\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        for name in ("sp_parent", "sp_child"):
+            monkeypatch.delitem(sys.modules, name, raising=False)
+
+        profiler.install(force=True)
+        import sp_parent  # noqa: F401
+        imports = {e["module"]: e for e in profiler.summary()["imports"]}
+
+        assert imports["sp_child"]["self_ms"] >= 15
+        parent = imports["sp_parent"]
+        assert parent["cumulative_ms"] >= imports["sp_child"]["cumulative_ms"]
+        assert parent["self_ms"] < 15
+
+    def test_marks_are_relative_to_process_start(self, profiler):
+        profiler.install(force=True)
+        profiler.mark("boot_screen")
+        marks = profiler.summary()["milestones"]
+        assert [m["label"] for m in marks] == ["profiler_installed", "boot_screen"]
+        assert 0 < marks[0]["t_s"] <= marks[1]["t_s"]
+
+    def test_report_writes_json_and_uninstalls(self, profiler, tmp_path):
+        profiler.install(force=True)
+        profiler.mark("matrix_ready")
+        path = tmp_path / "logs" / "startup_profile.json"
+        data = profiler.report(str(path))
+
+        assert not profiler.enabled()
+        assert startup_profile._finder not in sys.meta_path
+        saved = json.loads(path.read_text())
+        assert saved == data
+        assert [m["label"] for m in saved["milestones"]][-2:] == [
+            "matrix_ready", "report"]
@@ -0,0 +1,205 @@
+"""Tests for the video player's decode pipeline (src/display/video_player.py).
+
+Playback is a decoder thread filling a ring of 64x64 frames and a presenter
+pacing them on a monotonic clock; these tests pin the ring's hand-off, the
+source-timestamp pacing and frame decimation against small generated clips.
+Cached videos are transcoded once into pre-scaled ``.v64`` frame files; the
+frame-file tests pin that they reproduce the decoder's frames exactly.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from src.display import video_player  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _deps():
+    assert video_player._ensure_dependencies()
+
+
+class _Recorder:
+    """Matrix stand-in that keeps RGB copies of every frame."""
+
+    def __init__(self):
+        self.frames = []
+
+    def SetImage(self, image, *args, **kwargs):
+        self.frames.append(np.asarray(image.convert("RGB")).copy())
+
+    def Clear(self):
+        pass
+
+
+def _write_clip(path, frames, fps, size=(96, 96)):
+    """Write a clip whose frame ``i`` is a flat grey of level ``i * 8``."""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    assert writer.isOpened()
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i * 8, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+class TestFrameRing:
+    def test_fifo_hand_off(self):
+        ring = video_player._FrameRing(capacity=3)
+        for pts in (0.0, 0.1):
+            slot = ring.reserve()
+            ring.frames[slot] = int(pts * 100)
+            ring.publish(pts)
+        slot, pts = ring.next(timeout=0)
+        assert pts == 0.0 and ring.frames[slot].max() == 0
+        ring.release()
+        slot, pts = ring.next(timeout=0)
+        assert pts == 0.1 and ring.frames[slot].max() == 10
+        ring.release()
+        assert ring.next(timeout=0) is None
+        assert not ring.finished
+        ring.close()
+        assert ring.finished
+
+    def test_full_ring_blocks_producer_until_cancel(self):
+        ring = video_player._FrameRing(capacity=2)
+        for pts in (0.0, 0.1):
+            ring.reserve()
+            ring.publish(pts)
+        result = []
+        producer = threading.Thread(target=lambda: result.append(ring.reserve()))
+        producer.start()
+        producer.join(0.1)
+        assert producer.is_alive(), "reserve() should wait while the ring is full"
+        ring.cancel()
+        producer.join(1.0)
+        assert result == [None]
+
+
+class TestPlayback:
+    def test_plays_every_frame_at_target_rate(self, tmp_path):
+        path = _write_clip(tmp_path / "clip.avi", frames=10, fps=video_player.TARGET_FPS)
+        matrix = _Recorder()
+        start = time.monotonic()
+        played = video_player._play_local_video(matrix, path, "clip")
+        elapsed = time.monotonic() - start
+
+        assert played == 10
+        levels = [int(f.mean().round()) for f in matrix.frames]
+        assert levels == sorted(levels), "frames presented out of order"
+        # 10 frames at 15 FPS are paced over ~0.6 s, not blasted out.
+        assert elapsed >= 9 * video_player.FRAME_INTERVAL * 0.9
+
+    def test_decimates_sources_faster_than_target(self, tmp_path):
+        path = _write_clip(tmp_path / "fast.avi", frames=24,
+                           fps=video_player.TARGET_FPS * 2)
+        played = video_player._play_local_video(_Recorder(), path, "fast")
+        assert played == 12
+
+    def test_drops_late_frames_when_presenter_falls_behind(self, tmp_path, monkeypatch):
+        path = _write_clip(tmp_path / "clip.avi", frames=30, fps=video_player.TARGET_FPS)
+        matrix = _Recorder()
+        show = matrix.SetImage
+
+        def slow_show(image, *args, **kwargs):
+            show(image)
+            time.sleep(video_player.FRAME_INTERVAL * 3)
+
+        matrix.SetImage = slow_show
+        played = video_player._play_local_video(matrix, path, "slow")
+        assert 0 < played < 20
+        # Real-time playback: ~2 s of video takes ~2 s, not 6.
+        assert played * video_player.FRAME_INTERVAL * 3 < 3.0
+
+    def test_stops_on_max_duration_and_releases_decoder(self, tmp_path):
+        path = _write_clip(tmp_path / "long.avi", frames=60, fps=video_player.TARGET_FPS)
+        before = {t.name for t in threading.enumerate()}
+        played = video_player._play_local_video(_Recorder(), path, "long",
+                                                max_duration=0.3)
+        assert 0 < played < 15
+        time.sleep(0.05)
+        assert "video-decoder" not in {t.name for t in threading.enumerate()} - before
+
+    def test_unreadable_file_returns_zero(self, tmp_path):
+        bad = tmp_path / "bad.mp4"
+        bad.write_bytes(b"not a video")
+        assert video_player._play_local_video(_Recorder(), str(bad), "bad") == 0
+
+
+class TestFrameFiles:
+    def test_transcode_matches_decoder_output(self, tmp_path):
+        src = _write_clip(tmp_path / "clip.avi", frames=12, fps=video_player.TARGET_FPS * 2)
+        dst = str(tmp_path / "clip.v64")
+        assert video_player.transcode_video(src, dst)
+
+        decoded = _Recorder()
+        video_player._play_local_video(decoded, src, "mp4")
+        frames = video_player._FrameFile(dst)
+        try:
+            assert len(frames) == 6
+            assert (frames.width, frames.height) == (64, 64)
+            assert list(frames.pts) == pytest.approx(
+                [i * 2 / (video_player.TARGET_FPS * 2) for i in range(6)])
+            out = np.empty((64, 64, 3), dtype=np.uint8)
+            for i, expected in enumerate(decoded.frames):
+                frames.read_into(i, out)
+                assert np.array_equal(out, expected)
+        finally:
+            frames.close()
+
+    def test_repeated_frames_are_stored_once(self, tmp_path):
+        path = tmp_path / "still.avi"
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"),
+                                 video_player.TARGET_FPS, (64, 64))
+        still = np.random.default_rng(0).integers(0, 256, (64, 64, 3), dtype=np.uint8)
+        for _ in range(20):
+            writer.write(still)
+        writer.release()
+        dst = str(tmp_path / "still.v64")
+        assert video_player.transcode_video(str(path), dst)
+        frames = video_player._FrameFile(dst)
+        try:
+            assert len(frames) == 20
+            assert len(set(frames._index["offset"].tolist())) == 1
+        finally:
+            frames.close()
+
+    def test_frame_file_playback_is_paced(self, tmp_path):
+        src = _write_clip(tmp_path / "clip.avi", frames=9, fps=video_player.TARGET_FPS)
+        dst = str(tmp_path / "clip.v64")
+        assert video_player.transcode_video(src, dst)
+        matrix = _Recorder()
+        start = time.monotonic()
+        assert video_player._play_local_video(matrix, dst, "clip") == 9
+        assert time.monotonic() - start >= 8 * video_player.FRAME_INTERVAL * 0.9
+        levels = [int(f.mean().round()) for f in matrix.frames]
+        assert levels == sorted(levels)
+
+    def test_invalid_frame_file_is_rejected(self, tmp_path):
+        bad = tmp_path / "bad.v64"
+        bad.write_bytes(b"LEDV64" + b"\x00" * 40)
+        with pytest.raises(ValueError):
+            video_player._FrameFile(str(bad))
+        assert video_player._play_local_video(_Recorder(), str(bad), "bad") == 0
+
+    def test_cached_mp4_is_replaced_by_frame_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(video_player, "CACHE_DIR", str(tmp_path))
+        url = "https://example.com/clip.mp4"
+        mp4 = video_player._url_to_cache_path(url)
+        writer = cv2.VideoWriter(mp4, cv2.VideoWriter_fourcc(*"mp4v"),
+                                 video_player.TARGET_FPS, (160, 120))
+        rng = np.random.default_rng(1)
+        for _ in range(8):  # noise, so the file clears the 10 KB sanity check
+            writer.write(rng.integers(0, 256, (120, 160, 3), dtype=np.uint8))
+        writer.release()
+        assert video_player._is_cached(url)
+        assert not video_player._is_transcoded(url)
+
+        path = video_player.download_video(url, "clip")
+        assert path == video_player._url_to_frames_path(url)
+        assert video_player._is_transcoded(url) and video_player._is_cached(url)
+        assert not (tmp_path / mp4).exists()
+        assert video_player._cached_video_path(url) == path